@@ -0,0 +1,208 @@
+"""Benchmark of the edge searches of :class:`pyaedt.modeler.Primitives.Primitives`.
+
+The edge sets are generated with a seeded random generator and served by a stand-in for
+the ``oEditor``, so the benchmark runs without AEDT. Each search is timed with NumPy and
+with the pure Python implementation kept for IronPython, and both results are compared.
+
+Usage::
+
+    python benchmark_edge_search.py [--edges 500] [--boundary-edges 1000] [--port-edges 3000]
+
+The circuit port search reports the number of ``GetVertexIDsFromEdge`` and
+``GetVertexPosition`` calls, which dominate the runtime with AEDT. The circuit port and
+bounding box searches also run on revisions without the NumPy implementation, which gives
+the reference numbers of those revisions.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pyaedt.modeler.Primitives as primitives_module
+from pyaedt.modeler.Primitives import Primitives
+
+
+class EdgeSetEditor(object):
+    """Stand-in for the ``oEditor`` serving random edge sets.
+
+    Parameters
+    ----------
+    edges : int, optional
+        Number of edges of the solids. They are split in bodies of ``edges_per_body`` edges.
+        About 5% of the edges have one vertex (circles) and 2% have none.
+    boundary_edges : int, optional
+        Number of edges of the ``"Boundary1"`` sheet. All of them lay on the model bounding box.
+    seed : int, optional
+        Seed of the random generator.
+    digits : int, optional
+        Number of digits of the coordinates. Few digits give many edge couples at the same distance.
+    edges_per_body : int, optional
+        Number of edges of each solid.
+    """
+    def __init__(self, edges=500, boundary_edges=0, seed=0, digits=0, edges_per_body=50):
+        self.oeditor = self
+        self.design_properties = None
+        self.groups = {"Solids": [], "Sheets": ["Port1", "Boundary1"], "Lines": [], "Unclassified": []}
+        self.edges = {}
+        self.edge_vertices = {}
+        self.positions = {}
+        self.calls = 0
+        rnd = random.Random(seed)
+        for start in range(0, edges, edges_per_body):
+            name = "Body{}".format(len(self.groups["Solids"]))
+            self.groups["Solids"].append(name)
+            self.edges[name] = []
+            for _ in range(min(edges_per_body, edges - start)):
+                first = [round(rnd.uniform(0, 10), digits) for _ in range(3)]
+                direction = rnd.choice([[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 0]])
+                length = rnd.choice([0.5, 1.0, 2.0])
+                second = [first[i] + direction[i] * length for i in range(3)]
+                kind = rnd.random()
+                if kind < 0.05:
+                    self._add_edge(name, [first])
+                elif kind < 0.07:
+                    self._add_edge(name, [])
+                else:
+                    self._add_edge(name, [first, second])
+        corners = [[2.0, 2.0, 0.0], [3.0, 2.0, 0.0], [3.0, 3.0, 0.0], [2.0, 3.0, 0.0]]
+        self.edges["Port1"] = []
+        for k in range(4):
+            self._add_edge("Port1", [corners[k], corners[(k + 1) % 4]])
+        self.edges["Boundary1"] = []
+        for _ in range(boundary_edges):
+            first = [0.0, 0.0, round(rnd.uniform(0, 10), 6)]
+            second = [0.0, 10.0, round(rnd.uniform(0, 10), 6)]
+            self._add_edge("Boundary1", [first, second] if rnd.random() > 0.1 else [first])
+
+    def _add_edge(self, name, positions):
+        edge_id = len(self.edge_vertices) + 1
+        vertex_ids = []
+        for position in positions:
+            vertex_id = len(self.positions) + 100001
+            self.positions[vertex_id] = position
+            vertex_ids.append(vertex_id)
+        self.edge_vertices[edge_id] = vertex_ids
+        self.edges[name].append(edge_id)
+
+    def GetObjectsInGroup(self, group):
+        return list(self.groups[group])
+
+    def GetObjectIDByName(self, name):
+        names = self.groups["Solids"] + self.groups["Sheets"] + self.groups["Lines"]
+        return names.index(name) + 1
+
+    def GetEdgeIDsFromObject(self, name):
+        return [str(i) for i in self.edges.get(name, [])]
+
+    def GetEdgeIDsFromFace(self, face_id):
+        return [str(i) for i in self.edges["Port1"]]
+
+    def GetVertexIDsFromEdge(self, edge_id):
+        self.calls += 1
+        return [str(i) for i in self.edge_vertices[int(edge_id)]]
+
+    def GetVertexPosition(self, vertex_id):
+        self.calls += 1
+        return [str(float(i)) for i in self.positions[int(vertex_id)]]
+
+    def GetFaceCenter(self, face_id):
+        return ["2.5", "2.5", "0.0"]
+
+    def GetFaceArea(self, face_id):
+        return 1.0
+
+    def Position(self, *args):
+        return list(args)
+
+    def convert_to_selections(self, objects, return_list=False):
+        return objects if isinstance(objects, list) else [objects]
+
+    def get_model_bounding_box(self):
+        return [0.0, 0.0, 0.0, 10.0, 10.0, 10.0]
+
+
+def edge_set_primitives(editor):
+    """Create the primitives of an :class:`EdgeSetEditor` without calls to create new objects."""
+    primitives = Primitives(editor, editor)
+    primitives.create_object_from_edge = lambda edge: edge
+    primitives.get_bodynames_from_position = lambda position, units=None: []
+    return primitives
+
+
+def _timed(function, *args):
+    start = time.time()
+    result = function(*args)
+    return result, time.time() - start
+
+
+def benchmark_closest_edges(edges, seed=0):
+    """Time both implementations of ``find_closest_edges`` between two bodies of ``edges`` edges."""
+    editor = EdgeSetEditor(2 * edges, seed=seed, edges_per_body=edges)
+    primitives = edge_set_primitives(editor)
+    start_edges = primitives["Body0"].edges
+    stop_edges = primitives["Body1"].edges
+    loop_time = array_time = 0.
+    for direction in range(6):
+        loop_result, elapsed = _timed(primitives._closest_edges_loop, start_edges, stop_edges, direction)
+        loop_time += elapsed
+        array_result, elapsed = _timed(primitives._closest_edges_array, start_edges, stop_edges, direction)
+        array_time += elapsed
+        assert loop_result == array_result, (direction, loop_result, array_result)
+    print("closest edges, %d x %d edges, 6 directions: loop %.3f s, arrays %.3f s" % (
+        edges, edges, loop_time, array_time))
+
+
+def benchmark_bounding_box_edges(edges, seed=0):
+    """Time the colinearity check of ``get_edges_on_bounding_box`` on ``edges`` edges."""
+    editor = EdgeSetEditor(0, boundary_edges=edges, seed=seed)
+    numpy_module = getattr(primitives_module, "np", None)
+    wait_time = primitives_module.aedt_wait_time
+    primitives_module.aedt_wait_time = 0
+    try:
+        primitives = edge_set_primitives(editor)
+        for edge in primitives["Boundary1"].edges:
+            edge.midpoint  # read the vertices before timing the search
+        array_result, array_time = _timed(primitives.get_edges_on_bounding_box, "Boundary1")
+        primitives_module.np = None
+        loop_result, loop_time = _timed(primitives.get_edges_on_bounding_box, "Boundary1")
+    finally:
+        primitives_module.np = numpy_module
+        primitives_module.aedt_wait_time = wait_time
+    assert set(loop_result) == set(array_result)
+    print("edges on bounding box, %d edges: loop %.3f s, arrays %.3f s" % (edges, loop_time, array_time))
+
+
+def benchmark_circuit_port(edges, seed=0):
+    """Time ``get_edges_for_circuit_port`` against solids with ``edges`` edges in total."""
+    numpy_module = getattr(primitives_module, "np", None)
+    wait_time = primitives_module.aedt_wait_time
+    primitives_module.aedt_wait_time = 0
+    results = []
+    try:
+        for numpy_enabled in (True, False):
+            primitives_module.np = numpy_module if numpy_enabled else None
+            editor = EdgeSetEditor(edges, seed=seed)
+            primitives = edge_set_primitives(editor)
+            result, elapsed = _timed(primitives.get_edges_for_circuit_port, 1)
+            results.append((result, elapsed, editor.calls))
+    finally:
+        primitives_module.np = numpy_module
+        primitives_module.aedt_wait_time = wait_time
+    assert results[0][0] == results[1][0]
+    print("circuit port, %d edges: loop %.3f s (%d editor calls), arrays %.3f s (%d editor calls)" % (
+        edges, results[1][1], results[1][2], results[0][1], results[0][2]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--edges", type=int, default=500, help="Edges of each body of the closest edge search.")
+    parser.add_argument("--boundary-edges", type=int, default=1000, help="Edges of the bounding box search.")
+    parser.add_argument("--port-edges", type=int, default=3000, help="Edges of the circuit port search.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    args = parser.parse_args()
+    benchmark_closest_edges(args.edges, args.seed)
+    benchmark_bounding_box_edges(args.boundary_edges, args.seed)
+    benchmark_circuit_port(args.port_edges, args.seed)
@@ -1,6 +1,7 @@
 # standard imports
 import os
 import gc
+import shutil
 
 # Setup paths for module imports
 from _unittest.conftest import local_path, scratch_path, desktop_version, new_thread, non_graphical
@@ -9,6 +10,7 @@ from _unittest.conftest import local_path, scratch_path, desktop_version, new_th
 from pyaedt import Hfss
 from pyaedt.application.Design import DesignCache
 from pyaedt.generic.filesystem import Scratch
+from pyaedt.generic.LoadAEDTFile import load_entire_aedt_file, load_keyword_in_aedt_file, load_lazy_aedt_file
 
 try:
     import pytest
@@ -213,6 +215,53 @@ class TestClass():
         proj_dir5 = self.aedtapp.generate_temp_project_directory(":_34")
         assert not proj_dir5
 
+    def test_22_load_aedt_file(self):
+        project_file = os.path.join(self.local_scratch.path, "load_" + test_project_name + ".aedt")
+        shutil.copyfile(example_project, project_file)
+        project_dict = load_entire_aedt_file(project_file)
+        design = project_dict["AnsoftProject"]["HFSSModel"]
+        assert design["Name"] == "HFSSDesign"
+        assert design["PortFieldDisplay"]["PortFieldDisplay"]["ScaleFactor"] == 5
+        assert "FieldsReporter" in design
+        model_setup = load_keyword_in_aedt_file(project_file, "ModelSetup")
+        assert model_setup["ModelSetup"] == design["ModelSetup"]
+        assert not load_keyword_in_aedt_file(project_file, "NotExistingBlock")
+
+    def test_23_load_lazy_aedt_file(self):
+        project_file = os.path.join(self.local_scratch.path, "lazy_" + test_project_name + ".aedt")
+        shutil.copyfile(example_project, project_file)
+        full_dict = load_entire_aedt_file(project_file)["AnsoftProject"]
+        lazy_dict = load_lazy_aedt_file(project_file)["AnsoftProject"]
+        assert os.path.exists(project_file + ".pyaedt_index")
+        assert list(lazy_dict.keys()) == list(full_dict.keys())
+        assert not lazy_dict.decoded_blocks
+        design = lazy_dict.find_block("HFSSModel", "Name", "HFSSDesign")
+        assert design == full_dict["HFSSModel"]
+        assert lazy_dict.decoded_blocks == ["HFSSModel"]
+        assert not lazy_dict.find_block("HFSSModel", "Name", "NotExistingDesign")
+        assert lazy_dict["Definitions"] == full_dict["Definitions"]
+        cached_dict = load_lazy_aedt_file(project_file)["AnsoftProject"]
+        assert cached_dict._index.from_cache
+        assert cached_dict == full_dict
+
+    def test_24_reload_changed_aedt_file(self):
+        project_file = os.path.join(self.local_scratch.path, "reload_" + test_project_name + ".aedt")
+        shutil.copyfile(example_project, project_file)
+        project_dict = load_lazy_aedt_file(project_file)
+        design = project_dict["AnsoftProject"].find_block("HFSSModel", "Name", "HFSSDesign")
+        definitions = project_dict["AnsoftProject"]["Definitions"]
+        with open(project_file, "rb") as f:
+            data = f.read()
+        with open(project_file, "wb") as f:
+            f.write(data.replace(b"ScaleFactor=5", b"ScaleFactor=6"))
+        os.utime(project_file, (os.path.getatime(project_file), os.path.getmtime(project_file) + 10))
+        new_dict = load_lazy_aedt_file(project_file, previous=project_dict)
+        assert new_dict["AnsoftProject"].refreshed_blocks == ["HFSSModel"]
+        assert new_dict["AnsoftProject"]["Definitions"] is definitions
+        new_design = new_dict["AnsoftProject"].find_block("HFSSModel", "Name", "HFSSDesign")
+        assert new_design is not design
+        assert new_design["PortFieldDisplay"]["PortFieldDisplay"]["ScaleFactor"] == 6
+
     '''
     def test_01_close_project(self):
         self.aedtapp.close_project()
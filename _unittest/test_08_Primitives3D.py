@@ -1,6 +1,8 @@
 # standard imports
+import math
 import os
 import sys
+from collections import OrderedDict
 
 try:
     import pytest
@@ -9,11 +11,16 @@ except:
 
 # Setup paths for module imports
 from conftest import scratch_path, local_path, BasisTest, pyaedt_unittest_check_desktop_error, config
+from benchmark_edge_search import EdgeSetEditor, edge_set_primitives
 
 from pyaedt.generic.filesystem import Scratch
-from pyaedt.modeler.Primitives import Polyline, PolylineSegment
+from pyaedt.modeler.Primitives import Polyline, PolylineSegment, Primitives
+from pyaedt.modeler.Primitives3D import Primitives3D
+from pyaedt.modeler.Model3D import Modeler3D
 from pyaedt.modeler.Object3d import Object3d
 from pyaedt.modeler.GeometryOperators import GeometryOperators
+from pyaedt.modeler.SpatialIndex import BoundingVolumeHierarchy
+from pyaedt.generic.CommandRecorder import CommandRecorder
 from pyaedt.application.Analysis import CoordinateSystemAxis
 
 test = sys.modules.keys()
@@ -21,6 +28,328 @@ test = sys.modules.keys()
 scdoc = "input.scdoc"
 step = "input.stp"
 
+
+class ObjectGroupsEditor(object):
+    """Stand-in for the ``oEditor`` counting the calls to ``GetObjectsInGroup``."""
+    def __init__(self):
+        self.oeditor = self
+        self.design_properties = None
+        self.groups = {"Solids": ["Box1", "Box2"], "Sheets": ["Rectangle1"], "Lines": [], "Unclassified": []}
+        self.faces = {"Box1": [7, 8, 9, 10, 11, 12], "Box2": [17, 18, 19, 20, 21, 22], "Rectangle1": [26]}
+        self.edges = {"Box1": [101, 102], "Box2": [201, 202]}
+        self.edge_vertices = {101: [1001, 1002], 102: [1003, 1004], 201: [2001, 2002], 202: [2003, 2004]}
+        self.positions = {1001: [0, 0, 0], 1002: [2, 0, 0], 1003: [0, 0, 0], 1004: [0, 0, 2],
+                          2001: [0, 1, 0], 2002: [1, 1, 0], 2003: [5, 1, 0], 2004: [5, 1, 3]}
+        self.calls = 0
+
+    def GetObjectsInGroup(self, group):
+        self.calls += 1
+        return list(self.groups[group])
+
+    def GetObjectIDByName(self, name):
+        names = self.groups["Solids"] + self.groups["Sheets"] + self.groups["Lines"]
+        return names.index(name) + 1
+
+    def GetFaceIDs(self, name):
+        self.calls += 1
+        return [str(i) for i in self.faces.get(name, [])]
+
+    def GetFaceCenter(self, face_id):
+        self.calls += 1
+        return ["0.0", "0.0", str(float(face_id))]
+
+    def GetVertexIDsFromFace(self, face_id):
+        self.calls += 1
+        return [str(face_id * 10 + i) for i in range(4)]
+
+    def GetEdgeIDsFromObject(self, name):
+        self.calls += 1
+        return [str(i) for i in self.edges.get(name, [])]
+
+    def GetVertexIDsFromEdge(self, edge_id):
+        self.calls += 1
+        return [str(i) for i in self.edge_vertices[edge_id]]
+
+    def GetVertexPosition(self, vertex_id):
+        self.calls += 1
+        if vertex_id in self.positions:
+            return [str(float(i)) for i in self.positions[vertex_id]]
+        return [str(float(vertex_id)), "0.0", "0.0"]
+
+
+class BoundingBoxEditor(ObjectGroupsEditor):
+    """Stand-in for the ``oEditor`` with a faceted box and a cylinder."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self.modeler = self
+        self._messenger = self
+        self.warnings = []
+        self.groups = {"Solids": ["Box1", "Cylinder1"], "Sheets": [], "Lines": [], "Unclassified": []}
+        self.boxes = {"Box1": [1.0, 2.0, 3.0, 3.0, 5.0, 7.0], "Cylinder1": [-1.0, -1.0, 0.0, 1.0, 1.0, 5.0]}
+        self.model = {"Box1": True, "Cylinder1": True}
+        self.property_changes = 0
+        self.undo = 0
+        self.history = []
+        box = self.boxes["Box1"]
+        corners = [300 + i for i in range(8)]
+        for i in corners:
+            bits = [(i - 300) >> axis & 1 for axis in range(3)]
+            self.positions[i] = [box[axis + 3 * bits[axis]] for axis in range(3)]
+        cube_edges = [(a, b) for a in corners for b in corners
+                      if a < b and bin((a - 300) ^ (b - 300)).count("1") == 1]
+        self.vertices = {"Box1": corners, "Cylinder1": [501, 502]}
+        self.faces = {"Box1": [], "Cylinder1": [51, 52, 53]}
+        self.face_edges = {51: [511], 52: [512], 53: [511, 512]}
+        self.areas = {51: math.pi, 52: math.pi, 53: 10 * math.pi}
+        self.centers = {51: [0.0, 0.0, 0.0], 52: [0.0, 0.0, 5.0]}
+        for n, (a, b) in enumerate(cube_edges):
+            self.edge_vertices[400 + n] = [a, b]
+        self.edge_vertices.update({511: [501], 512: [502]})
+        self.positions.update({501: [1.0, 0.0, 0.0], 502: [1.0, 0.0, 5.0]})
+        for axis in range(3):
+            for side in range(2):
+                face = 30 + 2 * axis + side
+                self.faces["Box1"].append(face)
+                on_face = [i for i in corners if (i - 300) >> axis & 1 == side]
+                self.face_edges[face] = [400 + n for n, edge in enumerate(cube_edges) if set(edge) <= set(on_face)]
+                sides = [box[i + 3] - box[i] for i in range(3) if i != axis]
+                self.areas[face] = sides[0] * sides[1]
+                self.centers[face] = [sum([self.positions[i][j] for i in on_face]) / 4 for j in range(3)]
+
+    def GetVertexIDsFromObject(self, name):
+        self.calls += 1
+        return [str(i) for i in self.vertices[name]]
+
+    def GetEdgeIDsFromFace(self, face_id):
+        self.calls += 1
+        return [str(i) for i in self.face_edges[face_id]]
+
+    def GetFaceCenter(self, face_id):
+        self.calls += 1
+        return [str(i) for i in self.centers[face_id]]
+
+    def GetFaceArea(self, face_id):
+        self.calls += 1
+        return self.areas[face_id]
+
+    def GetProperties(self, tab, name):
+        return ["Model"]
+
+    def GetPropertyValue(self, tab, name, prop):
+        return str(self.model[name]).lower()
+
+    def ChangeProperty(self, args):
+        self.property_changes += 1
+        self.history.append(dict(self.model))
+        for name in args[1][1][1:]:
+            self.model[name] = args[1][2][1][2]
+
+    def convert_to_selections(self, objects, return_list=False):
+        return list(objects)
+
+    def get_model_bounding_box(self):
+        self.calls += 1
+        boxes = [self.boxes[name] for name in self.model if self.model[name]]
+        return [min([box[i] for box in boxes]) for i in range(3)] + [max([box[i] for box in boxes]) for i in range(3, 6)]
+
+    def Undo(self):
+        self.undo += 1
+        self.model = self.history.pop()
+
+    def add_warning_message(self, message):
+        self.warnings.append(message)
+
+
+class BatchEditor(ObjectGroupsEditor):
+    """Stand-in for the ``oEditor`` and the design counting the calls of the box creation."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self.modeler = self
+        self.materials = self
+        self._design_type = "Maxwell 3D"
+        self._aedt_version = "2021.1"
+        self.counts = {"GetModelUnits": 0, "CreateBox": 0, "GetObjectIDByName": 0}
+
+    @property
+    def model_units(self):
+        self.counts["GetModelUnits"] += 1
+        return "mm"
+
+    def checkifmaterialexists(self, name):
+        return True
+
+    def GetObjectIDByName(self, name):
+        self.counts["GetObjectIDByName"] += 1
+        return ObjectGroupsEditor.GetObjectIDByName(self, name)
+
+    def CreateBox(self, parameters, attributes):
+        self.counts["CreateBox"] += 1
+        self.groups["Solids"].append(attributes[2])
+        return attributes[2]
+
+
+class UnitsEditor(BatchEditor):
+    """Stand-in for the design and the ``oEditor`` recording the units of the created boxes."""
+    def __init__(self):
+        BatchEditor.__init__(self)
+        self._odesign = self
+        self.project_name = "Project1"
+        self.design_name = "Design1"
+        self.units = "mm"
+        self.box_units = []
+
+    def SetActiveEditor(self, name):
+        return self
+
+    def GetModelUnits(self):
+        self.counts["GetModelUnits"] += 1
+        return self.units
+
+    def SetModelUnits(self, args):
+        self.units = args[2]
+
+    def CreateBox(self, parameters, attributes):
+        self.box_units.append(parameters[2].lstrip("0123456789.-"))
+        return BatchEditor.CreateBox(self, parameters, attributes)
+
+
+class RecordingDesign(object):
+    """Stand-in for the design and the modeler sending the editor calls to a ``CommandRecorder``."""
+    def __init__(self, recorder):
+        self.odesign = recorder.odesign
+        self.oeditor = recorder.odesign.SetActiveEditor("3D Modeler")
+        self.modeler = self
+        self.materials = self
+        self._messenger = self
+        self.design_properties = None
+        self._design_type = "Maxwell 3D"
+        self._aedt_version = "2021.1"
+
+    @property
+    def model_units(self):
+        return self.oeditor.GetModelUnits()
+
+    def checkifmaterialexists(self, name):
+        return True
+
+    def convert_to_selections(self, objects, return_list=False):
+        if return_list:
+            return list(objects)
+        return ",".join(objects)
+
+    def add_info_message(self, message):
+        pass
+
+    add_warning_message = add_info_message
+
+
+class IndexEditor(ObjectGroupsEditor):
+    """Stand-in for the ``oEditor`` and the design with objects loaded from the project file."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self.modeler = self
+        self.materials = self
+        self.object_materials = {"Box1": "copper", "Box2": "vacuum", "Rectangle1": "copper", "Via1": "copper"}
+        parts = [OrderedDict([("Attributes", OrderedDict([
+            ("Name", name), ("Flags", ""), ("Color", "(132 132 193)"), ("PartCoordinateSystem", 1),
+            ("GroupId", -1), ("MaterialValue", '"{}"'.format(self.object_materials[name].capitalize()))]))])
+            for name in ["Box1", "Box2", "Rectangle1"]]
+        self.design_properties = {"ModelSetup": {"GeometryCore": {"GeometryOperations": {
+            "ToplevelParts": {"GeometryPart": parts}}}}}
+        self.property_reads = 0
+
+    def GetProperties(self, tab, name):
+        return ["Material"]
+
+    def GetPropertyValue(self, tab, name, prop):
+        self.property_reads += 1
+        return '"{}"'.format(self.object_materials[name])
+
+    def checkifmaterialexists(self, name):
+        return True
+
+    def ChangeProperty(self, args):
+        pass
+
+    def convert_to_selections(self, objects, return_list=False):
+        if not isinstance(objects, list):
+            objects = [objects]
+        return list(objects)
+
+
+class PositionEditor(ObjectGroupsEditor):
+    """Stand-in for the ``oEditor`` finding the faces and edges of the bodies at a position."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self.modeler = self
+        self.model_units = "mm"
+        self.searched = []
+
+    def _by_position(self, args, found):
+        self.searched.append(args[2])
+        if args[2] != "Box2":
+            raise Exception("Not found")
+        return found
+
+    def GetFaceByPosition(self, args):
+        return self._by_position(args, 20)
+
+    def GetEdgeByPosition(self, args):
+        return self._by_position(args, 201)
+
+
+class PolylineEditor(ObjectGroupsEditor):
+    """Stand-in for the ``oEditor`` adding the end points of the inserted polyline segments."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self.modeler = self
+        self.model_units = "mm"
+        self.groups = {"Solids": [], "Sheets": [], "Lines": ["Polyline1"], "Unclassified": []}
+        self.vertices = {"Polyline1": [1, 2]}
+        self.positions = {1: [0, 0, 0], 2: [1, 0, 0]}
+
+    def GetVertexIDsFromObject(self, name):
+        self.calls += 1
+        return [str(i) for i in self.vertices[name]]
+
+    def InsertPolylineSegment(self, args):
+        points = args[-1][1:]
+        end = [float(point[2 * axis + 2].replace("mm", "")) for point in points[-1:] for axis in range(3)]
+        vertex_id = max(self.positions) + 1
+        self.positions[vertex_id] = end
+        self.vertices[args[2].split(":")[0]].append(vertex_id)
+
+    def Copy(self, args):
+        self.copied = args[2]
+
+    def Paste(self):
+        name = "Polyline{}".format(len(self.groups["Lines"]) + 1)
+        self.groups["Lines"].append(name)
+        self.vertices[name] = list(self.vertices[self.copied])
+
+
+class ImportEditor(ObjectGroupsEditor):
+    """Stand-in for the design and the ``oEditor`` adding the imported objects to the solids."""
+    def __init__(self):
+        ObjectGroupsEditor.__init__(self)
+        self._odesign = self
+        self._messenger = self
+        self.project_name = "Project1"
+        self.design_name = "Design1"
+
+    def SetActiveEditor(self, name):
+        return self
+
+    def GetModelUnits(self):
+        return "mm"
+
+    def Import(self, args):
+        self.groups["Solids"].append("Imported1")
+
+    def add_info_message(self, message):
+        pass
+
+
 class TestClass(BasisTest):
     def setup_class(self):
         BasisTest.setup_class(self, project_name="test_primitives", design_name="3D_Primitives")
@@ -865,3 +1194,361 @@ class TestClass(BasisTest):
         assert self.aedtapp.modeler.primitives[box2].material_name == "aluminum"
         assert self.aedtapp.modeler.primitives[cyl1].material_name == "aluminum"
         assert self.aedtapp.modeler.primitives[cyl2].material_name == "aluminum"
+
+    def test_53_object_list_cache(self):
+        editor = ObjectGroupsEditor()
+        primitives = Primitives(editor, editor)
+        assert primitives.object_names == ["Box1", "Box2", "Rectangle1"]
+        calls = editor.calls
+        assert primitives.solid_names == ["Box1", "Box2"]
+        assert primitives.object_names == ["Box1", "Box2", "Rectangle1"]
+        assert primitives["Box2"].object_type == "Solid"
+        assert editor.calls == calls
+        editor.groups["Lines"].append("Polyline1")
+        primitives._create_object("Polyline1")
+        assert primitives.line_names == ["Polyline1"]
+        assert editor.calls == calls + 1
+        change_count = primitives.change_count
+        editor.groups["Solids"].remove("Box1")
+        primitives.register_change()
+        assert primitives.change_count == change_count + 1
+        assert primitives.object_names == ["Box2", "Rectangle1", "Polyline1"]
+        assert editor.calls == calls + 4
+
+    def test_54_topology_index(self):
+        editor = ObjectGroupsEditor()
+        primitives = Primitives(editor, editor)
+        assert primitives._find_object_from_face_id(20) == "Box2"
+        assert primitives._find_object_from_face_id("8") == "Box1"
+        calls = editor.calls
+        assert primitives._find_object_from_face_id(11) == "Box1"
+        assert primitives._find_object_from_face_id(26) == "Rectangle1"
+        assert editor.calls == calls
+        assert not primitives._find_object_from_face_id(100)
+        editor.faces["Box2"] = [17, 18, 19, 20, 21, 22, 30]
+        primitives.register_change()
+        assert primitives.object_names == ["Box1", "Box2", "Rectangle1"]
+        calls = editor.calls
+        assert primitives._find_object_from_face_id(9) == "Box1"
+        assert editor.calls == calls
+        primitives.invalidate_geometry("Box2")
+        assert primitives._find_object_from_face_id(30) == "Box2"
+        assert editor.calls == calls + 1
+        assert primitives._find_object_from_face_id(20) == "Box2"
+        assert editor.calls == calls + 1
+        editor.groups["Sheets"].append("Rectangle2")
+        editor.faces["Rectangle2"] = [40]
+        primitives._create_object("Rectangle2")
+        assert "Rectangle2" in primitives._topology_entries["Face"]
+        assert primitives._find_object_from_face_id(40) == "Rectangle2"
+        editor.groups["Solids"].remove("Box1")
+        primitives.cleanup_objects()
+        assert "Box1" not in primitives._topology_entries["Face"]
+        assert 9 not in primitives._topology_ids["Face"]
+        assert not primitives._find_object_from_face_id(9)
+
+    def test_55_geometry_cache(self):
+        editor = ObjectGroupsEditor()
+        primitives = Primitives(editor, editor)
+        box = primitives["Box1"]
+        assert box.top_face.id == 12
+        calls = editor.calls
+        assert box.top_face.id == 12
+        assert box.bottom_face.id == 7
+        assert box.faces[0].vertices[1].position == [71.0, 0.0, 0.0]
+        assert box.faces[0].vertices[1].position == [71.0, 0.0, 0.0]
+        assert editor.calls == calls + 2
+        assert box.geometry_cache_statistics["misses"] == 9
+        assert primitives.geometry_cache_statistics["hits"] == box.geometry_cache_statistics["hits"]
+        editor.faces["Box1"] = [7, 8, 9, 10, 11, 12, 13]
+        primitives.invalidate_geometry("Box2,Box1")
+        assert box.top_face.id == 13
+
+    def test_56_closest_edges_arrays(self):
+        editor = ObjectGroupsEditor()
+        primitives = Primitives(editor, editor)
+        edges, is_parallel = primitives.find_closest_edges("Box1", "Box2", port_direction=1)
+        assert [edge.id for edge in edges] == [101, 201]
+        assert is_parallel
+        edges, is_parallel = primitives.find_closest_edges("Box1", "Box2", port_direction=0)
+        assert [edge.id for edge in edges] == [102, 202]
+        for direction in range(6):
+            edges, is_parallel = primitives.find_closest_edges("Box1", "Box2", port_direction=direction)
+            loop_edges, loop_parallel = primitives._closest_edges_loop(primitives["Box1"].edges,
+                                                                       primitives["Box2"].edges, direction)
+            assert edges == loop_edges
+            assert is_parallel == loop_parallel
+
+    def test_57_spatial_index(self):
+        boxes = {}
+        for i in range(10):
+            for j in range(10):
+                boxes["Box{}_{}".format(i, j)] = [3 * i, 3 * j, 0, 3 * i + 2, 3 * j + 2, 1]
+        bvh = BoundingVolumeHierarchy(boxes)
+        assert len(bvh) == 100
+        assert bvh.bounding_box == [0, 0, 0, 29, 29, 1]
+        assert bvh.query_point([4, 7, 0.5]) == ["Box1_2"]
+        assert not bvh.query_point([2.5, 7, 0.5])
+        assert sorted(bvh.query_point([2.5, 7, 0.5], tol=0.5)) == ["Box0_2", "Box1_2"]
+        assert sorted(bvh.query_box([1, 1, 0, 4, 1.5, 1])) == ["Box0_0", "Box1_0"]
+        assert bvh.nearest([14.4, 14.4, 5]) == ["Box4_4"]
+        assert sorted(bvh.nearest([14.5, 14.5, 0], count=4)) == ["Box4_4", "Box4_5", "Box5_4", "Box5_5"]
+        bvh.remove("Box1_2")
+        assert not bvh.query_point([4, 7, 0.5])
+        bvh.insert("Box1_2", [40, 40, 0, 41, 41, 1])
+        assert bvh.query_point([40.5, 40.5, 0.5]) == ["Box1_2"]
+        assert bvh.bounding_box == [0, 0, 0, 41, 41, 1]
+        for name in list(boxes):
+            bvh.remove(name)
+        assert len(bvh) == 0
+        assert not bvh.nearest([0, 0, 0])
+
+        editor = ObjectGroupsEditor()
+        primitives = Primitives(editor, editor)
+        boxes = {"Box1": [0, 0, 0, 1, 1, 1], "Box2": [2, 0, 0, 3, 1, 1], "Rectangle1": [0, 2, 0, 3, 3, 0]}
+        reads = []
+
+        def compute_bounding_boxes(objects):
+            reads.extend([obj.name for obj in objects])
+            return dict([(obj.name, boxes[obj.name]) for obj in objects])
+        primitives._compute_bounding_boxes = compute_bounding_boxes
+        assert primitives.find_objects_by_position([0.5, 0.5, 0.5]) == ["Box1"]
+        assert primitives.find_closest_objects([2.5, 1.5, 0.5]) == ["Box2"]
+        assert sorted(primitives.find_objects_in_box([0.5, 0.5, 0, 2.5, 2.5, 0])) == ["Box1", "Box2", "Rectangle1"]
+        assert len(reads) == 3
+        assert not primitives._spatial_index_dirty
+        boxes["Box1"] = [10, 10, 10, 11, 11, 11]
+        primitives.invalidate_geometry("Box1")
+        assert primitives._spatial_index_dirty == {"Box1"}
+        assert not primitives.find_objects_by_position([0.5, 0.5, 0.5])
+        assert primitives.find_objects_by_position([10.5, 10.5, 10.5]) == ["Box1"]
+        assert reads[3:] == ["Box1"]
+        editor.groups["Solids"].remove("Box2")
+        primitives.cleanup_objects()
+        assert primitives.find_closest_objects([2.5, 0.5, 0.5]) == ["Rectangle1"]
+        assert len(reads) == 4
+
+    def test_58_bounding_boxes(self):
+        editor = BoundingBoxEditor()
+        editor.odesign = editor
+        primitives = Primitives(editor, editor)
+        boxes = primitives.get_bounding_boxes()
+        assert boxes == {"Box1": [1.0, 2.0, 3.0, 3.0, 5.0, 7.0], "Cylinder1": [-1.0, -1.0, 0.0, 1.0, 1.0, 5.0]}
+        assert editor.property_changes == 0
+        assert editor.model == {"Box1": True, "Cylinder1": True}
+        assert editor.undo == 0
+        calls = editor.calls
+        assert primitives["Cylinder1"].bounding_box == boxes["Cylinder1"]
+        assert primitives["Box1"].bounding_box == boxes["Box1"]
+        assert editor.calls == calls
+        assert editor.property_changes == 0
+        editor.boxes["Cylinder1"] = [-1.0, -1.0, 0.0, 1.0, 1.0, 8.0]
+        editor.positions[502] = [1.0, 0.0, 8.0]
+        editor.centers[52] = [0.0, 0.0, 8.0]
+        editor.areas[53] = 16 * math.pi
+        primitives.invalidate_geometry("Cylinder1")
+        assert primitives["Cylinder1"].bounding_box == editor.boxes["Cylinder1"]
+        assert primitives["Box1"].bounding_box == boxes["Box1"]
+        assert editor.property_changes == 0
+        assert primitives.find_objects_by_position([2, 3, 4]) == ["Box1"]
+
+    def test_59_batch_creation(self):
+        editor = BatchEditor()
+        primitives = Primitives3D(editor, editor)
+        assert primitives.object_names == ["Box1", "Box2", "Rectangle1"]
+        calls = editor.calls
+        ids = editor.counts["GetObjectIDByName"]
+        with primitives.batch():
+            boxes = [primitives.create_box([i, 0, 0], [1, 1, 1], "Via{}".format(i)) for i in range(50)]
+            assert boxes[10].name == "Via10"
+            assert not primitives["Via10"]
+        assert editor.counts == {"GetModelUnits": 1, "CreateBox": 50, "GetObjectIDByName": ids + 50}
+        assert editor.calls == calls
+        assert primitives["Via10"] is boxes[10]
+        assert "Via49" in primitives.object_names
+        assert editor.calls == calls + 3
+        primitives.create_box([0, 0, 0], [1, 1, 1], "Box3")
+        assert editor.counts["GetModelUnits"] == 7
+        assert primitives["Box3"].name == "Box3"
+
+    def test_60_command_recorder(self):
+        recorder = CommandRecorder(model_units="mm")
+        design = RecordingDesign(recorder)
+        primitives = Primitives3D(design, design)
+        with primitives.batch():
+            primitives.create_box([0, 0, 0], [1, 2, 3], "Box1")
+            primitives.create_cylinder("Z", [0, 0, 0], 1, 2, name="Cylinder1")
+        primitives.create_box([5, 0, 0], [1, 2, 3], "Box1")
+        assert primitives.object_names == ["Box1", "Cylinder1", "Box1_1"]
+        assert primitives["Cylinder1"].id == 2
+        assert primitives.delete("Box1")
+        assert primitives.object_names == ["Cylinder1", "Box1_1"]
+        recorder.odesign.GetModule("BoundarySetup").AssignRadiation(["NAME:Rad1", "Objects:=", ["Cylinder1"]])
+        script = recorder.to_script(project_name="Project1", design_name="Design1")
+        lines = script.splitlines()
+        assert lines[3] == 'oProject = oDesktop.SetActiveProject("Project1")'
+        assert lines[5] == 'oEditor_3D_Modeler = oDesign.SetActiveEditor("3D Modeler")'
+        assert lines[6].startswith('oEditor_3D_Modeler.CreateBox(["NAME:BoxParameters", "XPosition:=", "0mm"')
+        assert lines[9] == 'oEditor_3D_Modeler.Delete(["NAME:Selections", "Selections:=", "Box1"])'
+        assert lines[10] == 'oModule_BoundarySetup = oDesign.GetModule("BoundarySetup")'
+        assert lines[11] == 'oModule_BoundarySetup.AssignRadiation(["NAME:Rad1", "Objects:=", ["Cylinder1"]])'
+        assert len(lines) == 12
+        compile(script, "recorded_script", "exec")
+
+    def test_61_object_indexes(self):
+        editor = IndexEditor()
+        primitives = Primitives(editor, editor)
+        assert primitives.get_objects_by_material("Copper") == [1, 3]
+        assert editor.property_reads == 0
+        editor.groups["Lines"].append("Via1")
+        primitives._create_object("Via1")
+        assert primitives.get_objects_by_material("copper") == [1, 3, 4]
+        assert editor.property_reads == 1
+        primitives["Box2"].material_name = "copper"
+        assert primitives.get_objects_by_material("copper") == [1, 2, 3, 4]
+        assert not primitives.get_objects_by_material("vacuum")
+        assert primitives.get_objects_by_prefix("Box") == ["Box1", "Box2"]
+        assert primitives.get_objects_by_prefix("rect", case_sensitive=False) == ["Rectangle1"]
+        assert primitives.get_objects_by_pattern("*1") == ["Box1", "Rectangle1", "Via1"]
+        assert primitives.get_objects_by_pattern("B?x2") == ["Box2"]
+        assert primitives.get_objects_w_string("ox") == ["Box1", "Box2"]
+        box = primitives["Box1"]
+        box.name = "Pad1"
+        editor.groups["Solids"][0] = "Pad1"
+        assert primitives.get_objects_by_prefix("Box") == ["Box2"]
+        assert primitives.get_objects_by_prefix("Pad") == ["Pad1"]
+        assert primitives["Pad1"] is box
+        editor.groups["Lines"].remove("Via1")
+        primitives.cleanup_objects()
+        assert primitives.get_objects_by_material("copper") == [1, 2, 3]
+        assert primitives.get_objects_by_prefix("V") == []
+
+    def test_62_polyline_insert_segments(self):
+        editor = PolylineEditor()
+        primitives = Primitives(editor, editor)
+        polyline = Polyline(primitives, src_object=primitives["Polyline1"])
+        assert len(polyline.vertices) == 2
+        assert polyline.insert_segment([[1, 0, 0], [1, 1, 0]])
+        assert [vertex.position for vertex in polyline.vertices][-1] == [1.0, 1.0, 0.0]
+        assert polyline.insert_segment([[1, 1, 0], [2, 1, 0]])
+        assert len(polyline.vertices) == 4
+
+    def test_63_model_bounding_box_undo(self):
+        editor = BoundingBoxEditor()
+        editor.odesign = editor
+        editor.groups["Solids"].append("Sphere1")
+        editor.boxes["Sphere1"] = [4.0, 4.0, 4.0, 6.0, 6.0, 6.0]
+        editor.model["Sphere1"] = True
+        editor.vertices["Sphere1"] = []
+        editor.faces["Sphere1"] = [61]
+        editor.face_edges[61] = []
+        primitives = Primitives(editor, editor)
+        boxes = primitives.get_bounding_boxes()
+        assert boxes["Sphere1"] == editor.boxes["Sphere1"]
+        assert boxes["Cylinder1"] == editor.boxes["Cylinder1"]
+        assert editor.property_changes == 4
+        assert editor.undo == 0
+        assert editor.model == {"Box1": True, "Cylinder1": True, "Sphere1": True}
+
+    def test_64_import_without_refresh(self):
+        editor = ImportEditor()
+        modeler = Modeler3D.__new__(Modeler3D)
+        modeler._parent = editor
+        modeler._primitives = Primitives(editor, modeler)
+        modeler._primitivesDes = "Project1Design1"
+        assert modeler.primitives.object_names == ["Box1", "Box2", "Rectangle1"]
+        assert modeler.import_3d_cad("part.step", refresh_all_ids=False)
+        assert modeler.primitives.object_names == ["Box1", "Box2", "Imported1", "Rectangle1"]
+
+    def test_65_polyline_clone(self):
+        editor = PolylineEditor()
+        primitives = Primitives(editor, editor)
+        polyline = Polyline(primitives, src_object=primitives["Polyline1"])
+        assert primitives.line_names == ["Polyline1"]
+        clone = polyline.clone()
+        assert clone.name == "Polyline2"
+        assert primitives.line_names == ["Polyline1", "Polyline2"]
+        assert primitives.get_object_from_name("Polyline2") is clone
+        assert primitives.get_objects_by_prefix("Polyline") == ["Polyline1", "Polyline2"]
+        assert "Polyline2" in primitives._topology_entries["Vertex"]
+        assert clone._geometry_cache is not polyline._geometry_cache
+
+    def test_66_parsed_sphere_bounding_box(self):
+        editor = BoundingBoxEditor()
+        editor.groups["Solids"].append("Sphere1")
+        editor.model["Sphere1"] = True
+        part = OrderedDict([
+            ("Attributes", OrderedDict([("Name", "Sphere1"), ("Flags", ""), ("Color", "(143 175 143)"),
+                                        ("GroupId", 0), ("PartCoordinateSystem", 1)])),
+            ("Operations", OrderedDict([("Operation", OrderedDict([
+                ("OperationType", "Sphere"), ("ReferenceCoordSystemID", 1),
+                ("SphereParameters", OrderedDict([("XCenter", "5mm"), ("YCenter", "0.5cm"), ("ZCenter", "5"),
+                                                  ("Radius", "1mm")]))]))]))])
+        editor.design_properties = {"ModelSetup": {"GeometryCore": {
+            "Units": "mm", "GeometryOperations": {"ToplevelParts": {"GeometryPart": [part]}}}}}
+        primitives = Primitives(editor, editor)
+        assert primitives.get_bounding_boxes(["Sphere1"]) == {"Sphere1": [4.0, 4.0, 4.0, 6.0, 6.0, 6.0]}
+        assert editor.property_changes == 0
+
+    def test_67_command_recorder_literals(self):
+        recorder = CommandRecorder(model_units="mm")
+        arguments = ["NAME:Note", "Text:=", 'line 1\nline "2"\r\tC:\\temp\x01', "Values:=",
+                     [float("nan"), float("inf"), float("-inf"), 1.5]]
+        recorder.odesign.GetModule("BoundarySetup").EditNote(arguments)
+        script = recorder.to_script(project_name="Project1", design_name="Design1")
+        calls = []
+
+        class Replay(object):
+            def __getattr__(self, name):
+                return lambda *args: calls.append((name, args)) or self
+
+        sys.modules["ScriptEnv"] = Replay()
+        try:
+            exec(compile(script, "recorded_script", "exec"), {"oDesktop": Replay()})
+        finally:
+            del sys.modules["ScriptEnv"]
+        replayed = calls[-1][1][0]
+        assert calls[-1][0] == "EditNote"
+        assert replayed[:3] == arguments[:3]
+        assert replayed[4][0] != replayed[4][0]
+        assert replayed[4][1:] == arguments[4][1:]
+
+    def test_68_batch_model_units(self):
+        editor = UnitsEditor()
+        modeler = Modeler3D.__new__(Modeler3D)
+        modeler._parent = editor
+        modeler._primitives = Primitives3D(editor, modeler)
+        modeler._primitivesDes = "Project1Design1"
+        with modeler.batch() as primitives:
+            primitives.create_box([0, 0, 0], [1, 1, 1], "Box3")
+            primitives.create_box([2, 0, 0], [1, 1, 1], "Box4")
+            modeler.model_units = "in"
+            primitives.create_box([4, 0, 0], [1, 1, 1], "Box5")
+        assert editor.box_units == ["mm", "mm", "in"]
+        assert "Box5" in primitives.object_names
+
+    def test_69_topology_from_position(self):
+        editor = PositionEditor()
+        primitives = Primitives(editor, editor)
+        boxes = {"Box1": [0, 0, 0, 1, 1, 1], "Box2": [2, 0, 0, 3, 1, 1], "Rectangle1": [0, 2, 0, 3, 3, 0]}
+        primitives._compute_bounding_boxes = lambda objects: dict([(obj.name, boxes[obj.name]) for obj in objects])
+        assert primitives.get_faceid_from_position([3, 0.5, 0.5]) == 20
+        assert editor.searched == ["Box2"]
+        assert primitives.get_edgeid_from_position([3, 1, 0.5]) == 201
+        assert editor.searched == ["Box2", "Box2"]
+        assert primitives.get_faceid_from_position([5, 5, 5]) is None
+        assert editor.searched == ["Box2", "Box2"]
+
+    def test_70_closest_edges_generated_sets(self):
+        editor = EdgeSetEditor(300, seed=3, edges_per_body=150)
+        primitives = edge_set_primitives(editor)
+        start_edges = primitives["Body0"].edges
+        stop_edges = primitives["Body1"].edges
+        assert len(start_edges) == len(stop_edges) == 150
+        for direction in (1, 5):
+            loop_edges, loop_parallel = primitives._closest_edges_loop(start_edges, stop_edges, direction)
+            assert loop_edges
+            edges, is_parallel = primitives._closest_edges_array(start_edges, stop_edges, direction, block_size=1000)
+            assert edges == loop_edges
+            assert is_parallel == loop_parallel
+            assert primitives.find_closest_edges("Body0", "Body1", port_direction=direction) == (edges, is_parallel)
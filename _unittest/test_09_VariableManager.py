@@ -10,7 +10,7 @@ import math
 # Import required modules
 from _unittest.conftest import local_path, scratch_path
 from pyaedt.hfss import Hfss
-from pyaedt.application.Variables import Variable
+from pyaedt.application.Variables import Variable, UnitRegistry, unit_registry
 from pyaedt.generic.filesystem import Scratch
 from pyaedt.generic.general_methods import isclose
 class TestClass:
@@ -324,3 +324,20 @@ class TestClass:
 
     def test_11_delete_variable(self):
         assert self.aedtapp.variable_manager.delete_variable("Var1")
+
+    def test_12_unit_registry(self):
+        assert unit_registry.unit_system("mm") == "Length"
+        assert unit_registry.unit_system("MM") is False
+        assert unit_registry.quantity("ghz") == "Freq"
+        assert unit_registry.decompose("2.5mm") == (2.5, "mm")
+        assert unit_registry.decompose("2.5mm") is unit_registry.decompose("2.5mm")
+        assert unit_registry.decompose("2.5xyz") == ("2.5xyz", "")
+        assert unit_registry.parse_dimension("2mm") == (2.0, "mm", 1e-3)
+        assert unit_registry.rescale([1.0, 2.0], "GHz") == [1e9, 2e9]
+        assert unit_registry.rescale([100.0], "cel") == [373.15]
+        assert unit_registry.rescale([1e9], "GHz", inverse=True) == [1.0]
+        registry = UnitRegistry(units={"Length": {"mm": 1e-3}, "Custom": {"x": 2.0}}, cache_size=1)
+        assert registry.unit_system("x") == "Custom"
+        assert registry.decompose("3x") == (3.0, "x")
+        assert registry.decompose("3mm") == (3.0, "mm")
+        assert len(registry._decomposed) == 1
@@ -11,6 +11,8 @@ import time
 from pyaedt import Circuit
 from pyaedt.generic.filesystem import Scratch
 from pyaedt.generic.TouchstoneParser import read_touchstone
+from pyaedt.modeler.PrimitivesNexxim import NexximComponents
+from pyaedt.modeler.Circuit import ModelerNexxim
 
 test_project_name = "Galileo"
 netlist1 = 'netlist_small.cir'
@@ -19,6 +21,50 @@ touchstone = 'SSN_ssn.s6p'
 touchstone2 = 'Galileo_V3P3S0.ts'
 
 
+class SchematicEditor(object):
+    """Stand-in for the schematic editor that counts the calls to AEDT."""
+    def __init__(self, count):
+        self.oeditor = self
+        self._odesign = self
+        self.elements = ["CompInst@R;{};{}".format(i + 1, i + 1001) for i in range(count)]
+        self.properties = ["R", "Mag"]
+        self.moved = []
+        self.calls = {}
+
+    def _count(self, method):
+        self.calls[method] = self.calls.get(method, 0) + 1
+
+    def GetAllComponents(self):
+        self._count("GetAllComponents")
+        return list(self.elements)
+
+    def GetAllElements(self):
+        self._count("GetAllElements")
+        return list(self.elements)
+
+    def CreateIPort(self, props, attributes):
+        self._count("CreateIPort")
+        element = "IPort@{};{};{}".format(props[2], props[4], props[4] + 1000)
+        self.elements.append(element)
+        return element
+
+    def GetProperties(self, tab, name):
+        self._count("GetProperties")
+        return list(self.properties)
+
+    def GetPropertyValue(self, tab, name, prop):
+        self._count("GetPropertyValue")
+        if prop == "InstanceName":
+            return "R" + name.split(";")[1]
+        return name.split(";")[1] + "ohm"
+
+    def SetActiveEditor(self, name):
+        return self
+
+    def Move(self, selections, parameters):
+        self.moved.extend(selections[2])
+
+
 class TestClass:
     def setup_class(self):
         with Scratch(scratch_path) as self.local_scratch:
@@ -154,6 +200,74 @@ class TestClass:
         assert data.data_imag()
         assert data.data_db()
 
+    def test_16b_read_touchstone_array(self):
+        from pyaedt.generic.TouchstoneParser import read_touchstone_array, TouchstoneData
+        freqs, matrices, port_names, z0 = read_touchstone_array(os.path.join(self.local_scratch.path, touchstone))
+        assert matrices.shape == (len(freqs), 6, 6)
+        assert len(port_names) == 6
+        assert z0 == 50
+        data = TouchstoneData(list(freqs), matrices, port_names)
+        assert len(data.expressions) == 36
+        assert data.data_magnitude("S({0},{0})".format(port_names[0]))[0] == abs(matrices[0, 0, 0])
+        assert data.data_imag("S({},{})".format(port_names[0], port_names[1]))[-1] == matrices[-1, 0, 1].imag
+        expression = "S({},{})".format(port_names[1], port_names[2])
+        assert data.solutions_data_mag.loaded_keys == ["S({0},{0})".format(port_names[0])]
+        assert data.solutions_data_mag[expression][-1] == abs(matrices[-1, 1, 2])
+        assert len(data.solutions_data_mag) == 36
+        data = read_touchstone(os.path.join(self.local_scratch.path, touchstone))
+        assert list(data.solutions_data_mag[data.expressions[1]]) == data.data_magnitude(data.expressions[1])
+
+    def test_16c_stream_touchstone(self):
+        from pyaedt.generic.TouchstoneParser import read_touchstone_array, iter_touchstone_blocks, \
+            touchstone_to_npy, load_touchstone_cache, TouchstoneData, get_worst_curve_from_solution_data
+        touchstone_file = os.path.join(self.local_scratch.path, touchstone)
+        freqs, matrices, port_names, z0 = read_touchstone_array(touchstone_file)
+        blocks = list(iter_touchstone_blocks(touchstone_file, block_size=10))
+        assert len(blocks[0][0]) == 10
+        assert sum([len(block_freqs) for block_freqs, block in blocks]) == len(freqs)
+        assert abs(blocks[-1][1][-1, 2, 3] - matrices[-1, 2, 3]) < 1e-12
+        selection = [port_names[1], port_names[0]]
+        blocks = list(iter_touchstone_blocks(touchstone_file, ports=selection, freq_min=freqs[1], freq_max=freqs[-2]))
+        assert blocks[0][1].shape == (len(freqs) - 2, 2, 2)
+        assert blocks[0][1][0, 0, 1] == matrices[1, 1, 0]
+        cache_file = touchstone_to_npy(touchstone_file, os.path.join(self.local_scratch.path, "ssn.npy"))
+        cache_freqs, cache_data, cache_ports, cache_z0 = load_touchstone_cache(cache_file)
+        assert cache_data.shape == matrices.shape
+        assert cache_ports == port_names
+        data = TouchstoneData(list(cache_freqs), cache_data, cache_ports)
+        assert get_worst_curve_from_solution_data(data)[0] == get_worst_curve_from_solution_data(
+            TouchstoneData(list(freqs), matrices, port_names))[0]
+
+    def test_16d_touchstone_statistics(self):
+        from pyaedt.generic.TouchstoneParser import get_touchstone_statistics, get_worst_curves, \
+            get_fext_xtalk_from_list, get_worst_curve_from_solution_data
+        data = read_touchstone(os.path.join(self.local_scratch.path, touchstone))
+        tx_ports = data.ports[:3]
+        rx_ports = data.ports[3:]
+        statistics = get_touchstone_statistics(data, tx_ports, rx_ports)
+        assert len(statistics[statistics["category"] == "RL"]) == 6
+        assert len(statistics[statistics["category"] == "IL"]) == 3
+        assert len(statistics[statistics["category"] == "NEXT"]) == 3
+        fext = get_fext_xtalk_from_list(tx_ports, rx_ports)
+        assert sorted(statistics[statistics["category"] == "FEXT"]["expression"].tolist()) == sorted(fext)
+        worst = get_worst_curves(statistics, "FEXT")
+        worst_curve, means = get_worst_curve_from_solution_data(data, curve_list=fext)
+        assert worst["expression"][0] == worst_curve
+        assert abs(worst["mean"][0] - means[worst_curve]) < 1e-9
+        assert len(get_worst_curves(statistics, count=None)) == len(statistics)
+
+    def test_16e_stream_touchstone_small_chunks(self):
+        from pyaedt.generic.TouchstoneParser import read_touchstone_array, iter_touchstone_blocks
+        touchstone_file = os.path.join(self.local_scratch.path, touchstone)
+        freqs, matrices, port_names, z0 = read_touchstone_array(touchstone_file)
+        for chunk_size in [50, 333]:
+            blocks = list(iter_touchstone_blocks(touchstone_file, block_size=7, chunk_size=chunk_size))
+            streamed_freqs = [f for block_freqs, block in blocks for f in block_freqs]
+            assert streamed_freqs == list(freqs)
+            streamed = [matrix for block_freqs, block in blocks for matrix in block]
+            assert len(streamed) == len(matrices)
+            assert all((streamed[i] == matrices[i]).all() for i in range(len(matrices)))
+
     def test_17_create_setup(self):
         setup_name = "Dom_LNA"
         LNA_setup = self.aedtapp.create_setup(setup_name)
@@ -164,3 +278,39 @@ class TestClass:
     def test_18_export_touchstone(self):
         assert self.aedtapp.analyse_nominal()
         assert self.aedtapp.export_touchstone("Dom_LNA", "Dom_LNA", os.path.join(self.local_scratch.path, "new.s2p"))
+
+    def test_19_component_indexes(self):
+        editor = SchematicEditor(2000)
+        components = NexximComponents(None, editor)
+        assert components.refresh_all_ids() == 2000
+        assert editor.calls == {"GetAllComponents": 1}
+        assert components.refresh_all_ids() == 2000
+        assert components.get_obj_id("CompInst@R;1500;2500") == 1500
+        assert components.get_obj_id("CompInst@R") == 1
+        assert components["CompInst@R;7;1007"].id == 7
+        assert components.components[42].R == "42ohm"
+        assert components.components[42].R == "42ohm"
+        assert editor.calls["GetProperties"] == 1
+        assert editor.calls["GetPropertyValue"] == 1
+        assert not hasattr(components.components[42], "L")
+        port_id, port_name = components.create_iport("Port1")
+        assert port_name == components.components[port_id].composed_name
+        assert components.get_obj_id("IPort@Port1") == port_id
+        assert "GetAllElements" not in editor.calls
+        assert components.add_id_to_component(port_id) == 2001
+        assert editor.calls["GetAllElements"] == 1
+
+    def test_20_component_instance_names(self):
+        editor = SchematicEditor(10)
+        editor.properties.append("InstanceName")
+        modeler = ModelerNexxim.__new__(ModelerNexxim)
+        modeler._parent = editor
+        modeler.components = NexximComponents(None, editor)
+        assert modeler.components.refresh_all_ids() == 10
+        assert modeler.components.components[4].InstanceName == "R4"
+        assert modeler.move(["R4", "R7"], 1, 2)
+        assert editor.moved == ["CompInst@R;4;1004", "CompInst@R;7;1007"]
+        editor.properties.remove("InstanceName")
+        components = NexximComponents(None, editor)
+        components.refresh_all_ids()
+        assert components.components[4].InstanceName is None
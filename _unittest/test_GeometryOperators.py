@@ -94,6 +94,15 @@ class TestClass:
         assert is_vector_equal(go.v_cross(v2, v1), [0., 0., -1.])
         assert is_vector_equal(go.v_cross(v1, v3), [0., 0., 0.])
 
+    def test_v_cross_array(self):
+        v1 = [[1., 0., 0.], [0., 1., 0.], [1., 0., 0.]]
+        v2 = [[0., 1., 0.], [1., 0., 0.], [2., 0., 0.]]
+        c = go.v_cross_array(v1, v2)
+        assert c.shape == (3, 3)
+        for i in range(3):
+            assert is_vector_equal(c[i], go.v_cross(v1[i], v2[i]))
+        assert is_vector_equal(go.v_cross_array(v1, [0., 0., 1.])[1], [1., 0., 0.])
+
     def test_v_dot(self):
         v1 = [1., 0., 0.]
         v2 = [0., 1., 0.]
@@ -103,6 +112,11 @@ class TestClass:
         assert go.v_dot(v1, v3) == 2.
         assert go.v_dot(v1, v4) == -1.
 
+    def test_v_dot_array(self):
+        v1 = [1., 0., 0.]
+        v2 = [[0., 1., 0.], [2., 0., 0.], [-1., -1., 0.]]
+        assert go.v_dot_array(v1, v2).tolist() == [0., 2., -1.]
+
     def test_v_prod(self):
         v1 = [1, 2, 3]
         c = 0.5
@@ -126,6 +140,22 @@ class TestClass:
         assert abs(go.v_norm(v1) - math.sqrt(3)) < tol
         assert abs(go.v_norm(v2) - 0) < tol
 
+    def test_v_norm_array(self):
+        n = go.v_norm_array([[1, 1, 1], [0, 0, 0]])
+        assert abs(n[0] - math.sqrt(3)) < tol
+        assert abs(n[1] - 0) < tol
+
+    def test_array_invalid_input(self):
+        for function, args in [(go.v_dot_array, ([[1, 0, 0], [0, 1, 0]], [[1, 0, 0]] * 3)),
+                               (go.v_norm_array, ([[1, "a", 0]],)),
+                               (go.q_prod_array, ([[1, 0, 0, 0]] * 2, [[1, 0, 0, 0]] * 3))]:
+            try:
+                function(*args)
+            except ValueError:
+                pass
+            else:
+                assert False, function
+
     def test_normalize_vector(self):
         v1 = [1, 1, 1]
         v2 = [0, 0.1, 0]
@@ -133,6 +163,12 @@ class TestClass:
         assert is_vector_equal(go.normalize_vector(v1), [s3, s3, s3])
         assert is_vector_equal(go.normalize_vector(v2), [0, 1, 0])
 
+    def test_normalize_vector_array(self):
+        s3 = 1/math.sqrt(3)
+        vn = go.normalize_vector_array([[1, 1, 1], [0, 0.1, 0]])
+        assert is_vector_equal(vn[0], [s3, s3, s3])
+        assert is_vector_equal(vn[1], [0, 1, 0])
+
     def test_v_points(self):
         p1 = [1., 0., 1.]
         p2 = [0., 1., 1.]
@@ -214,6 +250,16 @@ class TestClass:
         assert abs(theta - 0.8664730673456006) < tol
         assert abs(psi - 1.9590019609437583) < tol
 
+    def test_axis_to_euler_zxz_array(self):
+        x, y, z = go.pointing_to_axis([1, 0.1, 1], [0.5, 1, 0])
+        phi, theta, psi = go.axis_to_euler_zxz_array([x, [0, 1, 0]], [y, [-1, 0, 0]], [z, [0, 0, 1]])
+        assert abs(phi[0] - (-2.0344439357957027)) < tol
+        assert abs(theta[0] - 0.8664730673456006) < tol
+        assert abs(psi[0] - 1.9590019609437583) < tol
+        assert abs(phi[1] - math.pi / 2) < tol
+        assert theta[1] == 0.
+        assert psi[1] == 0.
+
     def test_axis_to_euler_zyz(self):
         x, y, z = go.pointing_to_axis([1, 0.1, 1], [0.5, 1, 0])
         phi, theta, psi = go.axis_to_euler_zyz(x, y, z)
@@ -292,16 +338,35 @@ class TestClass:
         assert is_vector_equal(q, [0.6916264024663118, -0.1733462058496682, -0.7002829056219277, 0.03475434394060616])
         assert abs(q[0]**2 + q[1]**2 + q[2]**2 + q[3]**2 - 1.) < tol
 
+    def test_q_prod_array(self):
+        q1 = [0.9069661433330367, -0.17345092325178477, -0.3823030778615049, -0.03422789400943274]
+        q2 = [0.9238795325112867, 0.0, -0.3826834323650898, 0.0]
+        q = go.q_prod_array([q1, q2], q2)
+        assert is_vector_equal(q[0], [0.6916264024663118, -0.1733462058496682, -0.7002829056219277, 0.03475434394060616])
+        assert is_vector_equal(q[1], go.q_prod(q2, q2))
+
     def test_q_rotation(self):
         q2 = [0.9238795325112867, 0.0, -0.3826834323650898, 0.0]
         v = go.q_rotation([1, 0, 0], q2)
         assert is_vector_equal(v, [0.7071067811865475, 0.0, 0.7071067811865476])
 
+    def test_q_rotation_array(self):
+        q2 = [0.9238795325112867, 0.0, -0.3826834323650898, 0.0]
+        v = go.q_rotation_array([[1, 0, 0], [0, 0, 1]], q2)
+        assert is_vector_equal(v[0], [0.7071067811865475, 0.0, 0.7071067811865476])
+        assert is_vector_equal(v[1], go.q_rotation([0, 0, 1], q2))
+
     def test_q_rotation_inv(self):
         q2 = [0.9238795325112867, 0.0, -0.3826834323650898, 0.0]
         v = go.q_rotation_inv([1, 0, 0], q2)
         assert is_vector_equal(v, [0.7071067811865475, 0.0, -0.7071067811865476])
 
+    def test_q_rotation_inv_array(self):
+        q2 = [0.9238795325112867, 0.0, -0.3826834323650898, 0.0]
+        v = go.q_rotation_inv_array([[1, 0, 0], [0, 0, 1]], [q2, [1, 0, 0, 0]])
+        assert is_vector_equal(v[0], [0.7071067811865475, 0.0, -0.7071067811865476])
+        assert is_vector_equal(v[1], [0, 0, 1])
+
     def test_get_polygon_centroid(self):
         p1 = [1, 1, 1]
         p2 = [1, -1, 1]
@@ -309,3 +374,12 @@ class TestClass:
         p4 = [-1, -1, -1]
         c = go.get_polygon_centroid([p1, p2, p3, p4])
         assert is_vector_equal(c, [0, 0, 0])
+
+    def test_get_polygon_centroid_array(self):
+        p1 = [1, 1, 1]
+        p2 = [1, -1, 1]
+        p3 = [-1, 1, -1]
+        p4 = [-1, -1, -1]
+        c = go.get_polygon_centroid_array([[p1, p2, p3, p4], [p1, p2, p4, p3]])
+        assert is_vector_equal(c[0], [0, 0, 0])
+        assert is_vector_equal(c[1], go.get_polygon_centroid([p1, p2, p4, p3]))
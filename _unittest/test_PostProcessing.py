@@ -11,6 +11,7 @@ from _unittest.conftest import local_path, scratch_path, config
 # Import required modules
 from pyaedt import Hfss
 from pyaedt.generic.filesystem import Scratch
+from pyaedt.modules.PostProcessor import SolutionData
 import gc
 test_project_name = "coax_setup_solved"
 test_field_name = "Potter_Horn"
@@ -21,6 +22,41 @@ try:
 except ImportError:
     ipython_available = False
 
+
+class SolutionVariation(object):
+    """Stand-in for the variation objects returned by ``GetSolutionDataPerVariation``."""
+    def __init__(self, sweeps, expressions):
+        self.sweeps = sweeps
+        self.expressions = expressions
+        self.calls = []
+
+    def GetSweepNames(self):
+        return [i[0] for i in self.sweeps]
+
+    def GetSweepValues(self, sweep, flag):
+        return dict(self.sweeps)[sweep]
+
+    def GetSweepUnits(self, sweep):
+        return "GHz"
+
+    def GetDataExpressions(self):
+        return self.expressions
+
+    def GetDataUnits(self, expression):
+        return ""
+
+    def GetRealDataValues(self, expression, flag):
+        self.calls.append(("real", expression))
+        return [float(i) for i in range(24)]
+
+    def GetImagDataValues(self, expression, flag):
+        self.calls.append(("imag", expression))
+        return [1.0 for i in range(24)]
+
+    def GetDesignVariableNames(self):
+        return []
+
+
 class TestClass:
     def setup_class(self):
         # set a scratch directory and the environment / test data
@@ -100,6 +136,37 @@ class TestClass:
         assert my_data.data_real(trace_names[0])
         assert my_data.data_magnitude(trace_names[0])
 
+    def test_03b_solution_data_arrays(self):
+        variation = SolutionVariation([("Freq", [1.0, 2.0, 3.0, 4.0]), ("Phi", [0.0, 10.0, 20.0]),
+                                       ("Theta", [0.0, 90.0])], ["S(1,1)", "S(1,2)"])
+        my_data = SolutionData([variation])
+        assert my_data.data_shape == (4, 3, 2)
+        assert my_data.data_real("S(1,2)") == [0.0, 1.0, 2.0, 3.0]
+        my_data.nominal_sweeps["Phi"] = 20.0
+        my_data.nominal_sweeps["Theta"] = 90.0
+        assert my_data.data_real("S(1,2)") == [20.0, 21.0, 22.0, 23.0]
+        my_data.primary_sweep = "Phi"
+        assert my_data.data_real("S(1,2)") == [12.0, 16.0, 20.0]
+        assert my_data.data_imag("S(1,2)") == [1.0, 1.0, 1.0]
+        assert abs(my_data.data_magnitude("S(1,2)")[0] - abs(complex(12.0, 1.0))) < 1e-12
+        my_data.nominal_sweeps["Theta"] = 45.0
+        assert my_data.data_real("S(1,2)") == [0, 0, 0]
+
+    def test_03c_lazy_solution_data(self):
+        variation = SolutionVariation([("Freq", [1.0, 2.0, 3.0, 4.0]), ("Phi", [0.0, 10.0, 20.0]),
+                                       ("Theta", [0.0, 90.0])], ["S(1,1)", "S(1,2)", "S(2,2)"])
+        my_data = SolutionData([variation])
+        assert variation.calls == []
+        assert "S(2,2)" in my_data.solutions_data_real
+        assert my_data.data_real("S(1,2)")
+        assert variation.calls == [("real", "S(1,2)")]
+        assert my_data.data_magnitude("S(1,2)")
+        assert my_data.data_db("S(1,2)")
+        assert my_data.data_imag("S(1,2)")
+        assert variation.calls == [("real", "S(1,2)"), ("imag", "S(1,2)")]
+        assert my_data.solutions_data_mag.loaded_keys == ["S(1,2)"]
+        assert len(my_data.solutions_data_real) == 3
+
 
     def test_04_export_touchstone(self):
         self.aedtapp.export_touchstone( "Setup1","Sweep", os.path.join(self.local_scratch.path, "Setup1_Sweep.S2p"))
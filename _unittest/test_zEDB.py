@@ -5,6 +5,11 @@ import time
 # Import required modules
 from pyaedt import Edb
 from pyaedt.edb_core.components import resistor_value_parser
+from pyaedt.edb_core.connectivity import ConnectivityGraph, DisjointSet
+from pyaedt.edb_core.nets import EdbNets
+from pyaedt.edb_core.layout import EdbLayout
+from pyaedt.edb_core.geometry import LayerGeometry
+from pyaedt.edb_core.snapshot import EdbSnapshot, write_snapshot
 from pyaedt.generic.filesystem import Scratch
 test_project_name = "Galileo_edb"
 bom_example = "bom_example.csv"
@@ -14,6 +19,147 @@ try:
 except ImportError:
     import _unittest_ironpython.conf_unittest as pytest
 
+class SeriesComponent(object):
+    """Stand-in for an EDB component."""
+    def __init__(self, refdes, comp_type, nets, value=None):
+        self.refdes = refdes
+        self.type = comp_type
+        self.numpins = len(nets)
+        self.res_value = value
+
+
+class SeriesComponents(object):
+    """Stand-in for the EDB components with a connectivity graph."""
+    def __init__(self, components):
+        self._cmp = dict([(refdes, SeriesComponent(refdes, comp_type, nets, value))
+                          for refdes, comp_type, nets, value in components])
+        self.components = self._cmp
+        self.connectivity = ConnectivityGraph(
+            [(refdes, str(i + 1), net) for refdes, comp_type, nets, value in components for i, net in enumerate(nets)],
+            components=[el[0] for el in components])
+
+    @property
+    def inductors(self):
+        return dict([(refdes, comp) for refdes, comp in self._cmp.items() if comp.type == "Inductor"])
+
+    def get_through_resistor_list(self, threshold=1):
+        return [refdes for refdes, comp in self._cmp.items()
+                if comp.type == "Resistor" and comp.numpins == 2 and comp.res_value <= threshold]
+
+
+class SeriesLayout(object):
+    """Stand-in for the EDB application."""
+    def __init__(self, components):
+        self.core_components = SeriesComponents(components)
+
+
+class ShapeValue(float):
+    """Stand-in for an EDB value."""
+    def ToDouble(self):
+        return float(self)
+
+
+class ShapePoint(object):
+    """Stand-in for an EDB point, with ``y=None`` for arcs."""
+    def __init__(self, x, y=None):
+        self.X = ShapeValue(x)
+        self.Y = ShapeValue(y or 0)
+        self._arc = y is None
+
+    def IsArc(self):
+        return self._arc
+
+
+class ShapeData(object):
+    """Stand-in for EDB polygon data that counts the calls."""
+    calls = 0
+
+    def __init__(self, points, holes=()):
+        self.Points = [ShapePoint(*point) for point in points]
+        self.Holes = [ShapeData(hole) for hole in holes]
+
+    def GetBBox(self):
+        x = [p.X for p in self.Points if not p.IsArc()]
+        y = [p.Y for p in self.Points if not p.IsArc()]
+        return ShapeItems(ShapeItems(min(x), min(y)), ShapeItems(max(x), max(y)))
+
+
+class ShapeItems(object):
+    def __init__(self, first, second):
+        self.Item1 = self.X = first
+        self.Item2 = self.Y = second
+
+
+class ShapeName(object):
+    def __init__(self, name):
+        self._name = name
+
+    def GetName(self):
+        return self._name
+
+
+class ShapePrimitive(object):
+    """Stand-in for an EDB primitive."""
+    def __init__(self, primitive_type, layer, net, points, holes=(), primitive_id=0):
+        self._type = primitive_type
+        self._layer = ShapeName(layer)
+        self._net = ShapeName(net)
+        self._data = ShapeData(points, holes)
+        self._id = primitive_id
+
+    def ToString(self):
+        return "Ansys.Ansoft.Edb.Cell.Primitive." + self._type
+
+    def GetLayer(self):
+        return self._layer
+
+    def GetNet(self):
+        return self._net
+
+    def GetId(self):
+        return self._id
+
+    def GetPolygonData(self):
+        ShapeData.calls += 1
+        return self._data
+
+
+class ShapeVia(ShapePrimitive):
+    """Stand-in for an EDB padstack instance."""
+    def __init__(self, layers, net, position, primitive_id, is_pin=False):
+        ShapePrimitive.__init__(self, "PadstackInstance", layers[0], net, [], primitive_id=primitive_id)
+        self._layers = layers
+        self.position = position
+        self._is_pin = is_pin
+
+    def GetPadstackDef(self):
+        return self
+
+    def GetName(self):
+        return "VIA_" + "_".join(self._layers)
+
+    def GetData(self):
+        return self
+
+    def GetLayerNames(self):
+        return self._layers
+
+    def IsLayoutPin(self):
+        return self._is_pin
+
+
+class ShapeLayout(object):
+    """Stand-in for the EDB application with layers and pin positions."""
+    def __init__(self, layers):
+        self.core_stackup = self
+        self.stackup_layers = self
+        self.layers = dict([(i, None) for i in layers])
+        self.core_components = self
+
+    def get_pin_position(self, pin):
+        return list(pin.position)
+
+
 class TestClass:
     def setup_class(self):
         with Scratch(scratch_path) as self.local_scratch:
@@ -441,3 +587,200 @@ class TestClass:
         out= edb.export_maxwell(scratch_path)
         assert os.path.exists(out)
         edb.close_edb()
+
+    def test_65_connectivity_graph(self):
+        pins = [("U1", "A1", "VCC"), ("U1", "A2", "GND"), ("R1", "1", "VCC"), ("R1", "2", "VOUT"),
+                ("C1", "1", "VOUT"), ("C1", "2", "GND"), ("U1", "A3", "GND")]
+        graph = ConnectivityGraph(pins, components=["J1", "U1", "R1", "C1"])
+        assert graph.num_pins == 7
+        assert graph.get_components_from_nets("GND") == ["U1", "C1"]
+        assert graph.get_components_from_nets(["VOUT", "VCC"]) == ["U1", "R1", "C1"]
+        assert graph.get_nets_from_component("U1") == ["VCC", "GND"]
+        assert graph.get_nets_from_component("J1") == []
+        assert graph.get_pin_ids_from_net("GND") == [1, 5, 6]
+        assert list(graph.net_pin_offsets) == [0, 2, 5, 7]
+        assert graph.get_net_connections("GND") == [["U1", "A2", "GND"], ["U1", "A3", "GND"], ["C1", "2", "GND"]]
+        assert graph.get_component_net_connection_info("R1") == {"refdes": ["R1", "R1"], "pin_name": ["1", "2"],
+                                                                 "net_name": ["VCC", "VOUT"]}
+        assert [rats["refdes"] for rats in graph.get_rats()] == [[], ["U1"] * 3, ["R1"] * 2, ["C1"] * 2]
+
+    def test_66_connectivity_queries(self):
+        graph = self.edbapp.core_components.connectivity
+        assert len(self.edbapp.pins) == graph.num_pins
+        rats = self.edbapp.core_components.get_rats()
+        assert len(rats) == len(self.edbapp.core_components.components)
+        pins = self.edbapp.core_components.get_pin_from_component("U2A5")
+        assert sorted(self.edbapp.core_components.get_pins_name_from_net(pins, "GND")) == sorted(
+            [pin.GetName() for pin in pins if pin.GetNet().GetName() == "GND"])
+        assert "U2A5" in self.edbapp.core_components.get_components_from_nets("GND")
+
+    def test_67_dcconnected_nets(self):
+        nets = DisjointSet(["A", "B", "C", "D"])
+        assert nets.union("A", "B")
+        assert nets.union("C", "D")
+        assert not nets.union("B", "A")
+        assert nets.union("D", "A")
+        assert nets.find("B") == nets.find("C")
+        assert nets.groups() == [["A", "B", "C", "D"]]
+        layout = SeriesLayout([("U1", "IC", ["V1", "GND", "V5"], None), ("L1", "Inductor", ["V1", "V1_L"], None),
+                               ("L2", "Inductor", ["V5", "V5_L"], None), ("L3", "Inductor", ["V1_F", "V1_S"], None),
+                               ("R1", "Resistor", ["V1_L", "V1_S"], 0.01), ("FB1", "Other", ["V5_L", "V5_F"], None),
+                               ("L4", "Inductor", ["V5", "GND"], None), ("C1", "Capacitor", ["V1_S", "GND"], None),
+                               ("L5", "Inductor", ["V1_F", "V1_L"], None)])
+        edb_nets = EdbNets(layout)
+        assert edb_nets.get_dcconnected_net_list(["GND"]) == [{"V1", "V1_L", "V1_F", "V1_S"}, {"V5", "V5_L"}]
+        groups = edb_nets.get_dcconnected_net_list(["GND"], resistor_threshold=0.1, ferrites=["FB1"])
+        assert groups == [{"V1", "V1_L", "V1_F", "V1_S"}, {"V5", "V5_L", "V5_F"}]
+        df_list, net_group = edb_nets.get_powertree("V1", ["GND"])
+        assert net_group == ["V1", "V1_L", "V1_F", "V1_S"]
+        assert df_list[0] == ["U1", "1", "V1", "IC"]
+        assert ["C1", "1", "V1_S", "Capacitor"] in df_list
+        assert edb_nets.get_powertree("V3", ["GND"]) == ([], ["V3"])
+        powertrees = edb_nets.get_powertrees(["GND"], ferrites=["FB1"])
+        assert sorted(powertrees.keys()) == ["V1_L", "V5"]
+        assert powertrees["V5"][1] == ["V5", "V5_L", "V5_F"]
+        chain = SeriesLayout([("L{}".format(i), "Inductor", ["N{}".format(i), "N{}".format(i + 1)], None)
+                              for i in range(10000)])
+        assert len(EdbNets(chain).get_dcconnected_net_list()[0]) == 10001
+
+    def test_68_layer_geometry(self):
+        layout = EdbLayout(None)
+        layout._prims = [
+            ShapePrimitive("Polygon", "TOP", "GND", [(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (2, 1), (2, 2)]], 1),
+            ShapePrimitive("Path", "TOP", "SIG", [(5, 0), (6, 0), (0.5,), (6, 1), (5, 1)], primitive_id=2),
+            ShapePrimitive("Polygon", "BOTTOM", "GND", [(0, 0), (1, 0), (1, 1)], primitive_id=3),
+            ShapePrimitive("Polygon", "TOP", "VCC", [(7, 7), (8, 7), (8, 8)], primitive_id=4),
+            ShapePrimitive("PadstackInstance", "TOP", "GND", [], primitive_id=5)]
+        ShapeData.calls = 0
+        assert layout.get_polygon_points(layout._prims[1]) == [[5, 0], [6, 0], [0.5], [6, 1], [5, 1]]
+        assert ShapeData.calls == 1
+        geometry = layout.get_layer_geometry("TOP")
+        assert len(geometry) == 3
+        assert geometry.primitive_types == ["Polygon", "Path", "Polygon"]
+        assert list(geometry.primitive_ids) == [1, 2, 4]
+        assert list(geometry.loop_offsets) == [0, 2, 3, 4]
+        assert list(geometry.point_offsets) == [0, 4, 7, 12, 15]
+        assert list(geometry.is_void) == [0, 1, 0, 0]
+        assert list(geometry.is_arc[7:12]) == [0, 0, 1, 0, 0]
+        assert geometry.get_voids(0) == [[[1, 1], [2, 1], [2, 2]]]
+        assert geometry.get_bounding_box(1) == [5, 0, 6, 1]
+        assert ShapeData.calls == 4
+        assert layout.get_polygons_by_layer("TOP", ["VCC"]) == [layout._prims[3]]
+        assert layout.get_polygons_by_layer("TOP") == [layout._prims[0], layout._prims[3]]
+        assert layout.extract_geometry(["TOP", "BOTTOM"])["BOTTOM"].nets == ["GND"]
+        assert ShapeData.calls == 5
+
+    def test_69_layout_spatial_index(self):
+        layout = EdbLayout(ShapeLayout(["TOP", "GND", "BOTTOM"]))
+        layout._prims = [
+            ShapePrimitive("Polygon", "GND", "GND", [(0, 0), (10, 0), (10, 10), (0, 10)], primitive_id=1),
+            ShapePrimitive("Path", "TOP", "SIG", [(1, 1), (4, 1), (4, 1.2), (1, 1.2)], primitive_id=2),
+            ShapePrimitive("Rectangle", "TOP", "GND", [(6, 6), (7, 6), (7, 7), (6, 7)], primitive_id=3),
+            ShapeVia(["TOP", "GND", "BOTTOM"], "SIG", [4, 1.1], 4),
+            ShapeVia(["TOP", "GND", "BOTTOM"], "GND", [8, 8], 5),
+            ShapeVia(["TOP"], "SIG", [1, 1.1], 6, True)]
+        index = layout.get_spatial_index()
+        assert len(index) == 6
+        assert sorted(index.layer_names) == ["BOTTOM", "GND", "TOP"]
+        assert index.get_kind(6) == "Pin"
+        assert sorted(index.query_box([3, 0, 5, 2], "TOP")) == [2, 4]
+        assert index.query_box([3, 0, 5, 2], "BOTTOM") == [4]
+        assert index.query_box([3, 0, 5, 2], net_list=["GND"]) == [1]
+        vias = layout.find_objects_in_box([0, 0, 10, 10], "TOP", kinds=["Via", "Pin"])
+        assert sorted([via.GetId() for via in vias]) == [4, 5, 6]
+        assert layout.find_objects_in_radius([8, 7.5], 1, "TOP") == [layout._prims[4]]
+        assert layout.find_objects_in_radius([8, 7.5], 1.2, "TOP") == [layout._prims[4], layout._prims[2]]
+        assert layout.find_closest_objects([5, 1.15], 2, "TOP") == [layout._prims[1], layout._prims[3]]
+        assert layout.find_closest_objects([5, 1.1], 1, net_list=["GND"], kinds=["Via"]) == [layout._prims[4]]
+        index.remove(4)
+        assert index.query_box([3, 0, 5, 2], "BOTTOM") == []
+        assert layout.get_spatial_index() is index
+
+    def test_70_edb_snapshot(self):
+        top = LayerGeometry("TOP")
+        top.add_primitive("Polygon", "GND", [[[0, 4, 4, 0], [0, 0, 4, 4], [0, 0, 0, 0]],
+                                             [[1, 2, 2], [1, 1, 2], [0, 0, 0]]], primitive_id=1)
+        top.add_primitive("Path", "V1", [[[5, 6, 0.5, 6, 5], [0, 0, 0, 1, 1], [0, 0, 1, 0, 0]]], primitive_id=2)
+        top.finalize()
+        bottom = LayerGeometry("BOTTOM")
+        bottom.finalize()
+        file_path = write_snapshot(
+            os.path.join(self.local_scratch.path, "synthetic.snapshot"),
+            layers=[{"name": "BOTTOM", "layer_type": 0, "material_name": "copper", "thickness_value": "35um",
+                     "lower_elevation": 0., "upper_elevation": 35e-6},
+                    {"name": "DE1", "layer_type": 1, "material_name": "FR4_epoxy", "lower_elevation": 35e-6,
+                     "upper_elevation": 235e-6},
+                    {"name": "TOP", "layer_type": 0, "material_name": "copper", "lower_elevation": 235e-6,
+                     "upper_elevation": 270e-6}],
+            nets=[{"name": "GND", "is_power_ground": True}, {"name": "V1", "is_power_ground": True},
+                  {"name": "V1_L", "is_power_ground": True}, {"name": "SIG", "is_power_ground": False}],
+            components=[{"refdes": "U1", "partname": "CPU", "type": "IC", "numpins": 3},
+                        {"refdes": "L1", "partname": "IND", "type": "Inductor", "numpins": 2},
+                        {"refdes": "R1", "partname": "RES", "type": "Resistor", "numpins": 2, "res_value": 50.}],
+            padstack_definitions=[{"name": "VIA", "via_layers": ["BOTTOM", "DE1", "TOP"]},
+                                  {"name": "SMD", "via_layers": ["TOP"]}],
+            padstack_instances=[{"id": 10, "name": "A1", "refdes": "U1", "net": "V1", "definition": "SMD", "x": 1.,
+                                 "y": 1., "is_pin": True},
+                                {"id": 11, "name": "A2", "refdes": "U1", "net": "GND", "definition": "SMD", "x": 1.,
+                                 "y": 2., "is_pin": True},
+                                {"id": 12, "name": "A3", "refdes": "U1", "net": "SIG", "definition": "SMD", "x": 1.,
+                                 "y": 3., "is_pin": True},
+                                {"id": 13, "name": "1", "refdes": "L1", "net": "V1", "definition": "SMD", "x": 3.,
+                                 "y": 1., "is_pin": True},
+                                {"id": 14, "name": "2", "refdes": "L1", "net": "V1_L", "definition": "SMD", "x": 3.,
+                                 "y": 2., "is_pin": True},
+                                {"id": 15, "name": "1", "refdes": "R1", "net": "SIG", "definition": "SMD", "x": 5.,
+                                 "y": 1., "is_pin": True},
+                                {"id": 16, "name": "2", "refdes": "R1", "net": "GND", "definition": "SMD", "x": 5.,
+                                 "y": 2., "is_pin": True},
+                                {"id": 17, "name": "", "refdes": "", "net": "GND", "definition": "VIA", "x": 8.,
+                                 "y": 8., "is_pin": False}],
+            geometries={"TOP": top, "BOTTOM": bottom}, cell_name="Synthetic")
+        with EdbSnapshot(file_path) as snapshot:
+            assert snapshot.cellname == "Synthetic"
+            assert list(snapshot.core_stackup.stackup_layers.layers.keys()) == ["BOTTOM", "DE1", "TOP"]
+            assert list(snapshot.core_stackup.signal_layers.keys()) == ["BOTTOM", "TOP"]
+            assert snapshot.core_stackup.stackup_layers["TOP"].material_name == "copper"
+            assert snapshot.core_stackup.stackup_limits() == ("TOP", 270e-6, "BOTTOM", 0.)
+            assert sorted(snapshot.core_nets.signal_nets.keys()) == ["SIG"]
+            assert snapshot.core_nets.is_power_gound_net(["SIG", "V1"])
+            assert list(snapshot.core_components.inductors.keys()) == ["L1"]
+            assert snapshot.core_components.components["U1"].nets == ["V1", "GND", "SIG"]
+            assert snapshot.core_components.get_components_from_nets("GND") == ["U1", "R1"]
+            assert snapshot.core_components.get_component_net_connection_info("L1") == {
+                "refdes": ["L1", "L1"], "pin_name": ["1", "2"], "net_name": ["V1", "V1_L"]}
+            assert snapshot.core_components.get_through_resistor_list(100) == ["R1"]
+            pins = snapshot.core_components.get_pin_from_component("U1", netName="GND")
+            assert [pin.name for pin in pins] == ["A2"]
+            assert snapshot.core_components.get_pin_position(pins[0]) == [1., 2.]
+            assert snapshot.core_components.get_nets_from_pin_list(pins) == ["GND"]
+            assert len(snapshot.pins) == 7
+            assert snapshot.core_nets.get_dcconnected_net_list(["GND"]) == [{"V1", "V1_L"}]
+            df_list, net_group = snapshot.core_nets.get_powertree("V1", ["GND"])
+            assert net_group == ["V1", "V1_L"]
+            assert df_list[0] == ["U1", "A1", "V1", "IC"]
+            assert list(snapshot.core_padstack.padstacks.keys()) == ["VIA"]
+            assert len(snapshot.core_padstack.get_pinlist_from_component_and_net("U1", "V1")) == 1
+            polygons = snapshot.core_primitives.get_polygons_by_layer("TOP", ["GND"])
+            assert [polygon.id for polygon in polygons] == [1]
+            assert snapshot.core_primitives.get_polygon_points(polygons[0]) == [[0, 0], [4, 0], [4, 4], [0, 4]]
+            assert snapshot.core_primitives.get_polygon_bounding_box(polygons[0]) == [0, 0, 4, 4]
+            geometry = snapshot.core_primitives.get_layer_geometry("TOP")
+            assert list(geometry.is_arc) == list(top.is_arc)
+            assert geometry.get_voids(0) == [[[1, 1], [2, 1], [2, 2]]]
+            assert len(snapshot.core_primitives.get_layer_geometry("BOTTOM")) == 0
+            assert [el.id for el in snapshot.core_primitives.paths] == [2]
+            vias = snapshot.core_primitives.find_objects_in_box([0, 0, 10, 10], "BOTTOM", kinds=["Via"])
+            assert [via.id for via in vias] == [17]
+            closest = snapshot.core_primitives.find_closest_objects([5.5, 0.5], 2, "TOP")
+            assert [el.id for el in closest] == [2, 15]
+
+    def test_71_export_snapshot(self):
+        file_path = self.edbapp.export_snapshot(os.path.join(self.local_scratch.path, "Galileo.snapshot"))
+        with EdbSnapshot(file_path) as snapshot:
+            assert sorted(snapshot.core_components.components.keys()) == sorted(
+                self.edbapp.core_components.components.keys())
+            assert snapshot.core_components.get_rats() == self.edbapp.core_components.get_rats()
+            assert list(snapshot.core_stackup.stackup_layers.layers.keys()) == list(
+                self.edbapp.core_stackup.stackup_layers.layers.keys())
+            assert len(snapshot.core_primitives.polygons) == len(self.edbapp.core_primitives.polygons)
@@ -22,7 +22,7 @@ from collections import OrderedDict
 from .MessageManager import AEDTMessageManager
 from .Variables import VariableManager, DataSet
 from ..desktop import exception_to_desktop, Desktop, force_close_desktop, release_desktop, get_version_env_variable
-from ..generic.LoadAEDTFile import load_entire_aedt_file
+from ..generic.LoadAEDTFile import load_lazy_aedt_file
 from ..generic.general_methods import aedt_exception_handler
 from ..generic.list_handling import variation_string_to_dict
 from ..modules.Boundary import BoundaryObject
@@ -513,11 +513,19 @@ class Design(object):
 
     @property
     def project_properies(self):
-        """Project properties."""
+        """Project properties.
+
+        The project file is indexed when it changes and each top level block, like a design or
+        ``Definitions``, is decoded the first time it is accessed. After a save, the blocks whose
+        content is unchanged are reused instead of being decoded again.
+        """
         if os.path.exists(self.project_file):
             _mttime = os.path.getmtime(self.project_file)
             if _mttime != self._mttime:
-                self._project_dictionary = load_entire_aedt_file(self.project_file)
+                self._project_dictionary = load_lazy_aedt_file(self.project_file, previous=self._project_dictionary)
+                for block in self._project_dictionary.values():
+                    if block.refreshed_blocks:
+                        self.logger.debug("Project blocks refreshed: {}".format(", ".join(block.refreshed_blocks)))
                 self._mttime = _mttime
         return self._project_dictionary
 
@@ -541,15 +549,10 @@ class Design(object):
         if not design_name:
             design_name = self.design_name
         try:
-            if model_names[self._design_type] in self.project_properies['AnsoftProject']:
-                designs = self.project_properies['AnsoftProject'][model_names[self._design_type]]
-                if type(designs) is list:
-                    for design in designs:
-                        if design["Name"] == design_name:
-                            return design
-                else:
-                    if designs["Name"] == design_name:
-                        return designs
+            project = self.project_properies['AnsoftProject']
+            if model_names[self._design_type] in project:
+                # only the requested design is decoded
+                return project.find_block(model_names[self._design_type], "Name", design_name)
         except:
             return OrderedDict()
 
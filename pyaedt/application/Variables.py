@@ -18,6 +18,10 @@ import re
 import numbers
 import os
 from .. import aedt_exception_handler
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 @aedt_exception_handler
 def dB(x, inverse=True):
@@ -90,15 +94,7 @@ def unit_system(units):
 	``False`` when the units specified are not defined in AEDT units.
     
     """
-    found = False
-    for unit_type, unit_list in AEDT_units.items():
-        for test_unit in unit_list:
-            if test_unit == units:
-                found = True
-                break
-        if found:
-            return unit_type
-    return False
+    return unit_registry.unit_system(units)
 
 #TODO Add additional units
 rad2deg = 180.0 / math.pi
@@ -140,6 +136,31 @@ AEDT_units = {
     'Temperature': {'kel': 1.0, 'cel': (cel2kel,), 'fah': (fah2kel,)},
     'Power': {'fW': 1e-15, 'pW': 1e-12, 'nW': 1e-9, 'uW': 1e-6, 'mW': 1e-3, 'W': 1.0, 'kW': 1e3, 'megW': 1e6, 'gW': 1e9}
 }
+# Units accepted by ``GeometryOperators.parse_dim_arg``, with "m" meaning meter
+dimension_units = {
+    "m": 1.0,
+    "meter": 1.0,
+    "meters": 1.0,
+    "dm": 0.1,
+    "cm": 1e-2,
+    "mm": 1e-3,
+    "um": 1e-6,
+    "nm": 1e-9,
+    "in": 2.54e-2,
+    "mil": 2.54e-5,
+    "uin": 2.54e-8,
+    "ft": 3.048e-1,
+    "s": 1.0,
+    "sec": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "ns": 1e-9,
+    "Hz": 1.0,
+    "kHz": 1e3,
+    "MHz": 1e6,
+    "GHz": 1e9,
+    "THz": 1e12
+}
 SI_units = {
     'AngularSpeed':  'rad_per_sec',
     'Angle': 'deg',
@@ -209,6 +230,235 @@ def _resolve_unit_system(unit_system_1, unit_system_2, operation):
     except KeyError:
         return ""
 
+
+class UnitRegistry(object):
+    """Precompiled lookup of units with memoized parsing of value strings.
+
+    The unit tables are indexed once, so that finding the unit system of a unit is a dictionary
+    lookup instead of a scan of all the tables. Parsed value strings are memoized, up to
+    ``cache_size`` strings for each kind of parsing.
+
+    Parameters
+    ----------
+    units : dict, optional
+        Unit tables in the format of ``AEDT_units``. The default is ``None``, in which
+        case ``AEDT_units`` is used.
+    dimension_units : dict, optional
+        Scaling factors of the units accepted by
+        :func:`pyaedt.modeler.GeometryOperators.GeometryOperators.parse_dim_arg`. The default
+        is ``None``, in which case ``dimension_units`` is used.
+    cache_size : int, optional
+        Maximum number of memoized strings. The default is ``100000``.
+
+    Examples
+    --------
+    >>> from pyaedt.application.Variables import unit_registry
+    >>> unit_registry.unit_system("mm")
+    'Length'
+    >>> unit_registry.decompose("2.5mm")
+    (2.5, 'mm')
+    >>> unit_registry.rescale([1.0, 2.0], "GHz")
+    [1000000000.0, 2000000000.0]
+
+    """
+    dimension_pattern = re.compile(r"(?P<number>[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?)\s*(?P<unit>[a-zA-Z]*)")
+    units_pattern = re.compile('[a-z_A-Z]+$')
+
+    def __init__(self, units=None, dimension_units=None, cache_size=100000):
+        self._units = units
+        self._dimension_units = dimension_units
+        self.cache_size = cache_size
+        self.refresh()
+
+    @property
+    def units(self):
+        """Unit tables."""
+        if self._units is None:
+            return AEDT_units
+        return self._units
+
+    @property
+    def dimension_units(self):
+        """Scaling factors of the dimension units."""
+        if self._dimension_units is None:
+            return dimension_units
+        return self._dimension_units
+
+    def refresh(self):
+        """Rebuild the indexes and clear the memoized strings.
+
+        Call this method after editing the unit tables.
+        """
+        self._unit_systems = {}
+        self._unit_systems_lower = {}
+        for system, table in self.units.items():
+            for unit in table:
+                self._unit_systems.setdefault(unit, system)
+                self._unit_systems_lower.setdefault(unit.lower(), system)
+        self._decomposed = {}
+        self._dimensions = {}
+
+    def unit_system(self, units):
+        """Retrieve the name of the unit system of a unit.
+
+        Parameters
+        ----------
+        units : str
+            Units. For example, ``"mm"``.
+
+        Returns
+        -------
+        str
+            Unit system when successful, ``False`` when the units are not defined.
+        """
+        return self._unit_systems.get(units, False)
+
+    def quantity(self, units):
+        """Retrieve the name of the unit system of a unit ignoring the case.
+
+        Parameters
+        ----------
+        units : str
+            Units. For example, ``"ghz"``.
+
+        Returns
+        -------
+        str
+            Unit system when successful, ``None`` when the units are not defined.
+        """
+        return self._unit_systems_lower.get(units.lower())
+
+    def scale(self, units, system=None):
+        """Retrieve the factor converting a value in the given units to SI units.
+
+        Parameters
+        ----------
+        units : str
+            Units.
+        system : str, optional
+            Unit system. The default is ``None``, in which case the unit system of the units is used.
+
+        Returns
+        -------
+        float or tuple
+            Scaling factor, or a tuple with the conversion function for nonlinear
+            units such as ``"cel"`` or ``"dBV"``.
+        """
+        if system is None:
+            system = self.unit_system(units)
+        return self.units[system][units]
+
+    def rescale(self, values, units, system=None, inverse=False):
+        """Convert values from the given units to SI units.
+
+        Arrays are converted with a single vectorized operation.
+
+        Parameters
+        ----------
+        values : list or numpy.ndarray
+            Values to convert.
+        units : str
+            Units of the values.
+        system : str, optional
+            Unit system. The default is ``None``, in which case the unit system of the units is used.
+        inverse : bool, optional
+            Whether to convert the values from SI units to the given units instead.
+            The default is ``False``.
+
+        Returns
+        -------
+        list or numpy.ndarray
+            Converted values, with the same type as the input values.
+        """
+        scale = self.scale(units, system)
+        if isinstance(scale, tuple):
+            converted = [scale[0](i, inverse=inverse) for i in values]
+            if np is not None and isinstance(values, np.ndarray):
+                return np.array(converted).reshape(values.shape)
+            return converted
+        if inverse:
+            scale = 1. / scale
+        if np is not None and isinstance(values, np.ndarray):
+            return values * scale
+        return [i * scale for i in values]
+
+    def decompose(self, value):
+        """Split a value string into its numeric value and its units.
+
+        Parameters
+        ----------
+        value : str or float
+            Value. For example, ``"2.5mm"``.
+
+        Returns
+        -------
+        tuple
+            ``(value, units)``. The value is returned unchanged when it cannot be parsed.
+            The units are ``""`` when the value has no valid units.
+        """
+        if not isinstance(value, str):
+            return value, ''
+        try:
+            return self._decomposed[value]
+        except KeyError:
+            pass
+        float_value = value
+        units = ''
+        if value != 'nan':
+            try:
+                # Handle a numerical value in string form
+                float_value = float(value)
+            except ValueError:
+                # search for a valid units string at the end of the value
+                loc = self.units_pattern.search(value)
+                if loc:
+                    loc_units = loc.span()[0]
+                    extract_units = value[loc_units:]
+                    if self.unit_system(extract_units):
+                        try:
+                            float_value = float(value[0:loc_units])
+                            units = extract_units
+                        except ValueError:
+                            float_value = value
+        if len(self._decomposed) >= self.cache_size:
+            self._decomposed.clear()
+        self._decomposed[value] = (float_value, units)
+        return float_value, units
+
+    def parse_dimension(self, string):
+        """Parse the first number and the units following it in a dimension string.
+
+        Parameters
+        ----------
+        string : str
+            Dimension string. For example, ``"2mm"``.
+
+        Returns
+        -------
+        tuple
+            ``(value, units, scale)``, where ``scale`` is the factor of the units in
+            ``dimension_units`` or ``None`` if the units are not found there. ``None``
+            is returned when the string contains no number.
+        """
+        try:
+            return self._dimensions[string]
+        except KeyError:
+            pass
+        m = self.dimension_pattern.search(string)
+        if m:
+            unit = m.group("unit")
+            parsed = (float(m.group("number")), unit, self.dimension_units.get(unit))
+        else:
+            parsed = None
+        if len(self._dimensions) >= self.cache_size:
+            self._dimensions.clear()
+        self._dimensions[string] = parsed
+        return parsed
+
+
+unit_registry = UnitRegistry()
+
+
 class CSVDataset:
     """Reads in a CSV file and extracts data, which can be augmented with constant values.
     
@@ -414,30 +664,7 @@ def decompose_variable_value(variable_value):
     -------  
 
     """
-    # set default return values - then check for valid units
-    float_value = variable_value
-    units =''
-
-    if isinstance(variable_value, numbers.Number):
-        float_value = variable_value
-    elif isinstance(variable_value, str) and variable_value != 'nan':
-        try:
-            # Handle a numerical value in string form
-            float_value = float(variable_value)
-        except ValueError:
-            # search for a valid units string at the end of the variable_value
-            loc = re.search('[a-z_A-Z]+$', variable_value)
-            if loc:
-                loc_units = loc.span()[0]
-                extract_units = variable_value[loc_units:]
-                if unit_system(extract_units):
-                    try:
-                        float_value = float(variable_value[0:loc_units])
-                        units = extract_units
-                    except ValueError:
-                        float_value = variable_value
-
-    return float_value, units
+    return unit_registry.decompose(variable_value)
 
 
 class VariableManager(object):
@@ -867,9 +1094,19 @@ class VariableManager(object):
                         ]
                     ]
                 ])
+            self._invalidate_geometry()
 
         return True
 
+    def _invalidate_geometry(self):
+        """Clear the geometry cached by the objects of the modeler, which can depend on the variable."""
+        try:
+            primitives = self._parent.modeler.primitives
+        except AttributeError:
+            return
+        if hasattr(primitives, "invalidate_geometry"):
+            primitives.invalidate_geometry()
+
     @aedt_exception_handler
     def delete_separator(self, separator_name):
         """Delete a separator from either the active project or design.
@@ -995,12 +1232,12 @@ class Variable(object):
     def __init__(self, value, units=None):
 
         if units:
-            if unit_system(units):
+            if unit_registry.unit_system(units):
                 specified_units = units
 
         self._units = None
         self._expression = value
-        self._value, self._units = decompose_variable_value(value)
+        self._value, self._units = unit_registry.decompose(value)
 
         # If units have been specified, check for a conflict and otherwise use the specified unit system
         if units:
@@ -1009,7 +1246,7 @@ class Variable(object):
             self._units = specified_units
 
         if isinstance(self._value, numbers.Number):
-            scale = AEDT_units[self.unit_system][self._units]
+            scale = unit_registry.scale(self._units)
             if isinstance(scale, tuple):
                 self._value = scale[0](self._value, inverse=False)
             else:
@@ -1018,7 +1255,7 @@ class Variable(object):
     @property
     def unit_system(self):
         """Unit system of the expression as a string."""
-        return unit_system(self._units)
+        return unit_registry.unit_system(self._units)
 
     @property
     def units(self):
@@ -1034,7 +1271,7 @@ class Variable(object):
     def numeric_value(self):
         """Numeric part of the expression as a float value."""
         if isinstance(self._value, numbers.Number):
-            scale = AEDT_units[self.unit_system][self._units]
+            scale = unit_registry.scale(self._units)
         if isinstance(scale, tuple):
             return scale[0](self._value, True)
         else:
@@ -396,10 +396,7 @@ class Circuit(FieldAnalysisCircuit, object):
                             parameter_list = ["MOD"]
                             parameter_value = [parameter]
                         self.modeler.components.create_symbol(parameter, pins)
-                        already_exist = False
-                        for el in self.modeler.components.components:
-                            if self.modeler.components.components[el].name == parameter:
-                                already_exist = True
+                        already_exist = self.modeler.components.get_obj_id(parameter) is not None
                         if not already_exist:
                             self.modeler.components.create_new_component_from_symbol(parameter, pins, fields[0][0],
                                                                                      parameter_list, parameter_value)
@@ -423,10 +420,7 @@ class Circuit(FieldAnalysisCircuit, object):
                         parameter_list = ["MOD"]
                         parameter_value = [parameter]
                     self.modeler.components.create_symbol(parameter, pins)
-                    already_exist = False
-                    for el in self.modeler.components.components:
-                        if self.modeler.components.components[el].name == parameter:
-                            already_exist = True
+                    already_exist = self.modeler.components.get_obj_id(parameter) is not None
                     if not already_exist:
                         self.modeler.components.create_new_component_from_symbol(parameter, pins, fields[0][0],
                                                                                  parameter_list, parameter_value)
@@ -39,6 +39,7 @@ from .edb_core import *
 from .generic.general_methods import get_filename_without_extension, generate_unique_name, aedt_exception_handler, \
     env_path, env_value, env_path_student, env_value_student
 from .generic.process import SiwaveSolve
+from .edb_core.snapshot import export_snapshot
 
 class Edb(object):
     """EDB instance interface.
@@ -521,13 +522,7 @@ class Edb(object):
             List of all pins.
         """
         
-        pins=[]
-        for el in self.core_components.components:
-            comp = self.edb.Cell.Hierarchy.Component.FindByName(self.active_layout, el)
-            temp = [p for p in comp.LayoutObjs if
-                    p.GetObjType() == self.edb.Cell.LayoutObjType.PadstackInstance and p.IsLayoutPin()]
-            pins += temp
-        return pins
+        return list(self.core_components.connectivity.pin_objects)
 
 
 
@@ -901,3 +896,34 @@ class Edb(object):
         """
         siwave_s = SiwaveSolve(self.edbpath, aedt_installer_path=self.base_path)
         return siwave_s.export_3d_cad("Maxwell", path_to_output, net_list)
+
+    @aedt_exception_handler
+    def export_snapshot(self, file_path):
+        """Export the stackup, nets, components, padstacks, and primitive geometry to a snapshot.
+
+        The snapshot is an SQLite file that :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+        queries without the EDB DLLs.
+
+        Parameters
+        ----------
+        file_path : str
+            Full path of the snapshot file. An existing file is overwritten.
+
+        Returns
+        -------
+        str
+            Full path of the snapshot file.
+
+        Examples
+        --------
+
+        >>> from pyaedt import Edb
+        >>> from pyaedt.edb_core import EdbSnapshot
+
+        >>> edb = Edb(edbpath="C:\\temp\\myproject.aedb", edbversion="2021.1")
+        >>> edb.export_snapshot("C:\\temp\\myproject.snapshot")
+        >>> snapshot = EdbSnapshot("C:\\temp\\myproject.snapshot")
+        >>> snapshot.core_components.get_components_from_nets("GND")
+
+        """
+        return export_snapshot(self, file_path)
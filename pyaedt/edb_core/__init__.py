@@ -7,4 +7,4 @@ from .padstack import EdbPadstacks
 from .siwave import EdbSiwave
 from .stackup import EdbStackup
 from .layout import EdbLayout
-
+from .snapshot import EdbSnapshot
@@ -6,6 +6,7 @@ import random
 
 import pyaedt.edb_core.EDB_Data
 from .EDB_Data import EDBComponent
+from .connectivity import ConnectivityGraph
 
 from .general import *
 from ..generic.general_methods import get_filename_without_extension
@@ -73,6 +74,7 @@ class Components(object):
         self._others = {}
         self._pins = {}
         self._comps_by_part = {}
+        self._graph = None
         self._init_parts()
 
     @property
@@ -155,6 +157,7 @@ class Components(object):
 
         """
         self._messenger.add_info_message("Refreshing the Components dictionary.")
+        self._graph = None
         try:
             cmplist = self.get_component_list()
             self._cmp = {}
@@ -332,6 +335,39 @@ class Components(object):
         return self._comps_by_part
 
 
+    @property
+    def connectivity(self):
+        """Connectivity graph of the component pins and nets.
+
+        The graph is built in a single pass over the pins of the components the first time
+        that it is accessed.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.connectivity.ConnectivityGraph`
+
+        Examples
+        --------
+
+        >>> from pyaedt import Edb
+        >>> edbapp = Edb("myaedbfolder")
+        >>> edbapp.core_components.connectivity.get_components_from_nets("GND")
+
+        """
+        if self._graph is None:
+            pins = []
+            pin_objects = []
+            for refdes, comp in self.components.items():
+                for pin in comp.pinlist:
+                    pins.append((refdes, pin.GetName(), pin.GetNet().GetName()))
+                    pin_objects.append(pin)
+            self._graph = ConnectivityGraph(pins, pin_objects, list(self.components.keys()))
+        return self._graph
+
+    def refresh_connectivity(self):
+        """Discard the connectivity graph so that it is rebuilt when it is next accessed."""
+        self._graph = None
+
     @aedt_exception_handler
     def get_component_list(self):
         """Retrieve a list of the component's EDB objects.
@@ -385,15 +421,9 @@ class Components(object):
             List of components that belong to the signal nets.
 
         """
-        cmp_list = []
         if type(netlist) is str:
             netlist = [netlist]
-        components = list(self.components.keys())
-        for refdes in components:
-            cmpnets = self._cmp[refdes].nets
-            if set(cmpnets).intersection(set(netlist)):
-                cmp_list.append(refdes)
-        return cmp_list
+        return self.connectivity.get_components_from_nets(netlist)
 
 
     @aedt_exception_handler
@@ -594,6 +624,8 @@ class Components(object):
                     self.parent._messenger.add_info_message("Component {} deleted".format(comp))
         for el in deleted_comps:
             del self.components[el]
+        if deleted_comps:
+            self._graph = None
         return deleted_comps
 
     @aedt_exception_handler
@@ -623,6 +655,7 @@ class Components(object):
             edb_cmp.Delete()
             if edb_cmp in list(self.components.keys()):
                 del self.components[edb_cmp]
+            self._graph = None
             return True
         return False
 
@@ -928,9 +961,14 @@ class Components(object):
         
         """
         pinlist = []
+        graph = self.connectivity
         for pin in pin_list:
-            if pin.GetNet().GetName() == net_name:
-                pinlist.append(pin.GetName())
+            pin_id = graph.pin_id(pin)
+            if pin_id is None:
+                if pin.GetNet().GetName() == net_name:
+                    pinlist.append(pin.GetName())
+            elif graph.net_names[graph.pin_net[pin_id]] == net_name:
+                pinlist.append(graph.pin_names[pin_id])
         return pinlist
 
     @aedt_exception_handler
@@ -956,8 +994,13 @@ class Components(object):
         
         """
         netlist = []
+        graph = self._graph
         for pin in PinList:
-            netlist.append(pin.GetNet().GetName())
+            pin_id = graph.pin_id(pin) if graph else None
+            if pin_id is None:
+                netlist.append(pin.GetNet().GetName())
+            else:
+                netlist.append(graph.net_names[graph.pin_net[pin_id]])
         return list(set(netlist))
 
     @aedt_exception_handler
@@ -982,6 +1025,8 @@ class Components(object):
         >>> edbapp.core_components.get_component_net_connection_info(refdes)
         
         """
+        if self.connectivity.component_id(refdes) is not None:
+            return self.connectivity.get_component_net_connection_info(refdes)
         component_pins = self.get_pin_from_component(refdes)
         data = {"refdes":[], "pin_name":[], "net_name":[]}
         for pin_obj in component_pins:
@@ -1010,11 +1055,7 @@ class Components(object):
         >>> edbapp.core_components.get_rats()
         
         """
-        df_list = []
-        for refdes in self.components.keys():
-            df = self.get_component_net_connection_info(refdes)
-            df_list.append(df)
-        return df_list
+        return self.connectivity.get_rats()
 
     def get_through_resistor_list(self, threshold=1):
         """Retrieve through resistors.
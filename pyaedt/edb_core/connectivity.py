@@ -0,0 +1,393 @@
+"""
+This module contains the ``ConnectivityGraph`` and ``DisjointSet`` classes.
+
+The graph stores the pins of the EDB components with integer IDs and answers the queries on
+components, pins, and nets without calls to the EDB API. The adjacency from nets and components
+to pins is stored in compressed sparse row (CSR) arrays: the pins of the net with ID ``i`` are
+``net_pin_indices[net_pin_offsets[i]:net_pin_offsets[i + 1]]``.
+"""
+from __future__ import absolute_import
+from array import array
+
+
+def _csr(keys, count):
+    """Group the positions of a list of keys in the range ``[0, count)`` in CSR arrays."""
+    offsets = array("i", [0]) * (count + 1)
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(count):
+        offsets[i + 1] += offsets[i]
+    indices = array("i", [0]) * len(keys)
+    fill = array("i", offsets[:count])
+    for position, key in enumerate(keys):
+        indices[fill[key]] = position
+        fill[key] += 1
+    return offsets, indices
+
+
+class ConnectivityGraph(object):
+    """Connectivity of the component pins and nets of a layout.
+
+    Components, nets, and pins are numbered in the order in which they are first found.
+
+    Parameters
+    ----------
+    pins : list
+        List of ``(refdes, pin_name, net_name)`` tuples, one per pin.
+    pin_objects : list, optional
+        List of the EDB pin objects in the same order as ``pins``. The default is ``None``.
+    components : list, optional
+        List of the reference designators of all the components, including the components
+        without pins. The default is ``None``, in which case the components are taken
+        from ``pins``.
+
+    Examples
+    --------
+    >>> from pyaedt.edb_core.connectivity import ConnectivityGraph
+    >>> graph = ConnectivityGraph([("R1", "1", "VCC"), ("R1", "2", "OUT"), ("U1", "A1", "OUT")])
+    >>> graph.get_components_from_nets("OUT")
+    ['R1', 'U1']
+    >>> graph.get_nets_from_component("R1")
+    ['VCC', 'OUT']
+
+    """
+
+    def __init__(self, pins, pin_objects=None, components=None):
+        self.component_names = []
+        self.net_names = []
+        self.pin_names = []
+        self.pin_objects = list(pin_objects) if pin_objects is not None else []
+        self._component_ids = {}
+        self._net_ids = {}
+        for refdes in components or []:
+            self._add_component(refdes)
+        pin_component = []
+        pin_net = []
+        for refdes, pin_name, net_name in pins:
+            pin_component.append(self._add_component(refdes))
+            pin_net.append(self._add_net(net_name))
+            self.pin_names.append(pin_name)
+        self.pin_component = array("i", pin_component)
+        self.pin_net = array("i", pin_net)
+        self.net_pin_offsets, self.net_pin_indices = _csr(pin_net, len(self.net_names))
+        self.component_pin_offsets, self.component_pin_indices = _csr(pin_component, len(self.component_names))
+        component_nets = []
+        self.component_net_offsets = array("i", [0])
+        for component_id in range(len(self.component_names)):
+            seen = set()
+            for pin_id in self._pins_of_component(component_id):
+                net_id = pin_net[pin_id]
+                if net_id not in seen:
+                    seen.add(net_id)
+                    component_nets.append(net_id)
+            self.component_net_offsets.append(len(component_nets))
+        self.component_net_indices = array("i", component_nets)
+        self._pin_ids = dict([(id(pin), i) for i, pin in enumerate(self.pin_objects)])
+
+    def _add_component(self, refdes):
+        if refdes not in self._component_ids:
+            self._component_ids[refdes] = len(self.component_names)
+            self.component_names.append(refdes)
+        return self._component_ids[refdes]
+
+    def _add_net(self, net_name):
+        if net_name not in self._net_ids:
+            self._net_ids[net_name] = len(self.net_names)
+            self.net_names.append(net_name)
+        return self._net_ids[net_name]
+
+    def _pins_of_component(self, component_id):
+        return self.component_pin_indices[self.component_pin_offsets[component_id]:
+                                          self.component_pin_offsets[component_id + 1]]
+
+    def _pins_of_net(self, net_id):
+        return self.net_pin_indices[self.net_pin_offsets[net_id]:self.net_pin_offsets[net_id + 1]]
+
+    @property
+    def num_pins(self):
+        """Number of pins."""
+        return len(self.pin_names)
+
+    def component_id(self, refdes):
+        """Retrieve the ID of a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        int
+            ID of the component, or ``None`` when the component is not found.
+        """
+        return self._component_ids.get(refdes)
+
+    def net_id(self, net_name):
+        """Retrieve the ID of a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        int
+            ID of the net, or ``None`` when the net has no component pins.
+        """
+        return self._net_ids.get(net_name)
+
+    def pin_id(self, pin):
+        """Retrieve the ID of an EDB pin object.
+
+        Parameters
+        ----------
+        pin :
+            EDB pin object from :attr:`pin_objects`.
+
+        Returns
+        -------
+        int
+            ID of the pin, or ``None`` when the object is not in the graph.
+        """
+        return self._pin_ids.get(id(pin))
+
+    def get_pin_ids_from_net(self, net_name):
+        """Retrieve the IDs of the pins of a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        list
+            List of pin IDs.
+        """
+        net_id = self._net_ids.get(net_name)
+        if net_id is None:
+            return []
+        return list(self._pins_of_net(net_id))
+
+    def get_pin_ids_from_component(self, refdes):
+        """Retrieve the IDs of the pins of a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        list
+            List of pin IDs.
+        """
+        component_id = self._component_ids.get(refdes)
+        if component_id is None:
+            return []
+        return list(self._pins_of_component(component_id))
+
+    def get_nets_from_component(self, refdes):
+        """Retrieve the nets connected to a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        list
+            List of net names in the order of the pins.
+        """
+        component_id = self._component_ids.get(refdes)
+        if component_id is None:
+            return []
+        return [self.net_names[i] for i in self.component_net_indices[self.component_net_offsets[component_id]:
+                                                                      self.component_net_offsets[component_id + 1]]]
+
+    def get_components_from_nets(self, netlist):
+        """Retrieve the components connected to one or more nets.
+
+        Parameters
+        ----------
+        netlist : str or list
+            One or more net names.
+
+        Returns
+        -------
+        list
+            List of reference designators in the order of the components.
+        """
+        if isinstance(netlist, str):
+            netlist = [netlist]
+        component_ids = set()
+        for net_name in netlist:
+            for pin_id in self.get_pin_ids_from_net(net_name):
+                component_ids.add(self.pin_component[pin_id])
+        return [self.component_names[i] for i in sorted(component_ids)]
+
+    def get_net_connections(self, net_name):
+        """Retrieve the component pins of a net.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        list
+            List of ``[refdes, pin_name, net_name]`` lists in the order of the components.
+        """
+        return [[self.component_names[self.pin_component[i]], self.pin_names[i], net_name]
+                for i in sorted(self.get_pin_ids_from_net(net_name), key=lambda i: (self.pin_component[i], i))]
+
+    def get_component_net_connection_info(self, refdes):
+        """Retrieve the net connection information of a component.
+
+        Parameters
+        ----------
+        refdes : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"refdes"``, ``"pin_name"``, and ``"net_name"`` lists.
+        """
+        data = {"refdes": [], "pin_name": [], "net_name": []}
+        for pin_id in self.get_pin_ids_from_component(refdes):
+            if self.pin_names[pin_id] is None:
+                continue
+            data["refdes"].append(refdes)
+            data["pin_name"].append(self.pin_names[pin_id])
+            data["net_name"].append(self.net_names[self.pin_net[pin_id]])
+        return data
+
+    def get_rats(self):
+        """Retrieve the net connection information of all the components.
+
+        Returns
+        -------
+        list
+            List of dictionaries with the ``"refdes"``, ``"pin_name"``, and ``"net_name"`` lists.
+        """
+        return [self.get_component_net_connection_info(refdes) for refdes in self.component_names]
+
+
+class DisjointSet(object):
+    """Disjoint sets of hashable items, merged by union by rank with path halving.
+
+    Each :func:`union` and :func:`find` takes nearly constant amortized time.
+
+    Parameters
+    ----------
+    items : list, optional
+        Items to add as single sets. The default is ``None``.
+
+    Examples
+    --------
+    >>> from pyaedt.edb_core.connectivity import DisjointSet
+    >>> nets = DisjointSet()
+    >>> nets.union("V1P0", "V1P0_L")
+    True
+    >>> nets.union("V1P0_L", "V1P0_S0")
+    True
+    >>> nets.groups()
+    [['V1P0', 'V1P0_L', 'V1P0_S0']]
+
+    """
+
+    def __init__(self, items=None):
+        self._parent = {}
+        self._rank = {}
+        self._order = []
+        for item in items or []:
+            self.add(item)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, item):
+        return item in self._parent
+
+    def add(self, item):
+        """Add an item as a single set if it is not already in a set.
+
+        Parameters
+        ----------
+        item :
+            Item to add.
+        """
+        if item not in self._parent:
+            self._parent[item] = item
+            self._rank[item] = 0
+            self._order.append(item)
+
+    def find(self, item):
+        """Retrieve the representative item of the set of an item.
+
+        Parameters
+        ----------
+        item :
+            Item in a set.
+
+        Returns
+        -------
+        type
+            Representative item of the set.
+        """
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first, second):
+        """Merge the sets of two items, adding the items if needed.
+
+        Parameters
+        ----------
+        first :
+            First item.
+        second :
+            Second item.
+
+        Returns
+        -------
+        bool
+            ``True`` when the sets were merged, ``False`` when the items were already in the same set.
+        """
+        self.add(first)
+        self.add(second)
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return False
+        if self._rank[first] < self._rank[second]:
+            first, second = second, first
+        self._parent[second] = first
+        if self._rank[first] == self._rank[second]:
+            self._rank[first] += 1
+        return True
+
+    def groups(self):
+        """Retrieve all the sets.
+
+        Returns
+        -------
+        list
+            List of sets as lists of items, in the order in which the items were added.
+        """
+        groups = {}
+        ordered = []
+        for item in self._order:
+            root = self.find(item)
+            if root not in groups:
+                groups[root] = []
+                ordered.append(groups[root])
+            groups[root].append(item)
+        return ordered
@@ -0,0 +1,489 @@
+"""
+This module contains the ``LayerGeometry`` and ``LayoutIndex`` classes.
+
+``LayerGeometry`` stores the outlines and voids of the primitives of a layer in flat coordinate
+arrays so that geometry queries and exports do not need calls to the EDB API. ``LayoutIndex``
+indexes the bounding boxes of the primitives and padstack instances of each layer.
+"""
+from __future__ import absolute_import
+from array import array
+from ..modeler.SpatialIndex import BoundingVolumeHierarchy
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _as_array(values, typecode):
+    if np is not None:
+        return np.array(values, dtype={"d": np.float64, "i": np.int32, "b": np.int8}[typecode])
+    return array(typecode, values)
+
+
+class LayerGeometry(object):
+    """Geometry of the primitives of a layer.
+
+    Each primitive has one or more loops of points. The first loop of a primitive is its outline
+    and the next loops are its voids. The loops of the primitive with index ``i`` are the loops
+    ``loop_offsets[i]`` to ``loop_offsets[i + 1] - 1``, and the points of the loop with index ``j``
+    are the points ``point_offsets[j]`` to ``point_offsets[j + 1] - 1``.
+
+    An arc is stored as a marker point between its two end points. The ``x`` value of the marker
+    is the height of the arc, and its ``y`` value is ``0``.
+
+    The arrays are NumPy arrays when NumPy is installed and ``array.array`` objects otherwise.
+
+    Parameters
+    ----------
+    layer_name : str
+        Name of the layer.
+
+    Examples
+    --------
+    >>> from pyaedt.edb_core.geometry import LayerGeometry
+    >>> geometry = LayerGeometry("TOP")
+    >>> geometry.add_primitive("Rectangle", "GND", [[[0, 0, 1, 1], [0, 1, 1, 0], [0, 0, 0, 0]]],
+    ...                        bounding_box=[0, 0, 1, 1])
+    >>> geometry.finalize()
+    >>> geometry.get_points(0)
+    [[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0]]
+
+    """
+
+    def __init__(self, layer_name):
+        self.layer_name = layer_name
+        self.primitives = []
+        self.primitive_types = []
+        self.nets = []
+        self._ids = []
+        self._boxes = []
+        self._loop_offsets = [0]
+        self._point_offsets = [0]
+        self._voids = []
+        self._x = []
+        self._y = []
+        self._arcs = []
+        self.primitive_ids = None
+        self.bounding_boxes = None
+        self.loop_offsets = None
+        self.point_offsets = None
+        self.is_void = None
+        self.x = None
+        self.y = None
+        self.is_arc = None
+
+    def __len__(self):
+        return len(self.primitive_types)
+
+    @classmethod
+    def from_arrays(cls, layer_name, primitive_types, nets, arrays, primitives=None):
+        """Create the geometry of a layer from the arrays of a finalized geometry.
+
+        Parameters
+        ----------
+        layer_name : str
+            Name of the layer.
+        primitive_types : list
+            List of the primitive types.
+        nets : list
+            List of the net names of the primitives.
+        arrays : dict
+            Dictionary with the names of the array attributes, such as ``"x"`` and
+            ``"loop_offsets"``, as keys and the arrays as values.
+        primitives : list, optional
+            List of the objects of the primitives. The default is ``None``.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.geometry.LayerGeometry`
+        """
+        geometry = cls(layer_name)
+        geometry.primitive_types = list(primitive_types)
+        geometry.nets = list(nets)
+        if primitives is None:
+            primitives = [None] * len(geometry.primitive_types)
+        geometry.primitives = list(primitives)
+        for name, values in arrays.items():
+            setattr(geometry, name, values)
+        if np is not None:
+            geometry.bounding_boxes = geometry.bounding_boxes.reshape((-1, 4))
+        geometry._ids = geometry._boxes = geometry._loop_offsets = geometry._point_offsets = None
+        geometry._voids = geometry._x = geometry._y = geometry._arcs = None
+        return geometry
+
+    def add_primitive(self, primitive_type, net_name, loops, primitive=None, primitive_id=-1, bounding_box=None):
+        """Add a primitive.
+
+        Parameters
+        ----------
+        primitive_type : str
+            Type of the primitive, such as ``"Polygon"`` or ``"Path"``.
+        net_name : str
+            Name of the net.
+        loops : list
+            List of loops, the outline first and then the voids. Each loop is a list of the
+            ``x`` values, the ``y`` values, and the arc markers of its points.
+        primitive : optional
+            EDB primitive object. The default is ``None``.
+        primitive_id : int, optional
+            ID of the primitive. The default is ``-1``.
+        bounding_box : list, optional
+            Bounding box of the primitive in the format ``[xmin, ymin, xmax, ymax]``.
+            The default is ``None``, in which case it is computed from the points.
+        """
+        self.primitives.append(primitive)
+        self.primitive_types.append(primitive_type)
+        self.nets.append(net_name)
+        self._ids.append(primitive_id)
+        for i, (x, y, arcs) in enumerate(loops):
+            self._x.extend(x)
+            self._y.extend(y)
+            self._arcs.extend(arcs)
+            self._point_offsets.append(len(self._x))
+            self._voids.append(1 if i else 0)
+        self._loop_offsets.append(len(self._voids))
+        if bounding_box is None:
+            x, y, arcs = loops[0] if loops else ([], [], [])
+            points = [(x[i], y[i]) for i in range(len(x)) if not arcs[i]]
+            if points:
+                bounding_box = [min([p[0] for p in points]), min([p[1] for p in points]),
+                                max([p[0] for p in points]), max([p[1] for p in points])]
+            else:
+                bounding_box = [0., 0., 0., 0.]
+        self._boxes.extend([float(i) for i in bounding_box])
+
+    def finalize(self):
+        """Convert the added primitives to arrays.
+
+        Primitives cannot be added after this call.
+        """
+        self.primitive_ids = _as_array(self._ids, "i")
+        self.bounding_boxes = _as_array(self._boxes, "d")
+        if np is not None:
+            self.bounding_boxes = self.bounding_boxes.reshape((-1, 4))
+        self.loop_offsets = _as_array(self._loop_offsets, "i")
+        self.point_offsets = _as_array(self._point_offsets, "i")
+        self.is_void = _as_array(self._voids, "b")
+        self.x = _as_array(self._x, "d")
+        self.y = _as_array(self._y, "d")
+        self.is_arc = _as_array(self._arcs, "b")
+        self._ids = self._boxes = self._loop_offsets = self._point_offsets = None
+        self._voids = self._x = self._y = self._arcs = None
+
+    def get_bounding_box(self, index):
+        """Retrieve the bounding box of a primitive.
+
+        Parameters
+        ----------
+        index : int
+            Index of the primitive.
+
+        Returns
+        -------
+        list
+            List of bounding box coordinates in the format ``[xmin, ymin, xmax, ymax]``.
+        """
+        if np is not None:
+            return self.bounding_boxes[index].tolist()
+        return self.bounding_boxes[4 * index:4 * index + 4].tolist()
+
+    def get_points(self, index, loop=0):
+        """Retrieve the points of a loop of a primitive.
+
+        Parameters
+        ----------
+        index : int
+            Index of the primitive.
+        loop : int, optional
+            Index of the loop in the primitive. The default is ``0``, which is the outline.
+            Voids start at ``1``.
+
+        Returns
+        -------
+        list
+            List of points in the format ``[x, y]``, or ``[height]`` for arcs.
+        """
+        loop_index = int(self.loop_offsets[index]) + loop
+        if loop_index >= self.loop_offsets[index + 1]:
+            return []
+        start = int(self.point_offsets[loop_index])
+        end = int(self.point_offsets[loop_index + 1])
+        x = self.x[start:end].tolist()
+        y = self.y[start:end].tolist()
+        arcs = self.is_arc[start:end].tolist()
+        return [[x[i]] if arcs[i] else [x[i], y[i]] for i in range(end - start)]
+
+    def get_voids(self, index):
+        """Retrieve the voids of a primitive.
+
+        Parameters
+        ----------
+        index : int
+            Index of the primitive.
+
+        Returns
+        -------
+        list
+            List of voids, each as returned by :func:`get_points`.
+        """
+        count = int(self.loop_offsets[index + 1] - self.loop_offsets[index])
+        return [self.get_points(index, loop) for loop in range(1, count)]
+
+    def get_primitive_indices(self, primitive_type=None, net_list=None):
+        """Retrieve the indices of the primitives of a type or on some nets.
+
+        Parameters
+        ----------
+        primitive_type : str, optional
+            Type of the primitives. The default is ``None``, in which case all types are used.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are used.
+
+        Returns
+        -------
+        list
+            List of primitive indices.
+        """
+        if isinstance(net_list, str):
+            net_list = [net_list]
+        nets = set(net_list) if net_list else None
+        return [i for i in range(len(self.primitive_types))
+                if (primitive_type is None or self.primitive_types[i] == primitive_type) and
+                (nets is None or self.nets[i] in nets)]
+
+
+def _box_distance(box, point):
+    dx = max(box[0] - point[0], 0., point[0] - box[3])
+    dy = max(box[1] - point[1], 0., point[1] - box[4])
+    return (dx * dx + dy * dy) ** 0.5
+
+
+class LayoutIndex(object):
+    """Two-dimensional index of the layout objects of each layer.
+
+    Each layer has a :class:`pyaedt.modeler.SpatialIndex.BoundingVolumeHierarchy` of the
+    bounding boxes of its objects. An object that spans several layers, such as a via, is
+    indexed on each of them. Added objects are inserted in the hierarchies at the next query,
+    and a hierarchy is rebuilt when more objects are added than it holds.
+
+    Examples
+    --------
+    >>> from pyaedt.edb_core.geometry import LayoutIndex
+    >>> index = LayoutIndex()
+    >>> index.add(1, "TOP", [0, 0, 1, 1], "GND", "Polygon")
+    >>> index.add(2, ["TOP", "BOTTOM"], [3, 0, 3, 0], "VCC", "Via")
+    >>> index.query_box([0.5, -1, 4, 1], net_list=["VCC"])
+    [2]
+    >>> index.nearest([2, 0], count=2)
+    [1, 2]
+
+    """
+
+    def __init__(self):
+        self._layers = {}
+        self._pending = {}
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def layer_names(self):
+        """Names of the indexed layers."""
+        return list(self._layers.keys())
+
+    def add(self, key, layer_names, box, net_name="", kind="", item=None):
+        """Add an object or replace an indexed object.
+
+        Parameters
+        ----------
+        key :
+            Key of the object, such as its EDB ID.
+        layer_names : str or list
+            One or more layers of the object.
+        box : list
+            Bounding box of the object in the format ``[xmin, ymin, xmax, ymax]``.
+        net_name : str, optional
+            Name of the net. The default is ``""``.
+        kind : str, optional
+            Kind of the object, such as ``"Polygon"`` or ``"Via"``. The default is ``""``.
+        item : optional
+            Object returned by :func:`get_item`. The default is ``None``.
+        """
+        if key in self._entries:
+            self.remove(key)
+        if isinstance(layer_names, str):
+            layer_names = [layer_names]
+        box = [float(box[0]), float(box[1]), 0., float(box[2]), float(box[3]), 0.]
+        self._entries[key] = (list(layer_names), box, net_name, kind, item)
+        for layer_name in layer_names:
+            if layer_name not in self._layers:
+                self._layers[layer_name] = BoundingVolumeHierarchy()
+                self._pending[layer_name] = {}
+            self._pending[layer_name][key] = box
+
+    def remove(self, key):
+        """Remove an object.
+
+        Parameters
+        ----------
+        key :
+            Key of the object.
+
+        Returns
+        -------
+        bool
+            ``True`` when the object was indexed, ``False`` otherwise.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        for layer_name in entry[0]:
+            if self._pending[layer_name].pop(key, None) is None:
+                self._layers[layer_name].remove(key)
+        return True
+
+    def _update(self):
+        for layer_name, pending in self._pending.items():
+            if not pending:
+                continue
+            layer = self._layers[layer_name]
+            if len(pending) > len(layer):
+                for key in layer.keys():
+                    pending[key] = self._entries[key][1]
+                layer.build(pending)
+            else:
+                for key, box in pending.items():
+                    layer.insert(key, box)
+            self._pending[layer_name] = {}
+
+    def get_item(self, key):
+        """Retrieve the object added with a key."""
+        return self._entries[key][4]
+
+    def get_net(self, key):
+        """Retrieve the net name of an object."""
+        return self._entries[key][2]
+
+    def get_kind(self, key):
+        """Retrieve the kind of an object."""
+        return self._entries[key][3]
+
+    def get_bounding_box(self, key):
+        """Retrieve the bounding box of an object in the format ``[xmin, ymin, xmax, ymax]``."""
+        box = self._entries[key][1]
+        return [box[0], box[1], box[3], box[4]]
+
+    def _accept(self, net_list, kinds):
+        if isinstance(net_list, str):
+            net_list = [net_list]
+        if isinstance(kinds, str):
+            kinds = [kinds]
+        nets = set(net_list) if net_list else None
+        kinds = set(kinds) if kinds else None
+        if nets is None and kinds is None:
+            return None
+        entries = self._entries
+        return lambda key: ((nets is None or entries[key][2] in nets) and
+                            (kinds is None or entries[key][3] in kinds))
+
+    def _search(self, layer_name, search):
+        self._update()
+        if layer_name is None:
+            layers = list(self._layers.values())
+        elif layer_name in self._layers:
+            layers = [self._layers[layer_name]]
+        else:
+            layers = []
+        found = []
+        seen = set()
+        for layer in layers:
+            for key in search(layer):
+                if key not in seen:
+                    seen.add(key)
+                    found.append(key)
+        return found
+
+    def query_box(self, box, layer_name=None, net_list=None, kinds=None, tol=0.):
+        """Retrieve the objects whose bounding boxes overlap a box.
+
+        Parameters
+        ----------
+        box : list
+            Box in the format ``[xmin, ymin, xmax, ymax]``.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects. The default is ``None``, in which case all kinds
+            are accepted.
+        tol : float, optional
+            Distance by which the boxes are enlarged. The default is ``0.``.
+
+        Returns
+        -------
+        list
+            List of keys.
+        """
+        query = [box[0], box[1], 0., box[2], box[3], 0.]
+        accept = self._accept(net_list, kinds)
+        found = self._search(layer_name, lambda layer: layer.query_box(query, tol))
+        return [key for key in found if accept is None or accept(key)]
+
+    def query_radius(self, point, radius, layer_name=None, net_list=None, kinds=None):
+        """Retrieve the objects whose bounding boxes are within a distance from a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        radius : float
+            Distance from the point.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects. The default is ``None``, in which case all kinds
+            are accepted.
+
+        Returns
+        -------
+        list
+            List of keys sorted by increasing distance.
+        """
+        found = self.query_box([point[0], point[1], point[0], point[1]], layer_name, net_list, kinds, radius)
+        distances = [(_box_distance(self._entries[key][1], point), i) for i, key in enumerate(found)]
+        return [found[i] for distance, i in sorted(distances) if distance <= radius]
+
+    def nearest(self, point, count=1, layer_name=None, net_list=None, kinds=None):
+        """Retrieve the objects whose bounding boxes are the closest to a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        count : int, optional
+            Number of objects to return. The default is ``1``.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects. The default is ``None``, in which case all kinds
+            are accepted.
+
+        Returns
+        -------
+        list
+            List of up to ``count`` keys sorted by increasing distance.
+        """
+        query = [point[0], point[1], 0.]
+        accept = self._accept(net_list, kinds)
+        found = self._search(layer_name, lambda layer: layer.nearest(query, count, accept))
+        distances = [(_box_distance(self._entries[key][1], point), i) for i, key in enumerate(found)]
+        return [found[i] for distance, i in sorted(distances)[:count]]
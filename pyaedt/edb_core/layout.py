@@ -4,6 +4,7 @@ This module contains these classes: ``EdbLayout`` and ''Shape``.
 
 import warnings
 from .general import *
+from .geometry import LayerGeometry, LayoutIndex
 from ..generic.general_methods import get_filename_without_extension, generate_unique_name
 import math
 try:
@@ -22,6 +23,8 @@ class EdbLayout(object):
         self._prims = []
         self._parent = parent
         self._primitives_by_layer = {}
+        self._geometry_by_layer = {}
+        self._spatial_index = None
         #self.update_primitives()
 
     @property
@@ -80,10 +83,16 @@ class EdbLayout(object):
         """
         layoutInstance = self._active_layout.GetLayoutInstance()
         layoutObjectInstances = layoutInstance.GetAllLayoutObjInstances()
+        self._prims = []
+        self._geometry_by_layer = {}
+        self._spatial_index = None
         for el in layoutObjectInstances.Items:
             self._prims.append(el.GetLayoutObj())
-        for lay in self.layers:
-            self._primitives_by_layer[lay] = self.get_polygons_by_layer(lay)
+        self._primitives_by_layer = dict([(lay, []) for lay in self.layers])
+        for el in self.polygons:
+            layer_name = el.GetLayer().GetName()
+            if layer_name in self._primitives_by_layer:
+                self._primitives_by_layer[layer_name].append(el)
         print("Primitives Updated")
         return True
 
@@ -206,15 +215,223 @@ class EdbLayout(object):
         list
             List of primitive objects.
         """
+        if layer_name in self._geometry_by_layer:
+            geometry = self._geometry_by_layer[layer_name]
+            return [geometry.primitives[i] for i in geometry.get_primitive_indices("Polygon", net_list)]
         objinst=[]
         for el in self.polygons:
             if el.GetLayer().GetName() == layer_name:
-                if net_list and el.GetNet().GetName() in net_list:
-                    objinst.append(el)
-                else:
+                if not net_list or el.GetNet().GetName() in net_list:
                     objinst.append(el)
         return objinst
 
+    def _get_polygon_data_points(self, polygon_data):
+        x = []
+        y = []
+        arcs = []
+        for point in list(polygon_data.Points):
+            x.append(point.X.ToDouble())
+            if point.IsArc():
+                y.append(0.)
+                arcs.append(1)
+            else:
+                y.append(point.Y.ToDouble())
+                arcs.append(0)
+        return x, y, arcs
+
+    @aedt_exception_handler
+    def extract_geometry(self, layer_names=None):
+        """Extract the geometry of the polygons, paths, rectangles, and circles of one or more layers.
+
+        The polygon data of each primitive is read once. The results are cached per layer
+        until the primitives are updated.
+
+        Parameters
+        ----------
+        layer_names : list, optional
+            List of layer names. The default is ``None``, in which case all layers are extracted.
+
+        Returns
+        -------
+        dict
+            Dictionary with the layer names as keys and
+            :class:`pyaedt.edb_core.geometry.LayerGeometry` objects as values.
+
+        Examples
+        --------
+        >>> geometry = edb_core.core_primitives.extract_geometry(["TOP"])["TOP"]
+        >>> outline = geometry.get_points(0)
+        """
+        if layer_names is None:
+            layer_names = list(self.layers.keys())
+        elif isinstance(layer_names, str):
+            layer_names = [layer_names]
+        missing = [i for i in layer_names if i not in self._geometry_by_layer]
+        if missing:
+            new_geometries = dict([(i, LayerGeometry(i)) for i in missing])
+            for el in self.primitives:
+                name = el.ToString()
+                primitive_type = [i for i in ("Polygon", "Path", "Rectangle", "Circle") if i in name]
+                if not primitive_type:
+                    continue
+                layer_name = el.GetLayer().GetName()
+                if layer_name not in new_geometries:
+                    continue
+                try:
+                    polygon_data = el.GetPolygonData()
+                    bbox = polygon_data.GetBBox()
+                    loops = [self._get_polygon_data_points(polygon_data)]
+                    for hole in list(polygon_data.Holes):
+                        loops.append(self._get_polygon_data_points(hole))
+                except:
+                    continue
+                new_geometries[layer_name].add_primitive(
+                    primitive_type[0], el.GetNet().GetName(), loops, el, el.GetId(),
+                    [bbox.Item1.X.ToDouble(), bbox.Item1.Y.ToDouble(), bbox.Item2.X.ToDouble(),
+                     bbox.Item2.Y.ToDouble()])
+            for layer_name, geometry in new_geometries.items():
+                geometry.finalize()
+                self._geometry_by_layer[layer_name] = geometry
+        return dict([(i, self._geometry_by_layer[i]) for i in layer_names])
+
+    @aedt_exception_handler
+    def get_layer_geometry(self, layer_name):
+        """Retrieve the geometry of the polygons, paths, rectangles, and circles of a layer.
+
+        Parameters
+        ----------
+        layer_name : str
+            Name of the layer.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.geometry.LayerGeometry`
+        """
+        return self.extract_geometry([layer_name])[layer_name]
+
+    @aedt_exception_handler
+    def get_spatial_index(self, refresh=False):
+        """Retrieve the spatial index of the primitives and padstack instances of all layers.
+
+        The primitives are indexed by the bounding boxes from :func:`extract_geometry`. The
+        padstack instances are indexed by their positions on each layer of their padstack
+        definitions, with the kind ``"Pin"`` for component pins and ``"Via"`` otherwise.
+        The keys of the index are the EDB IDs of the objects.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to rebuild the index, for example after the layout is edited.
+            The default is ``False``.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.geometry.LayoutIndex`
+        """
+        if self._spatial_index is not None and not refresh:
+            return self._spatial_index
+        if refresh:
+            self.update_primitives()
+        index = LayoutIndex()
+        for layer_name, geometry in self.extract_geometry().items():
+            for i in range(len(geometry)):
+                index.add(int(geometry.primitive_ids[i]), layer_name, geometry.get_bounding_box(i),
+                          geometry.nets[i], geometry.primitive_types[i], geometry.primitives[i])
+        definition_layers = {}
+        components = self._parent.core_components
+        for el in self.primitives:
+            if "PadstackInstance" not in el.ToString():
+                continue
+            definition = el.GetPadstackDef()
+            definition_name = definition.GetName()
+            if definition_name not in definition_layers:
+                definition_layers[definition_name] = list(definition.GetData().GetLayerNames())
+            position = components.get_pin_position(el)
+            index.add(el.GetId(), definition_layers[definition_name], position + position, el.GetNet().GetName(),
+                      "Pin" if el.IsLayoutPin() else "Via", el)
+        self._spatial_index = index
+        return index
+
+    @aedt_exception_handler
+    def find_objects_in_box(self, box, layer_name=None, net_list=None, kinds=None):
+        """Find the primitives and padstack instances that overlap a box.
+
+        Parameters
+        ----------
+        box : list
+            Box in the format ``[xmin, ymin, xmax, ymax]``.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects, such as ``"Polygon"``, ``"Path"``, ``"Pin"``, or
+            ``"Via"``. The default is ``None``, in which case all kinds are accepted.
+
+        Returns
+        -------
+        list
+            List of EDB objects.
+
+        Examples
+        --------
+        >>> vias = edb_core.core_primitives.find_objects_in_box([0, 0, 5e-3, 5e-3], kinds=["Via"])
+        """
+        index = self.get_spatial_index()
+        return [index.get_item(key) for key in index.query_box(box, layer_name, net_list, kinds)]
+
+    @aedt_exception_handler
+    def find_objects_in_radius(self, point, radius, layer_name=None, net_list=None, kinds=None):
+        """Find the primitives and padstack instances within a distance from a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        radius : float
+            Distance from the point to the bounding boxes of the objects.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects. The default is ``None``, in which case all kinds
+            are accepted.
+
+        Returns
+        -------
+        list
+            List of EDB objects sorted by increasing distance.
+        """
+        index = self.get_spatial_index()
+        return [index.get_item(key) for key in index.query_radius(point, radius, layer_name, net_list, kinds)]
+
+    @aedt_exception_handler
+    def find_closest_objects(self, point, count=1, layer_name=None, net_list=None, kinds=None):
+        """Find the primitives and padstack instances closest to a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y]`` coordinates.
+        count : int, optional
+            Number of objects to return. The default is ``1``.
+        layer_name : str, optional
+            Name of the layer. The default is ``None``, in which case all layers are searched.
+        net_list : list, optional
+            List of net names. The default is ``None``, in which case all nets are accepted.
+        kinds : list, optional
+            List of the kinds of objects. The default is ``None``, in which case all kinds
+            are accepted.
+
+        Returns
+        -------
+        list
+            List of up to ``count`` EDB objects sorted by increasing distance.
+        """
+        index = self.get_spatial_index()
+        return [index.get_item(key) for key in index.nearest(point, count, layer_name, net_list, kinds)]
+
     @aedt_exception_handler
     def get_polygon_bounding_box(self, polygon):
         """Retrieve a polygon bounding box.
@@ -266,25 +483,8 @@ class EdbLayout(object):
         >>> points  = edb_core.core_primitives.get_polygon_points(poly[0])
         
         """
-        points = []
-        i=0
-        continue_iterate = True
-        prev_point = None
-        while continue_iterate:
-            try:
-                point = polygon.GetPolygonData().GetPoint(i)
-                if prev_point != point:
-                    if point.IsArc():
-                        points.append([point.X.ToDouble()])
-                    else:
-                        points.append([point.X.ToDouble(), point.Y.ToDouble()])
-                    prev_point = point
-                    i += 1
-                else:
-                    continue_iterate = False
-            except:
-                continue_iterate = False
-        return points
+        x, y, arcs = self._get_polygon_data_points(polygon.GetPolygonData())
+        return [[x[i]] if arcs[i] else [x[i], y[i]] for i in range(len(x))]
 
     @aedt_exception_handler
     def parametrize_polygon(self, polygon,selection_polygon, offset_name="offsetx", origin=None):
@@ -371,6 +571,8 @@ class EdbLayout(object):
             except:
                 continue_iterate = False
         polygon.SetPolygonData(poligon_data)
+        self._geometry_by_layer.pop(polygon.GetLayer().GetName(), None)
+        self._spatial_index = None
         return True
 
     @aedt_exception_handler
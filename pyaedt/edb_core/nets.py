@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 import warnings
 from .general import *
+from .connectivity import DisjointSet
 from ..generic.general_methods import get_filename_without_extension, generate_unique_name
 
 try:
@@ -116,93 +117,144 @@ class EdbNets(object):
         if self._builder:
             return self._nets_methods.IsPowerGroundNetInList(self._builder, netname_list)
 
-    def get_dcconnected_net_list(self, ground_nets=["GND"]):
+    def _get_dc_connections(self, ground_nets, resistor_threshold=None, ferrites=None):
+        """Merge the nets joined by two-pin series components.
+
+        Returns
+        -------
+        tuple
+            :class:`pyaedt.edb_core.connectivity.DisjointSet` of the nets and dictionary of the
+            ``(refdes, net_name)`` neighbors of each net.
+        """
+        core_components = self.parent.core_components
+        graph = core_components.connectivity
+        series = [refdes for refdes, comp_obj in core_components.inductors.items() if comp_obj.numpins == 2]
+        if resistor_threshold is not None:
+            series += core_components.get_through_resistor_list(resistor_threshold)
+        for refdes in ferrites or []:
+            if refdes in core_components.components and core_components.components[refdes].numpins == 2:
+                series.append(refdes)
+        ground_nets = set(ground_nets)
+        net_sets = DisjointSet()
+        neighbors = {}
+        for refdes in series:
+            nets = graph.get_nets_from_component(refdes)
+            if not nets or ground_nets.intersection(nets):
+                continue
+            for net in nets:
+                net_sets.add(net)
+            for first, second in zip(nets[:-1], nets[1:]):
+                net_sets.union(first, second)
+                neighbors.setdefault(first, []).append((refdes, second))
+                neighbors.setdefault(second, []).append((refdes, first))
+        return net_sets, neighbors
+
+    def get_dcconnected_net_list(self, ground_nets=["GND"], resistor_threshold=None, ferrites=None):
         """Retrieve the nets connected to DC through inductors.
         
         .. note::
-           Only inductors are considered.
+           Only two-pin inductors are considered, together with the low-value resistors
+           and the ferrite beads when they are requested.
 
         Parameters
         ----------
         ground_nets : list, optional
             List of ground nets. The default is ``["GND"]``.
+        resistor_threshold : float, optional
+            Highest value of the resistors, in ohms, that connect nets to DC. The default
+            is ``None``, in which case resistors are not considered.
+        ferrites : list, optional
+            List of the reference designators of the ferrite beads that connect nets to DC.
+            The default is ``None``.
 
         Returns
         -------
         list
-            List of nets connected to DC through inductors. 
+            List of sets of nets connected to DC through inductors. 
         """
-        temp_list = []
-        for refdes, comp_obj in self.parent.core_components.inductors.items():
-
-            numpins = comp_obj.numpins
-
-            if numpins == 2:
-                nets = comp_obj.nets
-                if not set(nets).intersection(set(ground_nets)):
-                    temp_list.append(set(nets))
-                else:
-                    pass
-
-        dcconnected_net_list = []
-
-        while not not temp_list:
-            s = temp_list.pop(0)
-            interseciton_flag = False
-            for i in temp_list:
-                if not not s.intersection(i):
-                    i.update(s)
-                    interseciton_flag = True
-
-            if not interseciton_flag:
-                dcconnected_net_list.append(s)
-
-        return dcconnected_net_list
-
-    def get_powertree(self, power_net_name, ground_nets):
+        net_sets, neighbors = self._get_dc_connections(ground_nets, resistor_threshold, ferrites)
+        return [set(group) for group in net_sets.groups()]
+
+    def _get_powertree(self, net_group, root, neighbors):
+        ordered = [root]
+        visited = set(ordered)
+        for net in ordered:
+            for refdes, next_net in neighbors.get(net, []):
+                if next_net not in visited:
+                    visited.add(next_net)
+                    ordered.append(next_net)
+        ordered.extend([net for net in net_group if net not in visited])
+        df_list = []
+        graph = self.parent.core_components.connectivity
+        components = self.parent.core_components._cmp
+        for net in ordered:
+            for df in graph.get_net_connections(net):
+                df.append(components[df[0]].type)
+                df_list.append(df)
+        return df_list, ordered
+
+    def get_powertree(self, power_net_name, ground_nets, resistor_threshold=None, ferrites=None):
         """Retrieve the power tree.
 
+        The nets of the power tree are sorted by a breadth-first search from the power net
+        through the components that connect nets to DC.
+
         Parameters
         ----------
         power_net_name : str
             Name of the power net.
-        ground_nets :
-            
+        ground_nets : list
+            List of ground nets.
+        resistor_threshold : float, optional
+            Highest value of the resistors, in ohms, that connect nets to DC. The default
+            is ``None``, in which case resistors are not considered.
+        ferrites : list, optional
+            List of the reference designators of the ferrite beads that connect nets to DC.
+            The default is ``None``.
 
         Returns
         -------
-
+        tuple
+            List of ``[refdes, pin_name, net_name, component_type]`` lists for the component
+            pins of the power tree, and list of the nets of the power tree.
         """
-        flag_in_ng = False
-        net_group = []
-        for ng in self.get_dcconnected_net_list(ground_nets):
-            if power_net_name in ng:
-                flag_in_ng = True
-                net_group.extend(ng)
-                break
+        net_sets, neighbors = self._get_dc_connections(ground_nets, resistor_threshold, ferrites)
+        net_group = [power_net_name]
+        if power_net_name in net_sets:
+            root = net_sets.find(power_net_name)
+            net_group = [net for net in net_sets.groups() if net_sets.find(net[0]) == root][0]
+        return self._get_powertree(net_group, power_net_name, neighbors)
 
-        if not flag_in_ng:
-            net_group.append(power_net_name)
+    def get_powertrees(self, ground_nets=["GND"], resistor_threshold=None, ferrites=None):
+        """Retrieve the power trees of all the nets connected to DC.
 
-        df_list = []
-        rats = self.parent.core_components.get_rats()
-        for net in net_group:
-            for el in rats:
-                if net in el['net_name']:
-                    i = 0
-                    for n in el['net_name']:
-                        if n == net:
-                            df = [el['refdes'][i], el['pin_name'][i],net ]
-                            df_list.append(df)
-                        i += 1
-
-        component_type = []
-        for el in df_list:
-            refdes = el[0]
-            comp_type = self.parent.core_components._cmp[refdes].type
-            component_type.append(comp_type)
-            el.append(comp_type)
-        return df_list, net_group
+        Each power tree starts from the net with the most component pins of its group.
+
+        Parameters
+        ----------
+        ground_nets : list, optional
+            List of ground nets. The default is ``["GND"]``.
+        resistor_threshold : float, optional
+            Highest value of the resistors, in ohms, that connect nets to DC. The default
+            is ``None``, in which case resistors are not considered.
+        ferrites : list, optional
+            List of the reference designators of the ferrite beads that connect nets to DC.
+            The default is ``None``.
+
+        Returns
+        -------
+        dict
+            Dictionary with the name of the first net of each power tree as the key and the
+            power tree, as returned by :func:`get_powertree`, as the value.
+        """
+        net_sets, neighbors = self._get_dc_connections(ground_nets, resistor_threshold, ferrites)
+        graph = self.parent.core_components.connectivity
+        powertrees = {}
+        for net_group in net_sets.groups():
+            pins = [len(graph.get_pin_ids_from_net(net)) for net in net_group]
+            root = net_group[pins.index(max(pins))]
+            powertrees[root] = self._get_powertree(net_group, root, neighbors)
+        return powertrees
 
     @aedt_exception_handler
     def get_net_by_name(self, net_name):
@@ -238,6 +290,8 @@ class EdbNets(object):
                 if edb_net is not None:
                     edb_net.Delete()
                     nets_deleted.append(net)
+                    if self.parent._components:
+                        self.parent._components.refresh_connectivity()
                     self._messenger.add_info_message("Net {} Deleted".format(net))
             except:
                 pass
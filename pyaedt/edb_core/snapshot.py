@@ -0,0 +1,871 @@
+"""
+This module contains the ``EdbSnapshot`` class and the functions that write EDB snapshots.
+
+A snapshot is an SQLite file with the stackup, nets, components, padstack definitions, padstack
+instances, and primitive geometry of a layout. It is written once from an open EDB with
+:func:`export_snapshot` and is then queried with :class:`EdbSnapshot` without the EDB DLLs.
+The geometry of each layer is stored as the flat coordinate arrays of
+:class:`pyaedt.edb_core.geometry.LayerGeometry`, with one little-endian binary column per array.
+"""
+from __future__ import absolute_import
+import json
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+from ..application.MessageManager import EDBMessageManager
+from .components import Components
+from .connectivity import ConnectivityGraph
+from .geometry import LayerGeometry, LayoutIndex
+from .layout import EdbLayout
+from .nets import EdbNets
+from .padstack import EdbPadstacks
+from .stackup import EdbStackup
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+snapshot_version = 1
+
+_tables = OrderedDict([
+    ("info", ["name TEXT", "value TEXT"]),
+    ("layers", ["name TEXT", "layer_type INTEGER", "material_name TEXT", "filling_material_name TEXT",
+                "thickness_value TEXT", "etch_factor TEXT", "lower_elevation REAL", "upper_elevation REAL",
+                "top_bottom_association INTEGER"]),
+    ("nets", ["name TEXT", "is_power_ground INTEGER"]),
+    ("components", ["refdes TEXT", "partname TEXT", "type TEXT", "numpins INTEGER", "placement_layer TEXT",
+                    "res_value REAL", "cap_value REAL", "ind_value REAL"]),
+    ("padstack_definitions", ["name TEXT", "via_layers TEXT", "material TEXT", "hole_finished_size REAL"]),
+    ("padstack_instances", ["id INTEGER", "name TEXT", "refdes TEXT", "net TEXT", "definition TEXT", "x REAL",
+                            "y REAL", "is_pin INTEGER"]),
+    ("primitives", ["id INTEGER", "layer_name TEXT", "primitive_type TEXT", "net TEXT"]),
+    ("geometry", ["layer_name TEXT", "field TEXT", "data BLOB"]),
+])
+
+_geometry_fields = [("primitive_ids", "i"), ("bounding_boxes", "d"), ("loop_offsets", "i"), ("point_offsets", "i"),
+                    ("is_void", "b"), ("x", "d"), ("y", "d"), ("is_arc", "b")]
+
+_dtypes = {"d": "<f8", "i": "<i4", "b": "i1"}
+
+
+def _connect(file_path):
+    if sqlite3 is None:
+        raise ImportError("EDB snapshots require the sqlite3 module.")
+    return sqlite3.connect(file_path)
+
+
+def _to_bytes(values, typecode):
+    if np is not None and isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype=_dtypes[typecode]).tobytes()
+    values = array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(data, typecode):
+    if np is not None:
+        return np.frombuffer(data, dtype=_dtypes[typecode])
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_snapshot(file_path, layers=None, nets=None, components=None, padstack_definitions=None,
+                   padstack_instances=None, geometries=None, cell_name=""):
+    """Write an EDB snapshot.
+
+    Each row is a dictionary with the column names of its table as keys. Missing columns are
+    written as ``NULL``.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path of the snapshot file. An existing file is overwritten.
+    layers : list, optional
+        Stackup layers from bottom to top, with the ``"name"``, ``"layer_type"``, ``"material_name"``,
+        ``"filling_material_name"``, ``"thickness_value"``, ``"etch_factor"``, ``"lower_elevation"``,
+        ``"upper_elevation"``, and ``"top_bottom_association"`` keys. The default is ``None``.
+    nets : list, optional
+        Nets with the ``"name"`` and ``"is_power_ground"`` keys. The default is ``None``.
+    components : list, optional
+        Components with the ``"refdes"``, ``"partname"``, ``"type"``, ``"numpins"``,
+        ``"placement_layer"``, ``"res_value"``, ``"cap_value"``, and ``"ind_value"`` keys.
+        The default is ``None``.
+    padstack_definitions : list, optional
+        Padstack definitions with the ``"name"``, ``"via_layers"``, ``"material"``, and
+        ``"hole_finished_size"`` keys. The ``"via_layers"`` value is a list of layer names.
+        The default is ``None``.
+    padstack_instances : list, optional
+        Padstack instances with the ``"id"``, ``"name"``, ``"refdes"``, ``"net"``, ``"definition"``,
+        ``"x"``, ``"y"``, and ``"is_pin"`` keys. Component pins have a reference designator and
+        ``"is_pin"`` set to ``True``. The default is ``None``.
+    geometries : dict, optional
+        Dictionary with the layer names as keys and finalized
+        :class:`pyaedt.edb_core.geometry.LayerGeometry` objects as values. The default is ``None``.
+    cell_name : str, optional
+        Name of the cell. The default is ``""``.
+
+    Returns
+    -------
+    str
+        Full path of the snapshot file.
+    """
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    rows = OrderedDict([
+        ("info", [{"name": "version", "value": str(snapshot_version)}, {"name": "cell_name", "value": cell_name}]),
+        ("layers", layers or []),
+        ("nets", nets or []),
+        ("components", components or []),
+        ("padstack_definitions", [dict(row, via_layers=json.dumps(list(row.get("via_layers") or [])))
+                                  for row in padstack_definitions or []]),
+        ("padstack_instances", padstack_instances or []),
+        ("primitives", []),
+        ("geometry", []),
+    ])
+    for layer_name, geometry in (geometries or {}).items():
+        for i in range(len(geometry)):
+            rows["primitives"].append({"id": int(geometry.primitive_ids[i]), "layer_name": layer_name,
+                                       "primitive_type": geometry.primitive_types[i], "net": geometry.nets[i]})
+        for field, typecode in _geometry_fields:
+            rows["geometry"].append({"layer_name": layer_name, "field": field,
+                                     "data": _to_bytes(getattr(geometry, field), typecode)})
+    connection = _connect(file_path)
+    try:
+        for table, columns in _tables.items():
+            names = [column.split()[0] for column in columns]
+            connection.execute("CREATE TABLE {} ({})".format(table, ", ".join(columns)))
+            connection.executemany("INSERT INTO {} VALUES ({})".format(table, ", ".join(["?"] * len(names))),
+                                   [[row.get(name) for name in names] for row in rows[table]])
+        connection.execute("CREATE INDEX primitives_layer ON primitives (layer_name)")
+        connection.execute("CREATE INDEX geometry_layer ON geometry (layer_name)")
+        connection.commit()
+    finally:
+        connection.close()
+    return file_path
+
+
+def export_snapshot(edb, file_path):
+    """Export the layout of an open EDB to a snapshot.
+
+    Parameters
+    ----------
+    edb : :class:`pyaedt.edb.Edb`
+        Open EDB.
+    file_path : str
+        Full path of the snapshot file. An existing file is overwritten.
+
+    Returns
+    -------
+    str
+        Full path of the snapshot file.
+    """
+    layers = []
+    for name, layer in edb.core_stackup.stackup_layers.layers.items():
+        layers.append({"name": name, "layer_type": int(layer.layer_type), "material_name": layer.material_name,
+                       "filling_material_name": layer.filling_material_name,
+                       "thickness_value": str(layer.thickness_value), "etch_factor": str(layer.etch_factor),
+                       "lower_elevation": float(layer.lower_elevation), "upper_elevation": float(layer.upper_elevation),
+                       "top_bottom_association": int(layer.top_bottom_association)})
+    power_nets = edb.core_nets.power_nets or {}
+    nets = [{"name": name, "is_power_ground": name in power_nets} for name in edb.core_nets.nets]
+    components = []
+    for refdes, comp in edb.core_components.components.items():
+        try:
+            placement_layer = comp.placement_layer
+        except:
+            placement_layer = ""
+        components.append({"refdes": refdes, "partname": comp.partname, "type": comp.type, "numpins": comp.numpins,
+                           "placement_layer": placement_layer, "res_value": comp.res_value,
+                           "cap_value": comp.cap_value, "ind_value": comp.ind_value})
+    vias = edb.core_padstack.padstacks
+    definitions = OrderedDict()
+    instances = []
+    for el in edb.core_primitives.primitives:
+        if "PadstackInstance" not in el.ToString():
+            continue
+        definition = el.GetPadstackDef()
+        definition_name = definition.GetName()
+        if definition_name not in definitions:
+            data = definition.GetData()
+            definitions[definition_name] = {
+                "name": definition_name, "via_layers": list(data.GetLayerNames()), "material": data.GetMaterial(),
+                "hole_finished_size": vias[definition_name].hole_finished_size if definition_name in vias else 0.}
+        component = el.GetComponent()
+        position = edb.core_components.get_pin_position(el)
+        instances.append({"id": el.GetId(), "name": el.GetName(),
+                          "refdes": "" if component.IsNull() else component.GetName(), "net": el.GetNet().GetName(),
+                          "definition": definition_name, "x": position[0], "y": position[1],
+                          "is_pin": bool(el.IsLayoutPin())})
+    return write_snapshot(file_path, layers, nets, components, list(definitions.values()), instances,
+                          edb.core_primitives.extract_geometry(), edb.cellname or "")
+
+
+class SnapshotRecord(object):
+    """Row of a snapshot table, with one attribute per column.
+
+    Parameters
+    ----------
+    **columns
+        Column names and values.
+    """
+
+    def __init__(self, **columns):
+        self.__dict__.update(columns)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, getattr(self, "name", getattr(self, "refdes", "")))
+
+
+class SnapshotComponents(Components):
+    """Components of an EDB snapshot.
+
+    The queries of :class:`pyaedt.edb_core.components.Components` on components, pins, and nets
+    are answered from the snapshot. Component records have the ``refdes``, ``partname``, ``type``,
+    ``numpins``, ``placement_layer``, ``res_value``, ``cap_value``, ``ind_value``, ``pinlist``,
+    ``pins``, and ``nets`` attributes. Methods that edit the layout are not supported.
+
+    Parameters
+    ----------
+    parent : :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+    """
+
+    def __init__(self, parent):
+        self.parent = parent
+        self._cmp = OrderedDict()
+        self._res = {}
+        self._cap = {}
+        self._ind = {}
+        self._ios = {}
+        self._ics = {}
+        self._others = {}
+        self._pins = {}
+        self._comps_by_part = {}
+        for row in parent._read("components"):
+            comp = SnapshotRecord(**row)
+            comp.pinlist = []
+            comp.pins = OrderedDict()
+            comp.nets = []
+            self._cmp[comp.refdes] = comp
+        for pin in parent._padstack_instances:
+            if pin.is_pin and pin.refdes in self._cmp:
+                comp = self._cmp[pin.refdes]
+                comp.pinlist.append(pin)
+                comp.pins[pin.name] = pin
+                if pin.net not in comp.nets:
+                    comp.nets.append(pin.net)
+        self._graph = None
+        self.connectivity
+
+    @property
+    def components(self):
+        """Component records.
+
+        Returns
+        -------
+        dict
+            Dictionary with the reference designators as keys and the component records as values.
+        """
+        return self._cmp
+
+    def refresh_components(self):
+        """Keep the components of the snapshot, which cannot change."""
+        return True
+
+    @property
+    def connectivity(self):
+        """Connectivity graph of the component pins and nets.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.connectivity.ConnectivityGraph`
+        """
+        if self._graph is None:
+            pins = []
+            pin_objects = []
+            for refdes, comp in self._cmp.items():
+                for pin in comp.pinlist:
+                    pins.append((refdes, pin.name, pin.net))
+                    pin_objects.append(pin)
+            self._graph = ConnectivityGraph(pins, pin_objects, list(self._cmp.keys()))
+        return self._graph
+
+    def get_component_by_name(self, name):
+        """Retrieve a component record by name.
+
+        Parameters
+        ----------
+        name : str
+            Reference designator of the component.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Component record, or ``None`` when the component is not found.
+        """
+        return self._cmp.get(name)
+
+    def get_pin_from_component(self, cmpName, netName=None, pinName=None):
+        """Retrieve the pins of a component.
+
+        Parameters
+        ----------
+        cmpName : str
+            Name of the component.
+        netName : str, optional
+            Filter on the net name as an alternative to ``pinName``. The default is ``None``.
+        pinName : str, optional
+            Filter on the pin name as an alternative to ``netName``. The default is ``None``.
+
+        Returns
+        -------
+        list
+            List of pin records.
+        """
+        if cmpName not in self._cmp:
+            return []
+        pins = self._cmp[cmpName].pinlist
+        if netName:
+            return [pin for pin in pins if pin.net == netName]
+        if pinName:
+            return [pin for pin in pins if pin.name == str(pinName)]
+        return list(pins)
+
+    def get_aedt_pin_name(self, pin):
+        """Retrieve the name of a pin.
+
+        Parameters
+        ----------
+        pin : :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Pin record.
+
+        Returns
+        -------
+        str
+            Name of the pin.
+        """
+        return pin.name
+
+    def get_pin_position(self, pin):
+        """Retrieve the pin position in meters.
+
+        Parameters
+        ----------
+        pin : :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Pin record.
+
+        Returns
+        -------
+        list
+            Pin position as a list of float values in the form ``[x, y]``.
+        """
+        return [pin.x, pin.y]
+
+
+class SnapshotNets(EdbNets):
+    """Nets of an EDB snapshot.
+
+    The net lists and the DC-connected net and power tree queries of
+    :class:`pyaedt.edb_core.nets.EdbNets` are answered from the snapshot. Net records have the
+    ``name`` and ``is_power_ground`` attributes. Methods that edit the layout are not supported.
+
+    Parameters
+    ----------
+    parent : :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+    """
+
+    def __init__(self, parent):
+        EdbNets.__init__(self, parent)
+        self._nets = OrderedDict()
+        for row in parent._read("nets"):
+            row["is_power_ground"] = bool(row["is_power_ground"])
+            self._nets[row["name"]] = SnapshotRecord(**row)
+
+    @property
+    def nets(self):
+        """Net records.
+
+        Returns
+        -------
+        dict
+            Dictionary with the net names as keys and the net records as values.
+        """
+        return self._nets
+
+    @property
+    def signal_nets(self):
+        """Signal net records.
+
+        Returns
+        -------
+        dict
+            Dictionary of signal nets.
+        """
+        return OrderedDict([(name, net) for name, net in self._nets.items() if not net.is_power_ground])
+
+    @property
+    def power_nets(self):
+        """Power and ground net records.
+
+        Returns
+        -------
+        dict
+            Dictionary of power nets.
+        """
+        return OrderedDict([(name, net) for name, net in self._nets.items() if net.is_power_ground])
+
+    def is_power_gound_net(self, netname_list):
+        """Determine if one of the nets in a list is power or ground.
+
+        Parameters
+        ----------
+        netname_list : list
+            List of net names.
+
+        Returns
+        -------
+        bool
+            ``True`` when one of the nets is power or ground, ``False`` otherwise.
+        """
+        return any([name in self._nets and self._nets[name].is_power_ground for name in netname_list])
+
+    def get_net_by_name(self, net_name):
+        """Retrieve a net record by name.
+
+        Parameters
+        ----------
+        net_name : str
+            Name of the net.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Net record, or ``None`` when the net is not found.
+        """
+        return self._nets.get(net_name)
+
+
+class SnapshotStackup(EdbStackup):
+    """Stackup of an EDB snapshot.
+
+    The stackup is its own layer collection: :attr:`stackup_layers` returns the stackup.
+    Layer records have the attributes of :class:`pyaedt.edb_core.EDB_Data.EDBLayer`, such as
+    ``layer_type``, ``material_name``, ``thickness_value``, and ``lower_elevation``.
+
+    Parameters
+    ----------
+    parent : :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+    """
+
+    def __init__(self, parent):
+        EdbStackup.__init__(self, parent)
+        self._layer_dict = OrderedDict()
+        for i, row in enumerate(parent._read("layers")):
+            self._layer_dict[row["name"]] = SnapshotRecord(id=i, **row)
+
+    def __getitem__(self, layername):
+        return self._layer_dict[layername]
+
+    @property
+    def stackup_layers(self):
+        """Stackup, which exposes the ``layers`` and ``signal_layers`` dictionaries."""
+        return self
+
+    @property
+    def layers(self):
+        """Layer records from bottom to top.
+
+        Returns
+        -------
+        dict
+            Dictionary with the layer names as keys and the layer records as values.
+        """
+        return self._layer_dict
+
+    @property
+    def signal_layers(self):
+        """Signal and conducting layer records.
+
+        Returns
+        -------
+        dict
+            Dictionary of signal layers.
+        """
+        return OrderedDict([(name, layer) for name, layer in self._layer_dict.items() if layer.layer_type in (0, 2)])
+
+    def stackup_limits(self, only_metals=False):
+        """Retrieve stackup limits.
+
+        Parameters
+        ----------
+        only_metals : bool, optional
+            Whether to retrieve only metals. The default is ``False``.
+
+        Returns
+        -------
+        tuple
+            Name and upper elevation of the top layer and name and lower elevation of the
+            bottom layer.
+        """
+        layer_types = (0, 2) if only_metals else (0, 1, 2)
+        layers = [layer for layer in self._layer_dict.values() if layer.layer_type in layer_types]
+        top = max(layers, key=lambda layer: layer.upper_elevation)
+        bottom = min(layers, key=lambda layer: layer.lower_elevation)
+        return top.name, top.upper_elevation, bottom.name, bottom.lower_elevation
+
+
+class SnapshotPadstacks(EdbPadstacks):
+    """Padstack definitions of an EDB snapshot.
+
+    Definition records have the ``name``, ``via_layers``, ``via_start_layer``, ``via_stop_layer``,
+    ``material``, and ``hole_finished_size`` attributes.
+
+    Parameters
+    ----------
+    parent : :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+    """
+
+    def __init__(self, parent):
+        EdbPadstacks.__init__(self, parent)
+        self._definitions = OrderedDict()
+        for row in parent._read("padstack_definitions"):
+            row["via_layers"] = json.loads(row["via_layers"])
+            definition = SnapshotRecord(**row)
+            definition.via_start_layer = definition.via_layers[0] if definition.via_layers else ""
+            definition.via_stop_layer = definition.via_layers[-1] if definition.via_layers else ""
+            self._definitions[definition.name] = definition
+
+    @property
+    def definitions(self):
+        """Padstack definition records.
+
+        Returns
+        -------
+        dict
+            Dictionary with the definition names as keys and the definition records as values.
+        """
+        return self._definitions
+
+    @property
+    def padstacks(self):
+        """Padstack definition records of the vias, which span more than one layer.
+
+        Returns
+        -------
+        dict
+            Dictionary of padstack definitions.
+        """
+        return OrderedDict([(name, definition) for name, definition in self._definitions.items()
+                            if len(definition.via_layers) > 1])
+
+    def get_pinlist_from_component_and_net(self, refdes=None, netname=None):
+        """Retrieve pins given a component's reference designator and net name.
+
+        Parameters
+        ----------
+        refdes : str, optional
+            Reference designator of the component. The default is ``None``.
+        netname : str optional
+            Name of the net. The default is ``None``.
+
+        Returns
+        -------
+        list
+            List of pin records.
+        """
+        return [pin for pin in self.parent._padstack_instances if pin.is_pin and
+                (refdes is None or pin.refdes == refdes) and (netname is None or pin.net == netname)]
+
+
+class SnapshotLayout(EdbLayout):
+    """Primitives of an EDB snapshot.
+
+    The geometry, spatial index, and search queries of :class:`pyaedt.edb_core.layout.EdbLayout`
+    are answered from the snapshot. The geometry of a layer is read from the snapshot the first
+    time that it is used. Primitive records have the ``id``, ``layer_name``, ``primitive_type``,
+    ``net``, and ``index`` attributes, where ``index`` is the index of the primitive in the
+    geometry of its layer. Methods that edit the layout are not supported.
+
+    Parameters
+    ----------
+    parent : :class:`pyaedt.edb_core.snapshot.EdbSnapshot`
+    """
+
+    @property
+    def primitives(self):
+        """Primitive and padstack instance records of all layers.
+
+        Returns
+        -------
+        list
+            List of records.
+        """
+        if not self._prims:
+            for geometry in self.extract_geometry().values():
+                self._prims.extend(geometry.primitives)
+            self._prims.extend(self._parent._padstack_instances)
+        return self._prims
+
+    def update_primitives(self):
+        """Discard the primitive records so that they are read again when they are next used."""
+        self._prims = []
+        self._geometry_by_layer = {}
+        self._primitives_by_layer = {}
+        self._spatial_index = None
+        return True
+
+    def _get_primitives(self, primitive_type):
+        return [el for el in self.primitives if getattr(el, "primitive_type", None) == primitive_type]
+
+    @property
+    def polygons_by_layer(self):
+        """Dictionary of polygon records with layer names as keys."""
+        if not self._primitives_by_layer:
+            self._primitives_by_layer = dict([(layer_name, self.get_polygons_by_layer(layer_name))
+                                              for layer_name in self.layers])
+        return self._primitives_by_layer
+
+    @property
+    def rectangles(self):
+        """List of rectangle records."""
+        return self._get_primitives("Rectangle")
+
+    @property
+    def circles(self):
+        """List of circle records."""
+        return self._get_primitives("Circle")
+
+    @property
+    def paths(self):
+        """List of path records."""
+        return self._get_primitives("Path")
+
+    @property
+    def bondwires(self):
+        """List of bondwire records, which are not stored in snapshots."""
+        return []
+
+    @property
+    def polygons(self):
+        """List of polygon records."""
+        return self._get_primitives("Polygon")
+
+    def extract_geometry(self, layer_names=None):
+        """Read the geometry of the primitives of one or more layers.
+
+        Parameters
+        ----------
+        layer_names : list, optional
+            List of layer names. The default is ``None``, in which case all layers are read.
+
+        Returns
+        -------
+        dict
+            Dictionary with the layer names as keys and
+            :class:`pyaedt.edb_core.geometry.LayerGeometry` objects as values.
+        """
+        if layer_names is None:
+            layer_names = list(self.layers.keys())
+        elif isinstance(layer_names, str):
+            layer_names = [layer_names]
+        for layer_name in layer_names:
+            if layer_name not in self._geometry_by_layer:
+                self._geometry_by_layer[layer_name] = self._parent._read_geometry(layer_name)
+        return dict([(i, self._geometry_by_layer[i]) for i in layer_names])
+
+    def get_polygons_by_layer(self, layer_name, net_list=None):
+        """Retrieve the polygon records of a layer.
+
+        Parameters
+        ----------
+        layer_name: str
+            Name of the layer.
+        net_list : list, optional
+            List of net names.
+
+        Returns
+        -------
+        list
+            List of primitive records.
+        """
+        geometry = self.get_layer_geometry(layer_name)
+        return [geometry.primitives[i] for i in geometry.get_primitive_indices("Polygon", net_list)]
+
+    def get_spatial_index(self, refresh=False):
+        """Retrieve the spatial index of the primitives and padstack instances of all layers.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to rebuild the index. The default is ``False``.
+
+        Returns
+        -------
+        :class:`pyaedt.edb_core.geometry.LayoutIndex`
+        """
+        if self._spatial_index is not None and not refresh:
+            return self._spatial_index
+        index = LayoutIndex()
+        for layer_name, geometry in self.extract_geometry().items():
+            for i in range(len(geometry)):
+                index.add(int(geometry.primitive_ids[i]), layer_name, geometry.get_bounding_box(i),
+                          geometry.nets[i], geometry.primitive_types[i], geometry.primitives[i])
+        definitions = self._parent.core_padstack.definitions
+        for pin in self._parent._padstack_instances:
+            definition = definitions.get(pin.definition)
+            if definition is None or not definition.via_layers:
+                continue
+            index.add(pin.id, definition.via_layers, [pin.x, pin.y, pin.x, pin.y], pin.net,
+                      "Pin" if pin.is_pin else "Via", pin)
+        self._spatial_index = index
+        return index
+
+    def get_polygon_bounding_box(self, polygon):
+        """Retrieve the bounding box of a primitive record.
+
+        Parameters
+        ----------
+        polygon : :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Primitive record.
+
+        Returns
+        -------
+        list
+            List of bounding box coordinates in the format ``[-x, -y, +x, +y]``.
+        """
+        return self.get_layer_geometry(polygon.layer_name).get_bounding_box(polygon.index)
+
+    def get_polygon_points(self, polygon):
+        """Retrieve the outline points of a primitive record.
+
+        Parameters
+        ----------
+        polygon : :class:`pyaedt.edb_core.snapshot.SnapshotRecord`
+            Primitive record.
+
+        Returns
+        -------
+        list
+            List of points in the format ``[x, y]``, or ``[height]`` for arcs.
+        """
+        return self.get_layer_geometry(polygon.layer_name).get_points(polygon.index)
+
+
+class EdbSnapshot(object):
+    """Read-only EDB layout stored in a snapshot file.
+
+    The snapshot exposes the ``core_components``, ``core_nets``, ``core_stackup``, ``core_padstack``,
+    and ``core_primitives`` queries of :class:`pyaedt.edb.Edb` without the EDB DLLs. The queries
+    return snapshot records instead of EDB objects.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path of the snapshot file written by :func:`pyaedt.edb.Edb.export_snapshot`
+        or :func:`write_snapshot`.
+
+    Examples
+    --------
+    >>> from pyaedt.edb_core.snapshot import EdbSnapshot
+    >>> with EdbSnapshot("galileo.snapshot") as snapshot:
+    ...     components = snapshot.core_components.get_components_from_nets("V3P3_S5")
+    ...     vias = snapshot.core_primitives.find_objects_in_radius([0.01, 0.02], 1e-3, kinds=["Via"])
+
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._connection = _connect(file_path)
+        self._messenger = EDBMessageManager()
+        info = dict([(row["name"], row["value"]) for row in self._read("info")])
+        if int(info.get("version", 0)) > snapshot_version:
+            raise ValueError("Snapshot version {} is not supported.".format(info.get("version")))
+        self.cellname = info.get("cell_name", "")
+        self._padstack_instances = []
+        for row in self._read("padstack_instances"):
+            row["is_pin"] = bool(row["is_pin"])
+            pin = SnapshotRecord(**row)
+            pin.position = [pin.x, pin.y]
+            self._padstack_instances.append(pin)
+        self._stackup = SnapshotStackup(self)
+        self._nets = SnapshotNets(self)
+        self._components = SnapshotComponents(self)
+        self._padstack = SnapshotPadstacks(self)
+        self._core_primitives = SnapshotLayout(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self.close()
+
+    def close(self):
+        """Close the snapshot file."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        return True
+
+    def _read(self, table, condition="", parameters=()):
+        names = [column.split()[0] for column in _tables[table]]
+        cursor = self._connection.execute(
+            "SELECT {} FROM {} {} ORDER BY rowid".format(", ".join(names), table, condition), parameters)
+        return [dict(zip(names, row)) for row in cursor]
+
+    def _read_geometry(self, layer_name):
+        rows = self._read("primitives", "WHERE layer_name = ?", (layer_name,))
+        typecodes = dict(_geometry_fields)
+        arrays = dict([(row["field"], _from_bytes(row["data"], typecodes[row["field"]]))
+                       for row in self._read("geometry", "WHERE layer_name = ?", (layer_name,))])
+        if not arrays:
+            geometry = LayerGeometry(layer_name)
+            geometry.finalize()
+            return geometry
+        primitives = [SnapshotRecord(index=i, **row) for i, row in enumerate(rows)]
+        return LayerGeometry.from_arrays(layer_name, [row["primitive_type"] for row in rows],
+                                         [row["net"] for row in rows], arrays, primitives)
+
+    @property
+    def core_components(self):
+        """Core components."""
+        return self._components
+
+    @property
+    def core_nets(self):
+        """Core nets."""
+        return self._nets
+
+    @property
+    def core_stackup(self):
+        """Core stackup."""
+        return self._stackup
+
+    @property
+    def core_padstack(self):
+        """Core padstack."""
+        return self._padstack
+
+    @property
+    def core_primitives(self):
+        """Core primitives."""
+        return self._core_primitives
+
+    @property
+    def pins(self):
+        """Pins.
+
+        Returns
+        -------
+        list
+            List of all pin records.
+        """
+        return list(self._components.connectivity.pin_objects)
@@ -0,0 +1,306 @@
+"""
+This module contains the ``CommandRecorder`` class.
+
+The recorder stands in for the ``oDesign``, ``oEditor``, and ``oModule`` objects of AEDT. It records
+the calls with their argument arrays instead of sending them, keeps an offline model of the object
+names and IDs so that the calling code can continue without AEDT, and writes the recorded calls to an
+IronPython script that AEDT runs in batch mode with ``-RunScriptAndExit``.
+"""
+from __future__ import absolute_import
+import numbers
+import re
+from collections import OrderedDict
+
+solid_commands = ["CreateBox", "CreateCylinder", "CreateSphere", "CreateCone", "CreateTorus", "CreatePolyhedron",
+                  "CreateBondwire", "CreateRegion", "CreateUserDefinedPart", "CreateHelix"]
+sheet_commands = ["CreateRectangle", "CreateCircle", "CreateEllipse", "CreateRegularPolygon",
+                  "CreateEquationSurface"]
+line_commands = ["CreatePolyline", "CreateEquationCurve"]
+
+
+_escaped_characters = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_re_escaped_characters = re.compile(r'[\\"\x00-\x1f\x7f]')
+
+
+def _escape_character(match):
+    character = match.group(0)
+    return _escaped_characters.get(character, "\\x{:02x}".format(ord(character)))
+
+
+def _format_argument(value):
+    """Format an argument as an IronPython literal."""
+    if isinstance(value, bool):
+        return repr(value)
+    if isinstance(value, numbers.Integral):
+        return repr(int(value))
+    if isinstance(value, numbers.Number):
+        value = float(value)
+        if value != value:
+            return 'float("nan")'
+        if value == float("inf"):
+            return 'float("inf")'
+        if value == float("-inf"):
+            return 'float("-inf")'
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join([_format_argument(i) for i in value]) + "]"
+    if value is None:
+        return "None"
+    return '"' + _re_escaped_characters.sub(_escape_character, str(value)) + '"'
+
+
+def _argument_value(args, key, default=None):
+    """Retrieve the value following ``key`` in an AEDT argument array."""
+    for i, value in enumerate(args[:-1]):
+        if value == key:
+            return args[i + 1]
+    return default
+
+
+class RecordedObject(object):
+    """Stand-in for an AEDT scripting object.
+
+    Every method call is forwarded to :func:`CommandRecorder.call`.
+
+    Parameters
+    ----------
+    recorder : :class:`pyaedt.generic.CommandRecorder.CommandRecorder`
+        Recorder of the calls.
+    handle : str
+        Name of the variable holding the object in the script.
+    """
+    def __init__(self, recorder, handle):
+        self._recorder = recorder
+        self._handle = handle
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def method(*args):
+            return self._recorder.call(self._handle, name, args)
+        return method
+
+    def __repr__(self):
+        return "RecordedObject({})".format(self._handle)
+
+
+class CommandRecorder(object):
+    """Records the calls to AEDT and replays them as a standalone IronPython script.
+
+    Calls that modify the design are recorded in order. ``GetModule`` and ``SetActiveEditor``
+    return recorded objects. The queries of the object names and IDs and of the model units
+    are answered from the offline model. Other ``Get`` queries are not recorded and return
+    an empty list.
+
+    Parameters
+    ----------
+    model_units : str, optional
+        Model units of the design. The default is ``"mm"``.
+    objects : list, optional
+        Names of the solids already in the design. The default is ``None``.
+
+    Examples
+    --------
+    >>> from pyaedt.generic.CommandRecorder import CommandRecorder
+    >>> recorder = CommandRecorder()
+    >>> oeditor = recorder.odesign.SetActiveEditor("3D Modeler")
+    >>> oeditor.CreateBox(["NAME:BoxParameters", "XPosition:=", "0mm", "YPosition:=", "0mm",
+    ...                    "ZPosition:=", "0mm", "XSize:=", "1mm", "YSize:=", "1mm", "ZSize:=", "1mm"],
+    ...                   ["NAME:Attributes", "Name:=", "Box1"])
+    'Box1'
+    >>> script = recorder.to_script(project_name="Project1", design_name="HFSSDesign1")
+
+    """
+    def __init__(self, model_units="mm", objects=None):
+        self.commands = []
+        self.model_units = model_units
+        self._handles = OrderedDict([("oDesign", None)])
+        self._objects = OrderedDict()
+        self._next_id = 1
+        for name in objects or []:
+            self._add_object(name, "Solids")
+        self.odesign = RecordedObject(self, "oDesign")
+
+    @property
+    def object_names(self):
+        """Names of the objects in the offline model."""
+        return list(self._objects.keys())
+
+    def clear(self):
+        """Clear the recorded calls while keeping the offline model."""
+        self.commands = []
+
+    def call(self, handle, method, args):
+        """Record a call or answer it from the offline model.
+
+        Parameters
+        ----------
+        handle : str
+            Name of the variable holding the called object.
+        method : str
+            Name of the method.
+        args : tuple
+            Arguments of the call.
+
+        Returns
+        -------
+        type
+            Value that AEDT is expected to return.
+        """
+        args = list(args)
+        if method in ("GetModule", "SetActiveEditor"):
+            return self._get_handle(handle, method, args[0])
+        if method == "GetObjectsInGroup":
+            return [name for name, value in self._objects.items() if value[1] == args[0]]
+        if method == "GetObjectIDByName":
+            return self._objects[args[0]][0]
+        if method == "GetModelUnits":
+            return self.model_units
+        if method.startswith("Get"):
+            return []
+        self.commands.append((handle, method, args))
+        if method == "SetModelUnits":
+            self.model_units = _argument_value(args[0], "Units:=", self.model_units)
+        elif method.startswith("Create") and len(args) > 1:
+            return self._create(method, args)
+        elif method == "Delete":
+            self._remove_selections(args[0])
+        elif method in ("Unite", "Subtract"):
+            self._boolean(method, args)
+        elif method == "ChangeProperty":
+            self._change_property(args[0])
+        return None
+
+    def _get_handle(self, handle, method, name):
+        prefix = "oEditor" if method == "SetActiveEditor" else "oModule"
+        new_handle = prefix + "_" + re.sub(r"\W", "_", name)
+        if new_handle not in self._handles:
+            self._handles[new_handle] = (handle, method, name)
+        return RecordedObject(self, new_handle)
+
+    def _add_object(self, name, group):
+        base = name
+        index = 1
+        while name in self._objects:
+            name = "{}_{}".format(base, index)
+            index += 1
+        self._objects[name] = (self._next_id, group)
+        self._next_id += 1
+        return name
+
+    def _create(self, method, args):
+        name = _argument_value(args[-1], "Name:=")
+        if not name:
+            return None
+        if method in solid_commands:
+            group = "Solids"
+        elif method in sheet_commands or (
+                method in line_commands and _argument_value(args[0], "IsPolylineCovered:=", False)):
+            group = "Sheets"
+        elif method in line_commands:
+            group = "Lines"
+        else:
+            group = "Unclassified"
+        return self._add_object(name, group)
+
+    def _selections(self, args):
+        selections = _argument_value(args, "Selections:=", "")
+        return [i for i in selections.split(",") if i]
+
+    def _remove_selections(self, args):
+        for name in self._selections(args):
+            self._objects.pop(name, None)
+
+    def _boolean(self, method, args):
+        if method == "Unite":
+            if _argument_value(args[1], "KeepOriginals:=", False):
+                return
+            for name in self._selections(args[0])[1:]:
+                self._objects.pop(name, None)
+        elif not _argument_value(args[1], "KeepOriginals:=", False):
+            for name in _argument_value(args[0], "Tool Parts:=", "").split(","):
+                self._objects.pop(name, None)
+
+    def _change_property(self, args):
+        for tab in args[1:]:
+            servers = [i for i in tab if isinstance(i, list) and i and i[0] == "NAME:PropServers"]
+            changes = [i for i in tab if isinstance(i, list) and i and i[0] == "NAME:ChangedProps"]
+            if not servers or not changes:
+                continue
+            for change in changes[0][1:]:
+                if change[0] == "NAME:Name" and len(servers[0]) == 2 and servers[0][1] in self._objects:
+                    self._objects[change[2]] = self._objects.pop(servers[0][1])
+
+    def to_script(self, project_name=None, design_name=None, save=False):
+        """Write the recorded calls as an IronPython script.
+
+        Parameters
+        ----------
+        project_name : str, optional
+            Name of the project to activate. The default is ``None``, in which case the active
+            project is used.
+        design_name : str, optional
+            Name of the design to activate. The default is ``None``, in which case the active
+            design is used.
+        save : bool, optional
+            Whether to save the project at the end of the script. The default is ``False``.
+
+        Returns
+        -------
+        str
+            Script text.
+        """
+        lines = ["# Script recorded by pyaedt",
+                 "import ScriptEnv",
+                 'ScriptEnv.Initialize("Ansoft.ElectronicsDesktop")']
+        if project_name:
+            lines.append("oProject = oDesktop.SetActiveProject({})".format(_format_argument(project_name)))
+        else:
+            lines.append("oProject = oDesktop.GetActiveProject()")
+        if design_name:
+            lines.append("oDesign = oProject.SetActiveDesign({})".format(_format_argument(design_name)))
+        else:
+            lines.append("oDesign = oProject.GetActiveDesign()")
+        defined = set(["oDesign"])
+        for handle, method, args in self.commands:
+            pending = []
+            parent = handle
+            while parent not in defined:
+                pending.append(parent)
+                parent = self._handles[parent][0]
+            for name in reversed(pending):
+                parent, get_method, argument = self._handles[name]
+                lines.append("{} = {}.{}({})".format(name, parent, get_method, _format_argument(argument)))
+                defined.add(name)
+            lines.append("{}.{}({})".format(handle, method, ", ".join([_format_argument(i) for i in args])))
+        if save:
+            lines.append("oProject.Save()")
+        return "\n".join(lines) + "\n"
+
+    def save_script(self, filename, project_name=None, design_name=None, save=False):
+        """Save the recorded calls as an IronPython script.
+
+        Run the script with ``ansysedt -RunScriptAndExit filename``.
+
+        Parameters
+        ----------
+        filename : str
+            Full path of the script.
+        project_name : str, optional
+            Name of the project to activate. The default is ``None``, in which case the active
+            project is used.
+        design_name : str, optional
+            Name of the design to activate. The default is ``None``, in which case the active
+            design is used.
+        save : bool, optional
+            Whether to save the project at the end of the script. The default is ``False``.
+
+        Returns
+        -------
+        str
+            Full path of the script.
+        """
+        with open(filename, "w") as f:
+            f.write(self.to_script(project_name, design_name, save))
+        return filename
@@ -1,5 +1,17 @@
+import gc
+import hashlib
+import json
+import os
 import re
 from collections import OrderedDict
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+try:
+    import mmap
+except ImportError:
+    mmap = None
 
 
 # --------------------------------------------------------------------
@@ -41,6 +53,45 @@ def load_keyword_in_aedt_file(filename, keyword):
     """
     return _load_keyword_in_aedt_file(filename, keyword)
 
+
+def load_lazy_aedt_file(filename, use_cache=True, previous=None):
+    """Index the AEDT file and return a dictionary whose blocks are decoded on first access
+
+    Only the byte offsets of the blocks are read when the file is loaded. The children of the
+    top level block (designs, ``Definitions``, ``ProjectDatasets``, ...) are decoded the first
+    time that they are accessed.
+
+    When the dictionary loaded before the last save of the file is provided, the blocks whose
+    content is unchanged are not decoded again and the decoded dictionaries are reused. The
+    names of the blocks that changed are listed in ``refreshed_blocks`` of the returned
+    ``AedtLazyBlock``.
+
+    Parameters
+    ----------
+    filename :
+        AEDT filename with path
+    use_cache : bool, optional
+        Whether to reuse and save the index next to the AEDT file. The cached index is used as
+        long as the modification time and the size of the file are unchanged.
+        The default is ``True``.
+    previous : OrderedDict, optional
+        Dictionary returned by a previous call for the same file. The default is ``None``.
+
+    Returns
+    -------
+    OrderedDict
+        dictionary containing the top level block as an ``AedtLazyBlock``
+
+    """
+    index = AedtFileIndex(filename, use_cache=use_cache)
+    main_dict = OrderedDict()
+    if index.names:
+        previous_block = None
+        if previous and isinstance(previous.get(index.names[0]), AedtLazyBlock):
+            previous_block = previous[index.names[0]]
+        main_dict[index.names[0]] = AedtLazyBlock(index, 0, previous=previous_block)
+    return main_dict
+
 # --------------------------------------------------------------------
 # internals
 
@@ -53,12 +104,6 @@ _square_bracket_list = re.compile(r"^(?P<KEY1>[^\s]+?)\[\d+:(?P<LIST1>.+)\]|^'(?
 _key_parse = re.compile(r"(^'(?P<KEY1>.+?)')(?<=')=(?P<VAL1>.+$)|(?P<KEY2>^.+?)=(?P<VAL2>.+$)")
 _value_parse1 = re.compile(r"\s")
 _value_parse2 = re.compile(r"^'([^']*\s[^']*)(?=')")
-_begin_search = re.compile(r"\$begin '(.+)'")
-
-# global variables
-_all_lines = []
-_len_all_lines = 0
-_count = 0
 
 
 def _parse_value(v):
@@ -80,6 +125,12 @@ def _parse_value(v):
         pv = True
     elif v == 'false':
         pv = False
+    elif v[:1] == "'":
+        m = _remove_quotes.search(v)
+        if m:
+            pv = m.group(1)
+        else:
+            pv = v
     else:
         try:
             pv = int(v)
@@ -135,7 +186,7 @@ def _decode_value_and_save(k, v, d):
     # create a list for key(l1, l2, l3)
     # create a list for key[n: 1, 2, ...n]
 
-    m = _round_bracket_list.search(k)
+    m = _round_bracket_list.search(k) if "(" in k else None
     if m and m.group('KEY1'):
         v = _separate_list_elements(m.group('LIST1'))
         k = m.group('KEY1')
@@ -145,7 +196,7 @@ def _decode_value_and_save(k, v, d):
         k = m.group('KEY2')
         d[k] = v
     else:
-        m = _square_bracket_list.search(k)
+        m = _square_bracket_list.search(k) if "[" in k else None
         if m and m.group('KEY1'):
             v = _separate_list_elements(m.group('LIST1'))
             k = m.group('KEY1')
@@ -172,7 +223,7 @@ def _decode_key(l, d):
     -------
 
     """
-    m = _key_parse.search(l)
+    m = _key_parse.search(l) if "=" in l else None
     if m and m.group('KEY1'):  # key btw ''
         value = m.group('VAL1')
         if "\\'" in value:
@@ -205,80 +256,100 @@ def _decode_key(l, d):
         _decode_value_and_save(key, value, d)
 
 
-def _walk_through_structure(keyword, save_dict):
-    """
+def _block_name(line, tag):
+    """Return the name of the block opened or closed by ``line``.
 
     Parameters
     ----------
-    keyword :
-        
-    save_dict :
-        
+    line : str
+        Decoded line.
+    tag : str
+        Either ``"$begin '"`` or ``"$end '"``.
 
     Returns
     -------
+    str
+        Name of the block or ``None`` if the line is not a ``tag`` line.
 
     """
-    global _count
-    begin_key = '$begin \'{}\''.format(keyword)
-    end_key = '$end \'{}\''.format(keyword)
-    found = False
-    saved_value = None
-    while _count < _len_all_lines:
-        line = _all_lines[_count]
-        # begin_key is found
-        if begin_key == line.strip():
-            found = True
-            saved_value = save_dict.get(keyword)               # if the keyword is already present
-            if saved_value and type(saved_value) is not list:  # makes the value a list, if it's not already
-                saved_value = [saved_value]
-            save_dict[keyword] = OrderedDict()
-            _count += 1
-            continue
-        # end_key is found
-        if end_key == line.strip(): break
-        # between begin_key and end_key
-        if found:
-            b = _begin_search.search(line)
-            if b:  # walk down a level
-                nextlvl_begin_key = b.group(1)
-                _walk_through_structure(nextlvl_begin_key, save_dict[keyword])
-            else:  # decode key
-                _decode_key(line, save_dict[keyword])
-        _count += 1
-    # recompose value if list
-    if saved_value:
-        saved_value.append(save_dict[keyword])
-        save_dict[keyword] = saved_value
-    return _count
-
-
-def _reaf_aedt_file(filename):
-    """Read the entire AEDT file discard binary and put ascii line in a list
+    stripped = line.strip()
+    if stripped.startswith(tag) and stripped[-1] == "'" and len(stripped) > len(tag) + 1:
+        return stripped[len(tag):-1]
+    return None
+
+
+def _parse_aedt_stream(stream, keyword=None, main_dict=None):
+    """Parse an AEDT stream in one single pass.
+
+    The open blocks are kept in an explicit stack, so the parsing is neither recursive nor
+    based on module global variables. The parsing stops as soon as the loaded block is closed
+    or when the binary section of the file is reached.
 
     Parameters
     ----------
-    filename :
-        AEDT filename with path
+    stream :
+        File object opened in binary mode or any iterable of ``bytes`` lines.
+    keyword : str, optional
+        Name of the block to load. The default is ``None``, in which case the first block of the
+        file is loaded.
+    main_dict : OrderedDict, optional
+        Dictionary receiving the loaded block. The default is a new ``OrderedDict``.
 
     Returns
     -------
+    OrderedDict
+        Dictionary containing the decoded block.
 
     """
-    global _all_lines
-    global _len_all_lines
-    global _count
-    # read the AEDT file and discard the binary part
-    with open(filename, 'rb') as aedt_fh:
-        temp = aedt_fh.read().splitlines()
-    _all_lines = []
-    _count = 0
-    for line in temp:
+    if main_dict is None:
+        main_dict = OrderedDict()
+    # the tree only holds acyclic containers, the garbage collector passes are pure overhead
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        _fill_tree(stream, keyword, main_dict)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return main_dict
+
+
+def _fill_tree(stream, keyword, main_dict):
+    """Fill ``main_dict`` with the block read from ``stream``. See ``_parse_aedt_stream``."""
+    stack = []  # (keyword, parent dictionary, block dictionary, previous value)
+    current = None
+    for line in stream:
         try:
-            _all_lines.append(line.decode("utf-8").lstrip('\t'))
+            line = line.decode("utf-8").rstrip("\r\n").lstrip("\t")
         except UnicodeDecodeError:
             break
-    _len_all_lines = len(_all_lines)
+        first = line[:1]
+        if first == "$" or first == " ":
+            name = _block_name(line, "$begin '")
+            if name is not None:
+                if current is None and keyword is not None and name != keyword:
+                    continue
+                parent = main_dict if current is None else current
+                saved_value = parent.get(name)  # if the keyword is already present
+                if saved_value and type(saved_value) is not list:  # makes the value a list, if it's not already
+                    saved_value = [saved_value]
+                current = OrderedDict()
+                parent[name] = current
+                stack.append((name, parent, current, saved_value))
+                continue
+            name = _block_name(line, "$end '")
+            if name is not None and stack and stack[-1][0] == name:
+                name, parent, block, saved_value = stack.pop()
+                # recompose value if list
+                if saved_value:
+                    saved_value.append(block)
+                    parent[name] = saved_value
+                if not stack:
+                    break
+                current = stack[-1][2]
+                continue
+        if current is not None:
+            _decode_key(line, current)
 
 
 def _load_entire_aedt_file(filename):
@@ -295,23 +366,16 @@ def _load_entire_aedt_file(filename):
         dictionary containing the decoded AEDT file
 
     """
-    _reaf_aedt_file(filename)
-    # load the aedt file
-    begin_key = None
-    for line in _all_lines:
-        m = _begin_search.search(line)
-        if m:
-            begin_key = m.group(1)
-            break
-    main_dict = OrderedDict()
-    if begin_key:
-        _walk_through_structure(begin_key, main_dict)
-    return main_dict
+    with open(filename, "rb") as aedt_fh:
+        return _parse_aedt_stream(aedt_fh)
 
 
 def _load_keyword_in_aedt_file(filename, keyword):
     """Load a specific keyword in the AEDT file and return the dictionary
 
+    The block is located with the file index when it belongs to the indexed levels, otherwise
+    the file is parsed up to the block.
+
     Parameters
     ----------
     filename :
@@ -325,8 +389,424 @@ def _load_keyword_in_aedt_file(filename, keyword):
         dictionary containing the decoded AEDT file
 
     """
-    _reaf_aedt_file(filename)
-    # load the aedt file
-    main_dict = OrderedDict()
-    _walk_through_structure(keyword, main_dict)
-    return main_dict
+    index = AedtFileIndex(filename)
+    block = index.find(keyword)
+    if block is not None:
+        return index.load_block(block)
+    with open(filename, "rb") as aedt_fh:
+        return _parse_aedt_stream(aedt_fh, keyword)
+
+
+# --------------------------------------------------------------------
+# lazy loading
+
+_INDEX_VERSION = 2
+_INDEX_EXTENSION = ".pyaedt_index"
+_block_line = re.compile(br"[\t ]*\$(begin|end) '([^\r\n]+)'(?=[ \t]*(?:\r?\n|$))")
+_next_block_line = re.compile(br"\n[\t ]*\$(begin|end) '([^\r\n]+)'(?=[ \t]*(?:\r?\n|$))")
+
+
+class AedtFileIndex(object):
+    """Byte offsets of the blocks of an AEDT file.
+
+    The index is built with a single scan of the file that only looks for the ``$begin`` and
+    ``$end`` lines. Only the first top level block of the file is indexed, which is the block
+    loaded by ``load_entire_aedt_file``. The content of every child of the top level block is
+    hashed, so that the blocks changed by a save can be detected.
+
+    Parameters
+    ----------
+    filename : str
+        AEDT filename with path.
+    max_depth : int, optional
+        Deepest level of the indexed blocks. The top level block is at level ``0``, the designs
+        at level ``1``, ``ModelSetup`` at level ``2``. The default is ``4``.
+    use_cache : bool, optional
+        Whether to reuse and save the index next to the AEDT file. The default is ``True``.
+
+    """
+
+    def __init__(self, filename, max_depth=4, use_cache=True):
+        self.filename = filename
+        self.max_depth = max_depth
+        self.mtime = os.path.getmtime(filename)
+        self.size = os.path.getsize(filename)
+        self.names = []
+        self.starts = []
+        self.stops = []
+        self.parents = []
+        self.levels = []
+        self.hashes = []
+        self.from_cache = False
+        if use_cache and self._read_cache():
+            self.from_cache = True
+        else:
+            self._scan()
+            if use_cache:
+                self._write_cache()
+        self._children = None
+
+    @property
+    def cache_file(self):
+        """Name of the file in which the index is saved."""
+        return self.filename + _INDEX_EXTENSION
+
+    @property
+    def is_up_to_date(self):
+        """Whether the AEDT file is unchanged since it was indexed."""
+        try:
+            return os.path.getmtime(self.filename) == self.mtime and os.path.getsize(self.filename) == self.size
+        except OSError:
+            return False
+
+    def children(self, block):
+        """Indexes of the blocks directly contained in a block.
+
+        Parameters
+        ----------
+        block : int
+            Index of the parent block.
+
+        Returns
+        -------
+        list
+            List of block indexes in file order.
+
+        """
+        if self._children is None:
+            self._children = [[] for _ in self.names]
+            for i, parent in enumerate(self.parents):
+                if parent >= 0:
+                    self._children[parent].append(i)
+        return self._children[block]
+
+    def find(self, keyword):
+        """Index of the first indexed block named ``keyword``.
+
+        Returns
+        -------
+        int
+            Index of the block or ``None`` if the keyword is not in the index.
+
+        """
+        try:
+            return self.names.index(keyword)
+        except ValueError:
+            return None
+
+    def read_block(self, block):
+        """Read the raw bytes of a block.
+
+        Parameters
+        ----------
+        block : int
+            Index of the block.
+
+        Returns
+        -------
+        bytes
+            Content of the block from its ``$begin`` line to its ``$end`` line.
+
+        """
+        with self._open() as aedt_fh:
+            aedt_fh.seek(self.starts[block])
+            return aedt_fh.read(self.stops[block] - self.starts[block])
+
+    def load_block(self, block):
+        """Decode a block.
+
+        Parameters
+        ----------
+        block : int
+            Index of the block.
+
+        Returns
+        -------
+        OrderedDict
+            Dictionary containing the decoded block.
+
+        """
+        with self._open() as aedt_fh:
+            aedt_fh.seek(self.starts[block])
+            return _parse_aedt_stream(aedt_fh)
+
+    def load_header(self, block):
+        """Decode the keys of a block that precede its first child block.
+
+        This is a cheap way to get the ``Name`` of a design without decoding the design.
+
+        Parameters
+        ----------
+        block : int
+            Index of the block.
+
+        Returns
+        -------
+        OrderedDict
+            Dictionary containing the decoded keys.
+
+        """
+        header = OrderedDict()
+        with self._open() as aedt_fh:
+            aedt_fh.seek(self.starts[block])
+            aedt_fh.readline()
+            for line in aedt_fh:
+                line = line.decode("utf-8").rstrip("\r\n").lstrip("\t")
+                if line[:1] == "$" or line[:1] == " ":
+                    if _block_name(line, "$begin '") is not None or _block_name(line, "$end '") is not None:
+                        break
+                _decode_key(line, header)
+        return header
+
+    def load_own_keys(self, block, main_dict):
+        """Decode the keys of a block that do not belong to one of its child blocks.
+
+        Parameters
+        ----------
+        block : int
+            Index of the block.
+        main_dict : OrderedDict
+            Dictionary receiving the keys. The names of the child blocks are inserted with a
+            ``None`` value to keep the order of the file.
+
+        Returns
+        -------
+        OrderedDict
+            ``main_dict``
+
+        """
+        if self.levels[block] >= self.max_depth:
+            raise ValueError("The child blocks of block {} are not indexed.".format(self.names[block]))
+        children = self.children(block)
+        bounds = [self.starts[block]]
+        for child in children:
+            bounds.extend([self.starts[child], self.stops[child]])
+        bounds.append(self.stops[block])
+        with self._open() as aedt_fh:
+            for i in range(0, len(bounds), 2):
+                aedt_fh.seek(bounds[i])
+                segment = aedt_fh.read(bounds[i + 1] - bounds[i])
+                for line in segment.splitlines():
+                    line = line.decode("utf-8").lstrip("\t")
+                    if line[:1] == "$" or line[:1] == " ":
+                        if _block_name(line, "$begin '") is not None or _block_name(line, "$end '") is not None:
+                            continue
+                    _decode_key(line, main_dict)
+                if i // 2 < len(children):
+                    name = self.names[children[i // 2]]
+                    if name not in main_dict:
+                        main_dict[name] = None
+        return main_dict
+
+    def _open(self):
+        if not self.is_up_to_date:
+            raise IOError("File {} has been modified since it was indexed.".format(self.filename))
+        return open(self.filename, "rb")
+
+    def _scan(self):
+        with open(self.filename, "rb") as aedt_fh:
+            if mmap and self.size:
+                data = mmap.mmap(aedt_fh.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = aedt_fh.read()
+            try:
+                self._scan_data(data)
+            finally:
+                if mmap and isinstance(data, mmap.mmap):
+                    data.close()
+
+    def _scan_data(self, data):
+        first = _block_line.match(data)
+        if first:
+            matches = [first]
+            start = first.end()
+        else:
+            matches = []
+            start = 0
+        stack = []  # (name, index or -1 when the block is not indexed)
+        for match in _chain(matches, _next_block_line.finditer(data, start)):
+            name = match.group(2).decode("utf-8")
+            if match.group(1) == b"begin":
+                level = len(stack)
+                if level <= self.max_depth:
+                    offset = match.start() if match is first else match.start() + 1
+                    parent = stack[-1][1] if stack else -1
+                    stack.append((name, len(self.names)))
+                    self.names.append(name)
+                    self.starts.append(offset)
+                    self.stops.append(None)
+                    self.parents.append(parent)
+                    self.levels.append(level)
+                    self.hashes.append(None)
+                else:
+                    stack.append((name, -1))
+            elif stack and stack[-1][0] == name:
+                block = stack.pop()[1]
+                if block >= 0:
+                    stop = data.find(b"\n", match.end())
+                    self.stops[block] = len(data) if stop < 0 else stop + 1
+                    if self.levels[block] == 1:
+                        self.hashes[block] = hashlib.sha1(data[self.starts[block]:self.stops[block]]).hexdigest()
+                if not stack:
+                    break
+        if stack:
+            # truncated file, the open blocks end with the file
+            for name, block in stack:
+                if block >= 0:
+                    self.stops[block] = len(data)
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, "r") as cache_fh:
+                cache = json.load(cache_fh)
+        except (IOError, OSError, ValueError):
+            return False
+        if cache.get("version") != _INDEX_VERSION or cache.get("mtime") != self.mtime or \
+                cache.get("size") != self.size or cache.get("max_depth") != self.max_depth:
+            return False
+        self.names = cache["names"]
+        self.starts = cache["starts"]
+        self.stops = cache["stops"]
+        self.parents = cache["parents"]
+        self.levels = cache["levels"]
+        self.hashes = cache["hashes"]
+        return True
+
+    def _write_cache(self):
+        cache = {"version": _INDEX_VERSION, "mtime": self.mtime, "size": self.size, "max_depth": self.max_depth,
+                 "names": self.names, "starts": self.starts, "stops": self.stops, "parents": self.parents,
+                 "levels": self.levels, "hashes": self.hashes}
+        try:
+            with open(self.cache_file, "w") as cache_fh:
+                json.dump(cache, cache_fh)
+        except (IOError, OSError):
+            pass
+
+
+def _chain(*iterables):
+    for iterable in iterables:
+        for item in iterable:
+            yield item
+
+
+class AedtLazyBlock(Mapping):
+    """Read-only dictionary view of an AEDT block whose child blocks are decoded on first access.
+
+    The keys of the block itself are decoded when the view is created. Every child block is
+    decoded into a regular ``OrderedDict`` the first time it is accessed and then kept.
+
+    Parameters
+    ----------
+    index : AedtFileIndex
+        Index of the AEDT file.
+    block : int
+        Index of the block.
+    previous : AedtLazyBlock, optional
+        View of the same block before the file was saved. Its decoded child blocks whose
+        content hash is unchanged are reused. The default is ``None``.
+
+    """
+
+    def __init__(self, index, block, previous=None):
+        self._index = index
+        self._block = block
+        self._data = index.load_own_keys(block, OrderedDict())
+        self._child_blocks = OrderedDict()
+        for child in index.children(block):
+            self._child_blocks.setdefault(index.names[child], []).append(child)
+        self._decoded = {}
+        self.refreshed_blocks = []
+        if previous is not None:
+            self._reuse(previous)
+
+    @property
+    def name(self):
+        """Name of the block."""
+        return self._index.names[self._block]
+
+    @property
+    def decoded_blocks(self):
+        """Names of the child blocks already decoded."""
+        return [self._index.names[i] for i in self._decoded]
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if key not in self._child_blocks:
+            return value
+        for child in self._child_blocks[key]:
+            decoded = self._decode(child)
+            if value and type(value) is not list:
+                value = [value]
+            if value:
+                value.append(decoded)
+            else:
+                value = decoded
+        self._data[key] = value
+        del self._child_blocks[key]
+        return value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return "AedtLazyBlock({!r})".format(self.name)
+
+    def find_block(self, keyword, key, value):
+        """Decode only the child block named ``keyword`` whose ``key`` equals ``value``.
+
+        Parameters
+        ----------
+        keyword : str
+            Name of the child blocks, for example ``"HFSSModel"``.
+        key : str
+            Key to check, for example ``"Name"``.
+        value :
+            Expected value.
+
+        Returns
+        -------
+        OrderedDict
+            Decoded block or ``None`` if no block matches.
+
+        """
+        if keyword not in self._child_blocks:
+            blocks = self.get(keyword)
+            if type(blocks) is not list:
+                blocks = [blocks]
+            for block in blocks:
+                if isinstance(block, dict) and block.get(key) == value:
+                    return block
+            return None
+        for child in self._child_blocks[keyword]:
+            if child in self._decoded:
+                header = self._decoded[child]
+            else:
+                header = self._index.load_header(child)
+            if header.get(key) == value:
+                return self._decode(child)
+        return None
+
+    def _reuse(self, previous):
+        previous_hashes = set(previous._index.hashes)
+        reusable = {}
+        for child, decoded in previous._decoded.items():
+            content_hash = previous._index.hashes[child]
+            if content_hash:
+                reusable.setdefault(content_hash, []).append(decoded)
+        for child in self._index.children(self._block):
+            content_hash = self._index.hashes[child]
+            if reusable.get(content_hash):
+                self._decoded[child] = reusable[content_hash].pop(0)
+            elif content_hash not in previous_hashes:
+                self.refreshed_blocks.append(self._index.names[child])
+
+    def _decode(self, child):
+        if child not in self._decoded:
+            self._decoded[child] = self._index.load_block(child)[self._index.names[child]]
+        return self._decoded[child]
@@ -3,7 +3,20 @@ import os
 from datetime import datetime
 import math
 import cmath
-from .general_methods import generate_unique_name, aedt_exception_handler
+import io
+import struct
+import warnings
+from .general_methods import generate_unique_name, aedt_exception_handler, LazySolutionDict
+try:
+    import mmap
+except ImportError:
+    mmap = None
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    warnings.warn("The NumPy module is required to read Touchstone files as arrays.\n"
+                  "Install with \n\npip install numpy\n\nRequires CPython")
 REAL_IMAG = 'RI'
 MAG_ANGLE = 'MA'
 DB_ANGLE = 'DB'
@@ -202,7 +215,19 @@ class ParseError(Exception):
 
 
 class TouchstoneData(object):
-    """Data Class containing information from Touchstone Read call"""
+    """Data Class containing information from Touchstone Read call
+
+    Parameters
+    ----------
+    freqs : list
+        Frequencies.
+    matrix : list or numpy.ndarray
+        Either a list containing, for each frequency, the list of the ``nports * nports`` parameters
+        row by row, or a complex array with shape ``(nfreq, nports, nports)``. The array is
+        wrapped without copying.
+    portnames : list
+        Port names.
+    """
 
     def __init__(self, freqs, matrix, portnames):
         self._sweeps_names = ["Freq"]
@@ -214,14 +239,68 @@ class TouchstoneData(object):
                 self.expressions.append("S({},{})".format(el,el1))
 
         self._primary_sweep = "Freq"
+        self.units_data = {}
+        self._expression_index = dict((expression, k) for k, expression in enumerate(self.expressions))
+        if np is not None and isinstance(matrix, np.ndarray):
+            self.data = matrix
+            self.solutions_data_real, self.solutions_data_imag, self.solutions_data_mag = self._solutions_array(matrix)
+            return
+        self.data = None
         self.solutions_data_real, self.solutions_data_imag = self._solutions_data(matrix)
         self.solutions_data_mag = {}
-        self.units_data = {}
         for expr in self.expressions:
             self.solutions_data_mag[expr] = [
                 abs(complex(self.solutions_data_real[expr][i], self.solutions_data_imag[expr][i])) for i in
                 range(len(self.solutions_data_real[expr]))]
 
+    def _solutions_array(self, matrix):
+        """Split a ``(nfreq, nports, nports)`` complex array into per expression views.
+
+        Parameters
+        ----------
+        matrix : numpy.ndarray
+            Complex array of parameters.
+
+        Returns
+        -------
+        tuple
+            Dictionaries of real parts and imaginary parts keyed by expression, and lazy
+            dictionary of magnitudes computed on the first access to each expression.
+
+        """
+        nports = len(self.ports)
+        real_part = matrix.real
+        imag_part = matrix.imag
+        sols_data_real = {}
+        sols_data_imag = {}
+        for k, expression in enumerate(self.expressions):
+            i, j = divmod(k, nports)
+            sols_data_real[expression] = real_part[:, i, j]
+            sols_data_imag[expression] = imag_part[:, i, j]
+        return sols_data_real, sols_data_imag, LazySolutionDict(self.expressions, self._solution_data_mag)
+
+    def _solution_data_mag(self, expression):
+        i, j = divmod(self._expression_index[expression], len(self.ports))
+        return np.abs(self.data[:, i, j])
+
+    def get_expression_indices(self, expressions):
+        """Return the row and column indexes of expressions in the parameters matrix.
+
+        Parameters
+        ----------
+        expressions : list
+            Expressions like ``"S(port1,port2)"``.
+
+        Returns
+        -------
+        tuple
+            ``(rows, cols)`` lists of indexes.
+
+        """
+        nports = len(self.ports)
+        indices = [divmod(self._expression_index[expression], nports) for expression in expressions]
+        return [i[0] for i in indices], [i[1] for i in indices]
+
     def _solutions_data(self, matrix):
         """
 
@@ -541,32 +620,222 @@ def get_worst_curve_from_solution_data(solution_data, freq_min=None, freq_max=No
     """
     if not curve_list:
         curve_list = solution_data.expressions
-    return_loss_freq = solution_data.sweeps["Freq"]
+    lower_id, higher_id = _frequency_range(solution_data.sweeps["Freq"], freq_min, freq_max)
+
+    dict_means = {}
+    if isinstance(solution_data, TouchstoneData) and solution_data.data is not None:
+        # all the means in one reduction over the parameters tensor
+        rows, cols = solution_data.get_expression_indices(curve_list)
+        means = _band_statistics(solution_data.data, lower_id, higher_id, rows, cols)[0]
+        dict_means = dict(zip(curve_list, means.tolist()))
+    else:
+        for el in curve_list:
+            data1 = solution_data.data_magnitude(el)[lower_id:higher_id]
+            mean1 =sum(data1)/len(data1)
+            dict_means[el]= mean1
+    dict_means = dict(sorted(dict_means.items(), key=lambda item: item[1], reverse=worst_is_higher))
+    worst_el = next(iter(dict_means))
+    return worst_el, dict_means
+
+
+def _frequency_range(freqs, freq_min=None, freq_max=None):
+    """Return the first index and the last excluded index of a frequency band.
+
+    Parameters
+    ----------
+    freqs : list
+        Frequencies.
+    freq_min :
+        minimum frequency to analyze (None to 0) (Default value = None)
+    freq_max :
+        maximum frequency to analyze (None to max freq) (Default value = None)
+
+    Returns
+    -------
+    tuple
+        ``(lower_id, higher_id)``
+
+    """
     if not freq_min :
         lower_id = 0
     else:
-        lower_id = next(x[0] for x in enumerate(return_loss_freq) if x[1] >= freq_min)
+        lower_id = next(x[0] for x in enumerate(freqs) if x[1] >= freq_min)
     if not freq_max:
-        higher_id = len(return_loss_freq)-1
+        higher_id = len(freqs)-1
     else:
-        if freq_max>= return_loss_freq[-1]:
-            higher_id = len(return_loss_freq) - 1
+        if freq_max>= freqs[-1]:
+            higher_id = len(freqs) - 1
         else:
-            higher_id = next(x[0] for x in enumerate(return_loss_freq) if x[1] >= freq_max)
+            higher_id = next(x[0] for x in enumerate(freqs) if x[1] >= freq_max)
+    return lower_id, higher_id
 
-    dict_means = {}
-    for el in curve_list:
-        data1 = solution_data.data_magnitude(el)[lower_id:higher_id]
-        mean1 =sum(data1)/len(data1)
-        dict_means[el]= mean1
-    dict_means = dict(sorted(dict_means.items(), key=lambda item: item[1], reverse=worst_is_higher))
-    worst_el = next(iter(dict_means))
-    return worst_el, dict_means
+
+def _band_statistics(data, lower_id, higher_id, rows=None, cols=None, block_size=1000):
+    """Compute the mean, minimum and maximum magnitude of parameters over a frequency band.
+
+    The band is reduced block by block, so that memory maps larger than the memory can be analyzed.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Complex array with shape ``(nfreq, nports, nports)``.
+    lower_id : int
+        First frequency index of the band.
+    higher_id : int
+        Last excluded frequency index of the band.
+    rows : numpy.ndarray, optional
+        Row indexes of the parameters to reduce. The default is ``None``, in which case the full
+        matrix is reduced.
+    cols : numpy.ndarray, optional
+        Column indexes of the parameters to reduce.
+    block_size : int, optional
+        Number of frequencies reduced at once. The default is ``1000``.
+
+    Returns
+    -------
+    tuple
+        ``(mean, minimum, maximum)`` arrays.
+
+    """
+    total = minimum = maximum = None
+    for start in range(lower_id, higher_id, block_size):
+        block = data[start:min(start + block_size, higher_id)]
+        if rows is not None:
+            block = block[:, rows, cols]
+        magnitude = np.abs(block)
+        if total is None:
+            total = magnitude.sum(axis=0)
+            minimum = magnitude.min(axis=0)
+            maximum = magnitude.max(axis=0)
+        else:
+            total += magnitude.sum(axis=0)
+            np.minimum(minimum, magnitude.min(axis=0), out=minimum)
+            np.maximum(maximum, magnitude.max(axis=0), out=maximum)
+    if total is None:
+        raise ValueError("The frequency band is empty.")
+    return total / (higher_id - lower_id), minimum, maximum
+
+
+@aedt_exception_handler
+def get_touchstone_statistics(touchstone_data, tx_ports=None, rx_ports=None, freq_min=None, freq_max=None,
+                              skip_same_index_couples=True):
+    """Compute the return losses, insertion losses, near end and far end crosstalks of a TouchstoneData in one shot.
+
+    The curves are the ones listed by ``get_return_losses``, ``get_insertion_losses_from_lists``,
+    ``get_next_xtalk`` and ``get_fext_xtalk_from_list``. Their magnitude is reduced over the frequency
+    band with NumPy instead of curve by curve.
+
+    Parameters
+    ----------
+    touchstone_data :
+        TouchstoneData object wrapping a NumPy array, as returned by ``read_touchstone``.
+    tx_ports :
+        list of Drivers. None to use all the ports (Default value = None)
+    rx_ports :
+        list of Receivers. Number of Driver = Number of Receiver. None to compute only return losses and
+        near end crosstalks of the drivers (Default value = None)
+    freq_min :
+        minimum frequency to analyze (None to 0) (Default value = None)
+    freq_max :
+        maximum frequency to analyze (None to max freq) (Default value = None)
+    skip_same_index_couples :
+        Boolean ignore TX and RX couple with same index in far end crosstalks (Default value = True)
+
+    Returns
+    -------
+    numpy.ndarray
+        Structured array with one row per curve and the fields ``expression``, ``category``
+        (``"RL"``, ``"IL"``, ``"NEXT"`` or ``"FEXT"``), ``row`` and ``col`` (port indexes), ``mean``,
+        ``min`` and ``max`` (magnitudes over the band).
+
+    """
+    port_index = dict((name, i) for i, name in enumerate(touchstone_data.ports))
+    if tx_ports is None:
+        tx_ports = touchstone_data.ports
+    tx = np.array([port_index[i] for i in tx_ports], dtype=int)
+    rows = [tx]
+    cols = [tx]
+    categories = [np.full(len(tx), "RL")]
+    if rx_ports:
+        if len(rx_ports) != len(tx_ports):
+            raise ValueError("TX and RX should be same length lists")
+        rx = np.array([port_index[i] for i in rx_ports], dtype=int)
+        rows.extend([rx, tx])
+        cols.extend([rx, rx])
+        categories.extend([np.full(len(rx), "RL"), np.full(len(tx), "IL")])
+    first, second = np.triu_indices(len(tx), 1)
+    rows.append(tx[first])
+    cols.append(tx[second])
+    categories.append(np.full(len(first), "NEXT"))
+    if rx_ports:
+        first, second = np.meshgrid(np.arange(len(tx)), np.arange(len(rx)), indexing="ij")
+        first = first.ravel()
+        second = second.ravel()
+        if skip_same_index_couples:
+            keep = first != second
+            first = first[keep]
+            second = second[keep]
+        rows.append(tx[first])
+        cols.append(rx[second])
+        categories.append(np.full(len(first), "FEXT"))
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    lower_id, higher_id = _frequency_range(touchstone_data.sweeps["Freq"], freq_min, freq_max)
+    mean, minimum, maximum = _band_statistics(touchstone_data.data, lower_id, higher_id)
+    ports = touchstone_data.ports
+    expressions = ["S({},{})".format(ports[i], ports[j]) for i, j in zip(rows.tolist(), cols.tolist())]
+    statistics = np.empty(len(rows), dtype=[("expression", "U{}".format(max([len(i) for i in expressions] + [1]))),
+                                            ("category", "U4"), ("row", int), ("col", int), ("mean", float),
+                                            ("min", float), ("max", float)])
+    statistics["expression"] = expressions
+    statistics["category"] = np.concatenate(categories)
+    statistics["row"] = rows
+    statistics["col"] = cols
+    statistics["mean"] = mean[rows, cols]
+    statistics["min"] = minimum[rows, cols]
+    statistics["max"] = maximum[rows, cols]
+    return statistics
+
+
+@aedt_exception_handler
+def get_worst_curves(statistics, category=None, worst_is_higher=True, count=1, key="mean"):
+    """Rank the curves computed by ``get_touchstone_statistics``.
+
+    Parameters
+    ----------
+    statistics :
+        Structured array returned by ``get_touchstone_statistics``.
+    category :
+        ``"RL"``, ``"IL"``, ``"NEXT"`` or ``"FEXT"``. None to rank all curves (Default value = None)
+    worst_is_higher :
+        boolean. if True, the worst curve is the one with higher value (Default value = True)
+    count :
+        number of curves to return. None to return all the ranked curves (Default value = 1)
+    key :
+        field used to rank the curves: ``"mean"``, ``"min"`` or ``"max"`` (Default value = "mean")
+
+    Returns
+    -------
+    numpy.ndarray
+        Rows of ``statistics`` sorted from the worst to the best curve.
+
+    """
+    if category:
+        statistics = statistics[statistics["category"] == category]
+    order = np.argsort(statistics[key], kind="stable")
+    if worst_is_higher:
+        order = order[::-1]
+    if count is not None:
+        order = order[:count]
+    return statistics[order]
 
 
 def read_touchstone(file_path, verbose=False):
     """Load the contents of a Touchstone file into an NPort
 
+    When NumPy is available, the file is read with ``read_touchstone_array`` and the
+    ``TouchstoneData`` wraps the resulting array.
+
     Parameters
     ----------
     file_path :
@@ -580,6 +849,9 @@ def read_touchstone(file_path, verbose=False):
         NPort holding data contained in the Touchstone file
 
     """
+    if np is not None:
+        freqs, matrices, port_names, z0 = read_touchstone_array(file_path, verbose)
+        return TouchstoneData(list(freqs), matrices, port_names)
     re_filename = re.compile(r"\.s(?P<ports>\d+)+p", re.I)
     m = re_filename.search(file_path)
     ports = int(m.group('ports'))
@@ -608,6 +880,392 @@ def read_touchstone(file_path, verbose=False):
     return data
 
 
+def read_touchstone_array(file_path, verbose=False):
+    """Load the contents of a Touchstone file into a complex NumPy array
+
+    The numeric block is read in one pass and the DB, MA and RI formats are converted to complex
+    numbers in one vectorized step.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the Touchstone file.
+    verbose : bool, optional
+        Whether to print the file information. The default is ``False``.
+
+    Returns
+    -------
+    tuple
+        ``(freqs, data, port_names, z0)``, where ``freqs`` is an array of the frequencies in the
+        unit of the option line, ``data`` a complex array with shape ``(nfreq, nports, nports)``,
+        ``port_names`` the list of port names and ``z0`` the reference impedance.
+
+    """
+    re_filename = re.compile(r"\.s(?P<ports>\d+)+p", re.I)
+    m = re_filename.search(file_path)
+    ports = int(m.group('ports'))
+    if verbose:
+        print("File '%s'" % file_path)
+        print("  Number of ports (based on file extension) = %d" % ports)
+    with open(os.path.abspath(file_path), 'r') as file:
+        (frequnit, type, format, z0) = _parse_option_line(file, verbose)
+        text = file.read()
+    port_names = _parse_ports_name_from_text(text, ports)
+    if "[Network Data]" in text:
+        # Touchstone 2.0, only the network data block holds parameters
+        text = text.split("[Network Data]", 1)[1].split("[End]", 1)[0]
+    text = _re_inline_comment.sub("", text)
+    if "[" in text or "#" in text:
+        text = _re_keyword_line.sub("", text)
+    values = np.fromstring(text, sep=" ")
+    freqs, data = _values_to_array(values, ports, format)
+    return freqs, data, port_names, z0
+
+
+def _values_to_array(values, ports, format):
+    """Convert the flat numeric block of a Touchstone file into frequencies and parameters.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Numbers of the data lines, in file order.
+    ports : int
+        Number of ports.
+    format : str
+        ``"RI"``, ``"MA"`` or ``"DB"``.
+
+    Returns
+    -------
+    tuple
+        ``(freqs, data)`` with ``data`` a complex array with shape ``(nfreq, nports, nports)``.
+
+    """
+    sample_size = 1 + 2 * ports * ports
+    if values.size % sample_size:
+        raise ParseError("the number of values does not match {} ports".format(ports))
+    samples = values.reshape(-1, sample_size)
+    return samples[:, 0], _samples_to_parameters(samples, ports, format)
+
+
+def _samples_to_parameters(samples, ports, format, port_indices=None):
+    """Convert frequency samples into complex parameters.
+
+    Parameters
+    ----------
+    samples : numpy.ndarray
+        Array with shape ``(nfreq, 1 + 2 * nports * nports)``, one row per frequency.
+    ports : int
+        Number of ports.
+    format : str
+        ``"RI"``, ``"MA"`` or ``"DB"``.
+    port_indices : list, optional
+        Indexes of the ports to keep. The default is ``None``, in which case all ports are kept.
+
+    Returns
+    -------
+    numpy.ndarray
+        Complex array with shape ``(nfreq, nports, nports)``.
+
+    """
+    pairs = samples[:, 1:].reshape(-1, ports, ports, 2)
+    if ports == 2:
+        # two-port data are stored column by column: N11 N21 N12 N22
+        pairs = pairs.transpose(0, 2, 1, 3)
+    if port_indices is not None:
+        pairs = pairs[:, port_indices][:, :, port_indices]
+    first = pairs[..., 0]
+    second = pairs[..., 1]
+    if format == REAL_IMAG:
+        data = first + 1j * second
+    else:
+        if format == DB_ANGLE:
+            first = 10 ** (first / 20.0)
+        data = first * np.exp(1j * np.deg2rad(second))
+    return np.ascontiguousarray(data)
+
+
+def read_touchstone_header(file_path):
+    """Read the options and the port names of a Touchstone file without reading its data
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the Touchstone file.
+
+    Returns
+    -------
+    tuple
+        ``(port_names, z0, format, data_offset)``, where ``format`` is ``"RI"``, ``"MA"`` or
+        ``"DB"`` and ``data_offset`` is the byte offset of the first data line.
+
+    """
+    ports = int(re.search(r"\.s(?P<ports>\d+)+p", file_path, re.I).group('ports'))
+    header = []
+    offset = 0
+    network_data = False
+    with open(os.path.abspath(file_path), 'rb') as file:
+        for raw in file:
+            line = raw.decode("utf-8", "replace").strip()
+            if line.startswith("[Version]"):
+                network_data = True
+            if network_data:
+                offset += len(raw)
+                header.append(line)
+                if line.startswith("[Network Data]"):
+                    break
+                continue
+            if line and line[0] not in "![#":
+                break
+            offset += len(raw)
+            header.append(line)
+    text = "\n".join(header)
+    if "#" not in text:
+        raise ParseError("option line not found")
+    (frequnit, type, format, z0) = _parse_option_line(io.StringIO(text + "\n"))
+    port_names = _parse_ports_name_from_text(text, ports)
+    return port_names, z0, format, offset
+
+
+def iter_touchstone_blocks(file_path, block_size=1000, ports=None, freq_min=None, freq_max=None,
+                           chunk_size=16777216):
+    """Iterate over the frequency blocks of a Touchstone file without loading the whole file
+
+    The file is memory mapped and parsed chunk by chunk, so that only one block of parameters is
+    held in memory at once.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the Touchstone file.
+    block_size : int, optional
+        Maximum number of frequencies per block. The default is ``1000``.
+    ports : list, optional
+        Names or indexes of the ports to keep. The default is ``None``, in which case all ports
+        are kept.
+    freq_min : float, optional
+        Lowest frequency to keep, in the unit of the option line. The default is ``None``.
+    freq_max : float, optional
+        Highest frequency to keep, in the unit of the option line. The default is ``None``.
+    chunk_size : int, optional
+        Number of bytes parsed at once. The default is 16 MB.
+
+    Returns
+    -------
+    generator
+        ``(freqs, data)`` tuples, where ``data`` is a complex array with shape
+        ``(nfreq, nports, nports)``.
+
+    """
+    port_names, z0, format, offset = read_touchstone_header(file_path)
+    nports = len(port_names)
+    port_indices = _port_indices(port_names, ports)
+    sample_size = 1 + 2 * nports * nports
+    pending = []
+    pending_size = 0
+    for samples in _iter_touchstone_samples(file_path, offset, sample_size, chunk_size):
+        freqs = samples[:, 0]
+        stop = freq_max is not None and freqs[-1] > freq_max
+        mask = None
+        if freq_min is not None:
+            mask = freqs >= freq_min
+        if freq_max is not None:
+            mask = freqs <= freq_max if mask is None else mask & (freqs <= freq_max)
+        if mask is not None:
+            samples = samples[mask]
+        if len(samples):
+            pending.append(samples)
+            pending_size += len(samples)
+        while pending_size >= block_size or (pending_size and stop):
+            samples = np.concatenate(pending) if len(pending) > 1 else pending[0]
+            block, samples = samples[:block_size], samples[block_size:]
+            pending = [samples] if len(samples) else []
+            pending_size = len(samples)
+            yield block[:, 0].copy(), _samples_to_parameters(block, nports, format, port_indices)
+        if stop:
+            return
+    if pending_size:
+        block = np.concatenate(pending)
+        yield block[:, 0].copy(), _samples_to_parameters(block, nports, format, port_indices)
+
+
+def _port_indices(port_names, ports):
+    """Return the indexes of the selected ports or ``None`` to keep all ports."""
+    if ports is None:
+        return None
+    return [port_names.index(port) if port in port_names else int(port) for port in ports]
+
+
+def _iter_touchstone_samples(file_path, offset, sample_size, chunk_size):
+    """Yield arrays of complete frequency samples read from the memory mapped data section."""
+    leftover = np.empty(0)
+    with open(os.path.abspath(file_path), 'rb') as file:
+        size = os.path.getsize(file_path)
+        if size <= offset:
+            return
+        if mmap:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = file.read()
+        try:
+            pos = offset
+            while pos < size:
+                end = min(pos + chunk_size, size)
+                if end < size:
+                    # parse whole lines only, extending the chunk when a line is longer than it
+                    newline = data.rfind(b"\n", pos, end)
+                    if newline < 0:
+                        newline = data.find(b"\n", end)
+                    end = newline + 1 if newline >= 0 else size
+                text = data[pos:end].decode("utf-8", "replace")
+                pos = end
+                last = "[End]" in text
+                if last:
+                    text = text.split("[End]", 1)[0]
+                text = _re_inline_comment.sub("", text)
+                if "[" in text or "#" in text:
+                    text = _re_keyword_line.sub("", text)
+                if not text.strip():
+                    # np.fromstring does not return an empty array for blank text
+                    if last:
+                        break
+                    continue
+                values = np.fromstring(text, sep=" ")
+                if leftover.size:
+                    values = np.concatenate((leftover, values))
+                count = values.size // sample_size
+                leftover = values[count * sample_size:]
+                if count:
+                    yield values[:count * sample_size].reshape(count, sample_size)
+                if last:
+                    break
+        finally:
+            if mmap and isinstance(data, mmap.mmap):
+                data.close()
+    if leftover.size:
+        raise ParseError("the number of values does not match {} ports".format(int(((sample_size - 1) / 2) ** 0.5)))
+
+
+def touchstone_to_npy(file_path, cache_file=None, block_size=1000, ports=None, freq_min=None, freq_max=None):
+    """Convert a Touchstone file into a NumPy cache that can be memory mapped
+
+    The parameters are streamed into a ``.npy`` file, block by block, so the conversion never
+    holds the full data in memory. The frequencies, the port names and the reference impedance
+    are saved in a ``.npz`` file with the same base name.
+
+    Parameters
+    ----------
+    file_path : str
+        Full path to the Touchstone file.
+    cache_file : str, optional
+        Full path to the ``.npy`` file to write. The default is ``None``, in which case the
+        Touchstone file path with the ``.npy`` extension is used.
+    block_size : int, optional
+        Number of frequencies converted at once. The default is ``1000``.
+    ports : list, optional
+        Names or indexes of the ports to keep. The default is ``None``.
+    freq_min : float, optional
+        Lowest frequency to keep, in the unit of the option line. The default is ``None``.
+    freq_max : float, optional
+        Highest frequency to keep, in the unit of the option line. The default is ``None``.
+
+    Returns
+    -------
+    str
+        Full path to the ``.npy`` file.
+
+    """
+    if not cache_file:
+        cache_file = os.path.splitext(file_path)[0] + ".npy"
+    port_names, z0, format, offset = read_touchstone_header(file_path)
+    if ports is not None:
+        port_names = [port_names[i] for i in _port_indices(port_names, ports)]
+    freqs = []
+    nfreq = 0
+    with open(cache_file, "wb") as npy:
+        npy.write(_npy_header((0, len(port_names), len(port_names))))
+        for block_freqs, block in iter_touchstone_blocks(file_path, block_size, ports, freq_min, freq_max):
+            block.astype(np.complex128).tofile(npy)
+            freqs.append(block_freqs)
+            nfreq += len(block_freqs)
+        npy.seek(0)
+        npy.write(_npy_header((nfreq, len(port_names), len(port_names))))
+    freqs = np.concatenate(freqs) if freqs else np.empty(0)
+    np.savez(os.path.splitext(cache_file)[0] + ".npz", freqs=freqs, port_names=np.array(port_names), z0=z0)
+    return cache_file
+
+
+def load_touchstone_cache(cache_file):
+    """Load a cache written by ``touchstone_to_npy`` without reading the parameters
+
+    Parameters
+    ----------
+    cache_file : str
+        Full path to the ``.npy`` file.
+
+    Returns
+    -------
+    tuple
+        ``(freqs, data, port_names, z0)``, where ``data`` is a read-only memory map with shape
+        ``(nfreq, nports, nports)``. ``TouchstoneData(list(freqs), data, port_names)`` wraps it
+        without loading it.
+
+    """
+    data = np.load(cache_file, mmap_mode="r")
+    with np.load(os.path.splitext(cache_file)[0] + ".npz") as meta:
+        freqs = meta["freqs"]
+        port_names = [str(i) for i in meta["port_names"]]
+        z0 = float(meta["z0"])
+    return freqs, data, port_names, z0
+
+
+def _npy_header(shape):
+    """Return a ``.npy`` version 1.0 header of fixed size for a complex array of this shape."""
+    header = "{{'descr': '{}', 'fortran_order': False, 'shape': {}, }}".format(
+        np.lib.format.dtype_to_descr(np.dtype(np.complex128)), repr(tuple(shape)))
+    header = header.ljust(_NPY_HEADER_SIZE - 11) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+_NPY_HEADER_SIZE = 128
+
+
+def _parse_ports_name_from_text(text, ports):
+    """Return the port names of the ``! Port[n] = name`` comment lines preceding the data.
+
+    Parameters
+    ----------
+    text : str
+        Content of the Touchstone file after the option line.
+    ports : int
+        Number of ports, used to name the ports when the file does not.
+
+    Returns
+    -------
+    list
+        Port names.
+
+    """
+    port_names = []
+    start = 0
+    while start < len(text):
+        stop = text.find("\n", start)
+        if stop < 0:
+            stop = len(text)
+        line = text[start:stop].strip()
+        start = stop + 1
+        if line and line[0] not in "![#":
+            break
+        m = _re_port_name.search(line)
+        if m:
+            port_names.append(m.group(1).strip())
+    if len(port_names) != ports:
+        port_names = [str(i + 1) for i in range(ports)]
+    return port_names
+
+
+_re_inline_comment = re.compile(r"![^\n]*")
+_re_keyword_line = re.compile(r"^\s*[#\[][^\n]*", re.M)
+_re_port_name = re.compile(r"^!\s*Port\[\d+\]\s*=\s*(.+)$")
 _re_comment = re.compile(r"^\s*!")
 _re_options = re.compile(r"^\s*#")
 _re_empty = re.compile(r"^\s*$")
@@ -8,6 +8,10 @@ import traceback
 import logging
 from functools import wraps
 from collections import OrderedDict
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 import inspect
 import itertools
 logger = logging.getLogger(__name__)
@@ -20,6 +24,45 @@ class MethodNotSupportedError(Exception):
     """ """
     pass
 
+
+class LazySolutionDict(Mapping):
+    """Dictionary of solution data computed on the first access to each key and then memoized.
+
+    Parameters
+    ----------
+    keys : list
+        Keys of the dictionary, usually the expressions.
+    loader :
+        Function returning the value of a key.
+    """
+    def __init__(self, keys, loader):
+        self._keys = list(keys)
+        self._key_set = set(self._keys)
+        self._loader = loader
+        self._values = {}
+
+    @property
+    def loaded_keys(self):
+        """Keys already computed."""
+        return [i for i in self._keys if i in self._values]
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            if key not in self._key_set:
+                raise KeyError(key)
+            self._values[key] = self._loader(key)
+        return self._values[key]
+
+    def __contains__(self, key):
+        return key in self._key_set
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
 def _write_mes(mes_text, print_on_desktop=False):
     if os.getenv('PYAEDT_SCREEN_LOGS', 'True').lower() in ('true', '1', 't'):
         print(mes_text)
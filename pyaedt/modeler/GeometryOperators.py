@@ -1,8 +1,42 @@
 # -*- coding: utf-8 -*-
 from ..generic.general_methods import aedt_exception_handler
 from .modeler_constants import CoordinateSystemPlane, CoordinateSystemAxis, SweepDraftType
+from ..application.Variables import unit_registry
 import math
-import re
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _atan2(y, x):
+    eps = 7./3. - 4./3. - 1.
+    if abs(y) < eps:
+        y = 0.0
+    if abs(x) < eps:
+        x = 0.0
+    return math.atan2(y, x)
+
+
+def _atan2_array(y, x):
+    eps = 7./3. - 4./3. - 1.
+    y = np.where(np.abs(y) < eps, 0.0, y)
+    x = np.where(np.abs(x) < eps, 0.0, x)
+    return np.arctan2(y, x)
+
+
+def _as_array(a):
+    return np.asarray(a, dtype=float)
+
+
+def _q_rotation(v, q0, q1, q2, q3):
+    # w = (q0^2 - |q'|^2)v + 2(q' . v)q' + 2q0(q' x v), with scalars or arrays
+    c1 = q0*q0 - (q1*q1 + q2*q2 + q3*q3)
+    c2 = 2. * (q1*v[0] + q2*v[1] + q3*v[2])
+    c3 = 2. * q0
+    return [c1*v[0] + (c2*q1 + c3*(q2*v[2] - q3*v[1])),
+            c1*v[1] + (c2*q2 + c3*(q3*v[0] - q1*v[2])),
+            c1*v[2] + (c2*q3 + c3*(q1*v[1] - q2*v[0]))]
 
 
 class GeometryOperators(object):
@@ -67,31 +101,6 @@ class GeometryOperators(object):
         2.0
         
         """
-        scaling = {
-            "m": 1.0,
-            "meter": 1.0,
-            "meters": 1.0,
-            "dm": 0.1,
-            "cm": 1e-2,
-            "mm": 1e-3,
-            "um": 1e-6,
-            "nm": 1e-9,
-            "in": 2.54e-2,
-            "mil": 2.54e-5,
-            "uin": 2.54e-8,
-            "ft": 3.048e-1,
-            "s": 1.0,
-            "sec": 1.0,
-            "ms": 1e-3,
-            "us": 1e-6,
-            "ns": 1e-9,
-            "Hz": 1.0,
-            "kHz": 1e3,
-            "MHz": 1e6,
-            "GHz": 1e9,
-            "THz": 1e12
-        }
-
         if type(string) is not str:
             try:
                 return float(string)
@@ -99,30 +108,24 @@ class GeometryOperators(object):
                 raise TypeError("Input argument is not string nor number")
 
         if scale_to_unit:
-            try:
-                sunit = scaling[scale_to_unit]
-            except KeyError as e:
-                raise e
+            sunit = unit_registry.dimension_units[scale_to_unit]
         else:
             sunit = 1.
 
-        pattern = r"(?P<number>[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?)\s*(?P<unit>[a-zA-Z]*)"
-        m = re.search(pattern, string)
-
-        if m:
-            if not m.group("unit"):
-                return float(m.group("number"))
-            elif m.group("unit") == 'deg':
-                return GeometryOperators.deg2rad(float(m.group("number")))
-            elif m.group("unit") == 'rad':
-                return float(m.group("number"))
+        parsed = unit_registry.parse_dimension(string)
+
+        if parsed:
+            number, unit, scaling_factor = parsed
+            if not unit:
+                return number
+            elif unit == 'deg':
+                return GeometryOperators.deg2rad(number)
+            elif unit == 'rad':
+                return number
+            elif scaling_factor is None:
+                raise KeyError(unit)
             else:
-                try:
-                    scaling_factor = scaling[m.group("unit")]
-                except KeyError as e:
-                    raise e
-                else:
-                    return float(m.group("number")) * scaling_factor / sunit
+                return number * scaling_factor / sunit
         else:
             raise TypeError("String is no number")
 
@@ -267,6 +270,30 @@ class GeometryOperators(object):
              a[2] * b[0] - a[0] * b[2],
              a[0] * b[1] - a[1] * b[0]]
         return c
+
+    @staticmethod
+    def v_cross_array(a, b):
+        """Evaluate the cross products of arrays of geometry vectors.
+
+        This is the batched version of :func:`GeometryOperators.v_cross`.
+
+        Parameters
+        ----------
+        a : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)`` or ``(3,)``.
+        b : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)`` or ``(3,)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[x, y, z]`` coordinates for the result vectors.
+        """
+        a = _as_array(a)
+        b = _as_array(b)
+        return np.stack(np.broadcast_arrays(a[..., 1] * b[..., 2] - a[..., 2] * b[..., 1],
+                                            a[..., 2] * b[..., 0] - a[..., 0] * b[..., 2],
+                                            a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]), axis=-1)
     
     @staticmethod
     @aedt_exception_handler
@@ -307,7 +334,29 @@ class GeometryOperators(object):
             Result of the dot product.
         
         """
-        return GeometryOperators._v_dot(a, b)
+        return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+    @staticmethod
+    def v_dot_array(a, b):
+        """Evaluate the dot products of arrays of geometry vectors.
+
+        This is the batched version of :func:`GeometryOperators.v_dot`.
+
+        Parameters
+        ----------
+        a : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)`` or ``(3,)``.
+        b : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)`` or ``(3,)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(N,)`` with the results of the dot products.
+        """
+        a = _as_array(a)
+        b = _as_array(b)
+        return a[..., 0] * b[..., 0] + a[..., 1] * b[..., 1] + a[..., 2] * b[..., 2]
 
     @staticmethod
     @aedt_exception_handler
@@ -396,6 +445,25 @@ class GeometryOperators(object):
         """
         m = (a[0]**2 + a[1]**2 + a[2]**2) ** 0.5
         return m
+
+    @staticmethod
+    def v_norm_array(a):
+        """Evaluate the Euclidean norms of an array of geometry vectors.
+
+        This is the batched version of :func:`GeometryOperators.v_norm`.
+
+        Parameters
+        ----------
+        a : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(N,)`` with the norms.
+        """
+        a = _as_array(a)
+        return (a[..., 0]**2 + a[..., 1]**2 + a[..., 2]**2) ** 0.5
     
     @staticmethod
     @aedt_exception_handler
@@ -414,9 +482,28 @@ class GeometryOperators(object):
         
         """
         # normalize a vector to its norm
-        norm = GeometryOperators.v_norm(v)
+        norm = (v[0]**2 + v[1]**2 + v[2]**2) ** 0.5
         vn = [i/norm for i in v]
         return vn
+
+    @staticmethod
+    def normalize_vector_array(v):
+        """Normalize an array of geometry vectors.
+
+        This is the batched version of :func:`GeometryOperators.normalize_vector`.
+
+        Parameters
+        ----------
+        v : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(N, 3)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[x, y, z]`` coordinates for the normalized vectors.
+        """
+        v = _as_array(v)
+        return v / GeometryOperators.v_norm_array(v)[..., None]
     
     @staticmethod
     @aedt_exception_handler
@@ -750,17 +837,50 @@ class GeometryOperators(object):
         z2 = z[1]
         z3 = z[2]
         if z == [0, 0, 1]:
-            phi = GeometryOperators.atan2(x2, x1)
+            phi = _atan2(x2, x1)
             theta = 0.
             psi = 0.
         elif z == [0, 0, -1]:
-            phi = GeometryOperators.atan2(x2, x1)
+            phi = _atan2(x2, x1)
             theta = math.pi
             psi = 0.
         else:
-            phi = GeometryOperators.atan2(z1, -z2)
+            phi = _atan2(z1, -z2)
             theta = math.acos(z3)
-            psi = GeometryOperators.atan2(x3, y3)
+            psi = _atan2(x3, y3)
+        return phi, theta, psi
+
+    @staticmethod
+    def axis_to_euler_zxz_array(x, y, z):
+        """Find the Euler angles of an array of frames, following the rotation sequence ZXZ.
+
+        This is the batched version of :func:`GeometryOperators.axis_to_euler_zxz`.
+
+        Parameters
+        ----------
+        x : numpy.ndarray or list
+            Array of ``[Xx, Xy, Xz]`` coordinates for the X axes with shape ``(N, 3)``.
+        y : numpy.ndarray or list
+            Array of ``[Yx, Yy, Yz]`` coordinates for the Y axes with shape ``(N, 3)``.
+        z : numpy.ndarray or list
+            Array of ``[Zx, Zy, Zz]`` coordinates for the Z axes with shape ``(N, 3)``.
+
+        Returns
+        -------
+        tuple
+            (phi, theta, psi) arrays containing the Euler angles in radians.
+        """
+        x = _as_array(x)
+        y = _as_array(y)
+        z = _as_array(z)
+        up = (z[..., 0] == 0) & (z[..., 1] == 0) & (z[..., 2] == 1)
+        down = (z[..., 0] == 0) & (z[..., 1] == 0) & (z[..., 2] == -1)
+        lock = up | down
+        with np.errstate(invalid="ignore"):
+            theta = np.arccos(z[..., 2])
+        phi = np.where(lock, _atan2_array(x[..., 1], x[..., 0]), _atan2_array(z[..., 0], -z[..., 1]))
+        theta = np.where(up, 0., np.where(down, math.pi, theta))
+        psi = np.where(lock, 0., _atan2_array(x[..., 2], y[..., 2]))
         return phi, theta, psi
 
     @staticmethod
@@ -1082,12 +1202,7 @@ class GeometryOperators(object):
             atan2(y, x)
         
         """
-        eps = 7./3. - 4./3. - 1.
-        if abs(y) < eps:
-            y = 0.0
-        if abs(x) < eps:
-            x = 0.0
-        return math.atan2(y, x)
+        return _atan2(y, x)
 
     @staticmethod
     @aedt_exception_handler
@@ -1114,19 +1229,42 @@ class GeometryOperators(object):
             List of [r1, r2, r3, r4] coordinates for the result quaternion.
         
         """
-        p0 = p[0]
-        pv = p[1:4]
-        q0 = q[0]
-        qv = q[1:4]
+        p0, p1, p2, p3 = p[0], p[1], p[2], p[3]
+        q0, q1, q2, q3 = q[0], q[1], q[2], q[3]
+
+        r0 = p0 * q0 - (p1 * q1 + p2 * q2 + p3 * q3)
+        r1 = p0 * q1 + (q0 * p1 + (p2 * q3 - p3 * q2))
+        r2 = p0 * q2 + (q0 * p2 + (p3 * q1 - p1 * q3))
+        r3 = p0 * q3 + (q0 * p3 + (p1 * q2 - p2 * q1))
+
+        return [r0, r1, r2, r3]
 
-        r0 = p0 * q0 - GeometryOperators.v_dot(pv, qv)
+    @staticmethod
+    def q_prod_array(p, q):
+        """Evaluate the products of arrays of quaternions.
+
+        This is the batched version of :func:`GeometryOperators.q_prod`.
 
-        t1 = GeometryOperators.v_prod(p0, qv)
-        t2 = GeometryOperators.v_prod(q0, pv)
-        t3 = GeometryOperators.v_cross(pv, qv)
-        rv = GeometryOperators.v_sum(t1, GeometryOperators.v_sum(t2, t3))
+        Parameters
+        ----------
+        p : numpy.ndarray or list
+            Array of ``[p1, p2, p3, p4]`` coordinates with shape ``(N, 4)`` or ``(4,)``.
+        q : numpy.ndarray or list
+            Array of ``[q1, q2, q3, q4]`` coordinates with shape ``(N, 4)`` or ``(4,)``.
 
-        return [r0, rv[0], rv[1], rv[2]]
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[r1, r2, r3, r4]`` coordinates for the result quaternions.
+        """
+        p = _as_array(p)
+        q = _as_array(q)
+        p0, p1, p2, p3 = p[..., 0], p[..., 1], p[..., 2], p[..., 3]
+        q0, q1, q2, q3 = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+        return np.stack(np.broadcast_arrays(p0 * q0 - (p1 * q1 + p2 * q2 + p3 * q3),
+                                            p0 * q1 + (q0 * p1 + (p2 * q3 - p3 * q2)),
+                                            p0 * q2 + (q0 * p2 + (p3 * q1 - p1 * q3)),
+                                            p0 * q3 + (q0 * p3 + (p1 * q2 - p2 * q1))), axis=-1)
 
     @staticmethod
     @aedt_exception_handler
@@ -1153,21 +1291,31 @@ class GeometryOperators(object):
             List of ``[w1, w2, w3]`` coordinates for the result vector ``w``.
         
         """
-        q0 = q[0]
-        qv = q[1:4]
-
-        c1 = q0*q0 - (qv[0]*qv[0] + qv[1]*qv[1] + qv[2]*qv[2])
-        t1 = GeometryOperators.v_prod(c1, v)
+        return _q_rotation(v, q[0], q[1], q[2], q[3])
 
-        c2 = 2. * GeometryOperators.v_dot(qv, v)
-        t2 = GeometryOperators.v_prod(c2, qv)
+    @staticmethod
+    def q_rotation_array(v, q):
+        """Evaluate the rotation of an array of vectors defined by quaternions.
 
-        t3 = GeometryOperators.v_cross(qv, v)
-        t4 = GeometryOperators.v_prod(2. * q0, t3)
+        This is the batched version of :func:`GeometryOperators.q_rotation`.
 
-        w = GeometryOperators.v_sum(t1, GeometryOperators.v_sum(t2, t4))
+        Parameters
+        ----------
+        v : numpy.ndarray or list
+            Array of ``[v1, v2, v3]`` coordinates with shape ``(N, 3)``.
+        q : numpy.ndarray or list
+            Quaternion ``[q1, q2, q3, q4]`` applied to all the vectors or
+            array of quaternions with shape ``(N, 4)``.
 
-        return w
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[w1, w2, w3]`` coordinates for the result vectors.
+        """
+        v = _as_array(v)
+        q = _as_array(q)
+        return np.stack(np.broadcast_arrays(*_q_rotation((v[..., 0], v[..., 1], v[..., 2]),
+                                                         q[..., 0], q[..., 1], q[..., 2], q[..., 3])), axis=-1)
 
     @staticmethod
     @aedt_exception_handler
@@ -1194,8 +1342,31 @@ class GeometryOperators(object):
             List of ``[w1, w2, w3]`` coordinates for the vector.
         
         """
-        q1 = [q[0], -q[1], -q[2], -q[3]]
-        return GeometryOperators.q_rotation(v, q1)
+        return _q_rotation(v, q[0], -q[1], -q[2], -q[3])
+
+    @staticmethod
+    def q_rotation_inv_array(v, q):
+        """Evaluate the inverse rotation of an array of vectors defined by quaternions.
+
+        This is the batched version of :func:`GeometryOperators.q_rotation_inv`.
+
+        Parameters
+        ----------
+        v : numpy.ndarray or list
+            Array of ``[v1, v2, v3]`` coordinates with shape ``(N, 3)``.
+        q : numpy.ndarray or list
+            Quaternion ``[q1, q2, q3, q4]`` applied to all the vectors or
+            array of quaternions with shape ``(N, 4)``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[w1, w2, w3]`` coordinates for the result vectors.
+        """
+        v = _as_array(v)
+        q = _as_array(q)
+        return np.stack(np.broadcast_arrays(*_q_rotation((v[..., 0], v[..., 1], v[..., 2]),
+                                                         q[..., 0], -q[..., 1], -q[..., 2], -q[..., 3])), axis=-1)
 
     @staticmethod
     @aedt_exception_handler
@@ -1229,3 +1400,32 @@ class GeometryOperators(object):
         zc = sz / sl2
 
         return [xc, yc, zc]
+
+    @staticmethod
+    def get_polygon_centroid_array(pts):
+        """Evaluate the centroids of polygons defined by their points.
+
+        This is the batched version of :func:`GeometryOperators.get_polygon_centroid`.
+
+        Parameters
+        ----------
+        pts : numpy.ndarray or list
+            Array of ``[x, y, z]`` coordinates with shape ``(M, 3)`` for one polygon
+            or ``(N, M, 3)`` for ``N`` polygons with ``M`` points each.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``[x, y, z]`` coordinates for the centroids.
+        """
+        p1 = _as_array(pts)
+        p0 = np.roll(p1, 1, axis=-2)
+        x0, y0, z0 = p0[..., 0], p0[..., 1], p0[..., 2]
+        x1, y1, z1 = p1[..., 0], p1[..., 1], p1[..., 2]
+        L = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
+        L2 = ((z1 - z0) ** 2 + (x1 - x0) ** 2) ** 0.5
+        sl = L.sum(axis=-1)
+        sl2 = L2.sum(axis=-1)
+        return np.stack([((x0 + x1) / 2 * L).sum(axis=-1) / sl,
+                         ((y0 + y1) / 2 * L).sum(axis=-1) / sl,
+                         ((z0 + z1) / 2 * L2).sum(axis=-1) / sl2], axis=-1)
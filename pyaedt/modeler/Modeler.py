@@ -550,6 +550,27 @@ class GeometryModeler(Modeler, object):
         return self._parent.materials
 
 
+    def batch(self):
+        """Create objects in a batch.
+
+        The objects created inside the ``with`` block are registered together when
+        the block exits. See :func:`pyaedt.modeler.Primitives.Primitives.batch`.
+
+        Returns
+        -------
+        :class:`pyaedt.modeler.Primitives.PrimitivesBatch`
+            Context manager returning the primitives.
+
+        Examples
+        --------
+        >>> from pyaedt import Hfss
+        >>> hfss = Hfss()
+        >>> with hfss.modeler.batch() as primitives:
+        ...     for i in range(100):
+        ...         primitives.create_cylinder("Z", [2 * i, 0, 0], 0.2, 1, name="Via{}".format(i))
+        """
+        return self.primitives.batch()
+
     @aedt_exception_handler
     def _convert_list_to_ids(self,input_list, convert_objects_ids_to_name=True):
         """Convert a list to IDs.
@@ -674,6 +695,7 @@ class GeometryModeler(Modeler, object):
                 "Units:=", units,
                 "Rescale:=", False
             ])
+        self.primitives._batch_model_units = None
 
     @property
     def selections(self):
@@ -1330,6 +1352,8 @@ class GeometryModeler(Modeler, object):
     def get_objects_in_group(self, group):
         """Retrieve a list of objects belonging to a group.
 
+        The list read from AEDT is reused until the groups or the objects change.
+
         Parameters
         ----------
         group : str
@@ -1343,10 +1367,10 @@ class GeometryModeler(Modeler, object):
         """
         if type(group) is not str:
             raise ValueError('Group name must be a string')
-        group_objs = list(self.oeditor.GetObjectsInGroup(group))
+        group_objs = self.primitives._get_objects_in_group(group)
         if not group_objs:
             return None
-        return group_objs
+        return list(group_objs)
 
     @aedt_exception_handler
     def get_group_bounding_box(self, group):
@@ -1365,18 +1389,17 @@ class GeometryModeler(Modeler, object):
         """
         if type(group) is not str:
             raise ValueError('Group name must be a string')
-        group_objs = list(self.oeditor.GetObjectsInGroup(group))
+        group_objs = self.primitives._get_objects_in_group(group)
         if not group_objs:
             return None
-        all_objs = self.primitives.object_names
-        objs_to_unmodel = [i for i in all_objs if i not in group_objs]
-        if objs_to_unmodel:
-            vArg1 = ["NAME:Model", "Value:=", False]
-            self.primitives._change_geometry_property(vArg1, objs_to_unmodel)
-            bounding = self.get_model_bounding_box()
-            self.odesign.Undo()
-        else:
-            bounding = self.get_model_bounding_box()
+        group_objs = [i for i in group_objs if self.primitives[i] and self.primitives[i].model]
+        if not group_objs:
+            return None
+        boxes = list(self.primitives.get_bounding_boxes(group_objs).values())
+        if not boxes:
+            return None
+        bounding = [min(box[i] for box in boxes) for i in range(3)]
+        bounding += [max(box[i] for box in boxes) for i in range(3, 6)]
         return bounding
 
     @aedt_exception_handler
@@ -1442,6 +1465,7 @@ class GeometryModeler(Modeler, object):
         """
         planes = {0: "XY", 1: "YZ", 2: "ZX"}
         selections = self.convert_to_selections(objects)
+        self.primitives.invalidate_geometry(selections)
         self.oeditor.Split(
             [
                 "NAME:Selections",
@@ -1482,6 +1506,7 @@ class GeometryModeler(Modeler, object):
 
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
         Xpos, Ypos, Zpos = self.primitives._pos_with_arg(position)
         Xnorm, Ynorm, Znorm = self.primitives._pos_with_arg(vector)
 
@@ -1519,6 +1544,7 @@ class GeometryModeler(Modeler, object):
 
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
         Xpos, Ypos, Zpos = self.primitives._pos_with_arg(position)
         Xnorm, Ynorm, Znorm = self.primitives._pos_with_arg(vector)
 
@@ -1558,6 +1584,7 @@ class GeometryModeler(Modeler, object):
         
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:DuplicateAroundAxisParameters", "CreateNewObjects:=", create_new_objects, "WhichAxis:=",
@@ -1597,6 +1624,7 @@ class GeometryModeler(Modeler, object):
         
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
         Xpos, Ypos, Zpos = self.primitives._pos_with_arg(vector)
 
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
@@ -1631,6 +1659,7 @@ class GeometryModeler(Modeler, object):
         
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:SheetThickenParameters"]
@@ -1660,6 +1689,7 @@ class GeometryModeler(Modeler, object):
         
         """
         selections = self.convert_to_selections(obj_name)
+        self.primitives.invalidate_geometry(selections)
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:Parameters"]
         vArg2.append(["NAME:SweepFaceAlongNormalToParameters", "FacesToDetach:=", [face_id], "LengthOfSweep:=",
@@ -1700,6 +1730,7 @@ class GeometryModeler(Modeler, object):
             
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
         vectorx, vectory, vectorz = self.primitives._pos_with_arg(sweep_vector)
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:VectorSweepParameters"]
@@ -1740,6 +1771,7 @@ class GeometryModeler(Modeler, object):
         
         """
         selections = self.convert_to_selections(objid) + "," + self.convert_to_selections(sweep_object)
+        self.primitives.invalidate_geometry(selections)
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:PathSweepParameters"]
         vArg2.append('DraftAngle:='), vArg2.append(self.primitives._arg_with_dim(draft_angle, 'deg'))
@@ -1771,6 +1803,7 @@ class GeometryModeler(Modeler, object):
 
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
 
 
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
@@ -1815,6 +1848,7 @@ class GeometryModeler(Modeler, object):
             return False
 
         selections = self.convert_to_selections(object_list)
+        self.primitives.invalidate_geometry(selections)
 
         self.oeditor.Section(
             [
@@ -1849,6 +1883,7 @@ class GeometryModeler(Modeler, object):
 
         """
         selections = self.convert_to_selections(object_list)
+        self.primitives.invalidate_geometry(selections)
         self.oeditor.SeparateBody(["NAME:Selections", "Selections:=", selections,
                                    "NewPartsModelFlag:=", "Model"], ["CreateGroupsForNewObjects:=", create_group])
         self.primitives.refresh_all_ids()
@@ -1879,6 +1914,7 @@ class GeometryModeler(Modeler, object):
 
         """
         selections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(selections)
         vArg1 = ['NAME:Selections', 'Selections:=', selections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ["NAME:RotateParameters"]
         vArg2.append('RotateAxis:='), vArg2.append(GeometryOperators.cs_axis_str(cs_axis))
@@ -1911,6 +1947,7 @@ class GeometryModeler(Modeler, object):
 
         """
         szList = self.convert_to_selections(blank_list)
+        self.primitives.invalidate_geometry(szList)
         szList1 = self.convert_to_selections(tool_list)
 
         vArg1 = ['NAME:Selections', 'Blank Parts:=', szList, 'Tool Parts:=', szList1]
@@ -1942,6 +1979,8 @@ class GeometryModeler(Modeler, object):
         vArg1 = ["NAME:Selections", "Selections:=", szList, "NewPartsModelFlag:=", "Model"]
 
         self.oeditor.PurgeHistory(vArg1)
+        self.primitives.invalidate_geometry(szList)
+        self.primitives.register_change()
         return True
 
     @aedt_exception_handler
@@ -1975,6 +2014,7 @@ class GeometryModeler(Modeler, object):
 
         """
         szSelections = self.convert_to_selections(theList)
+        self.primitives.invalidate_geometry(szSelections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', szSelections]
         vArg2 = ['NAME:UniteParameters', 'KeepOriginals:=', False]
@@ -2027,6 +2067,7 @@ class GeometryModeler(Modeler, object):
         """
         unclassified = list(self.oeditor.GetObjectsInGroup("Unclassified"))
         szSelections = self.convert_to_selections(theList)
+        self.primitives.invalidate_geometry(szSelections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', szSelections]
         vArg2 = ["NAME:IntersectParameters", "KeepOriginals:=", keeporiginal]
@@ -2058,6 +2099,7 @@ class GeometryModeler(Modeler, object):
         """
         unclassified_before = list(self.primitives.unclassified_names)
         szSelections = self.convert_to_selections(theList)
+        self.primitives.invalidate_geometry(szSelections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', szSelections]
 
@@ -2091,6 +2133,7 @@ class GeometryModeler(Modeler, object):
         """
         Xvec, Yvec, Zvec = self.primitives._pos_with_arg(vector)
         szSelections = self.convert_to_selections(objid)
+        self.primitives.invalidate_geometry(szSelections)
 
         vArg1 = ['NAME:Selections', 'Selections:=', szSelections, 'NewPartsModelFlag:=', 'Model']
         vArg2 = ['NAME:TranslateParameters']
@@ -2268,6 +2311,7 @@ class GeometryModeler(Modeler, object):
             RenameArgs["Old Name"] = name
             RenameArgs["New Name"] = name.replace(CADSuffix, '')
             self.oeditor.RenamePart(RenameArgs)
+        self.primitives.register_change()
         return True
 
     @aedt_exception_handler
@@ -2536,6 +2580,7 @@ class GeometryModeler(Modeler, object):
         arg2.append(arg3)
         arg.append(arg2)
         self.oeditor.ChangeProperty(arg)
+        self.primitives.invalidate_geometry("Region")
         return True
 
     @aedt_exception_handler
@@ -2924,13 +2969,9 @@ class GeometryModeler(Modeler, object):
             Name of the edge if it exists, ``False`` otherwise.
         
         """
-        for object in list(self.primitives.object_id_dict.keys()):
-            try:
-                oEdgeIDs = self.oeditor.GetEdgeIDsFromObject(object)
-                if str(edge_id) in oEdgeIDs:
-                    return object
-            except:
-                return False
+        object_name = self.primitives._find_object_from_edge_id(edge_id)
+        if object_name:
+            return object_name
         return False
 
     @aedt_exception_handler
@@ -3042,6 +3083,7 @@ class GeometryModeler(Modeler, object):
         vArg1.append("SeparateDisjointLumps:="), vArg1.append(False)
         vArg1.append("SourceFile:="), vArg1.append(filename)
         self.oeditor.Import(vArg1)
+        self.primitives.register_change()
         if refresh_all_ids:
             self.primitives.refresh_all_ids()
         self._messenger.add_info_message("Step file {} imported".format(filename))
@@ -3194,6 +3236,7 @@ class GeometryModeler(Modeler, object):
                 "Version:=", "2.0",
                 "ConnectionID:=", ""
             ])
+        self.primitives.register_change()
         self.primitives.refresh_all_ids()
         return True
 
@@ -3226,6 +3269,7 @@ class GeometryModeler(Modeler, object):
         """
         args = ["NAME:Selections", "Selections:=", "SpaceClaim1"]
         self.oeditor.BreakUDMConnection(args)
+        self.primitives.register_change()
         return True
 
     @aedt_exception_handler
@@ -3371,6 +3415,7 @@ class GeometryModeler(Modeler, object):
         aedt_bounding_box = self.get_model_bounding_box()
         directions = {}
         inputlist = self.convert_to_selections(inputlist, True)
+        self.primitives.invalidate_geometry(inputlist)
         for el in inputlist:
             objID = self.oeditor.GetFaceIDs(el)
             faceCenter = self.oeditor.GetFaceCenter(int(objID[0]))
@@ -3467,6 +3512,7 @@ class GeometryModeler(Modeler, object):
                     except:
                         self._messenger.add_info_message("done")
                         # self.modeler_oproject.ClearMessages()
+        self.primitives.register_change()
         return True
 
     def __get__(self, instance, owner):
@@ -3599,6 +3645,7 @@ class GeometryModeler(Modeler, object):
             "Groups:=", group_selection
         ]
         assigned_name = self.oeditor.CreateGroup(arg)
+        self.primitives.register_change()
         if group_name and group_name not in all_objects:
             self.oeditor.ChangeProperty(
                 ["NAME:AllTabs",
@@ -3631,6 +3678,7 @@ class GeometryModeler(Modeler, object):
         group_list = self.convert_to_selections(groups, return_list=True)
         arg = ["Groups:=", group_list]
         self.oeditor.Ungroup(arg)
+        self.primitives.register_change()
         return True
 
     @aedt_exception_handler
@@ -3647,4 +3695,5 @@ class GeometryModeler(Modeler, object):
             [
                 "Groups:=", ["Model"]
             ])
+        self.primitives.register_change()
         return True
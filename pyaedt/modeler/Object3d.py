@@ -150,6 +150,7 @@ class EdgeTypePrimitive(object):
         vArg2.append('Radius:='), vArg2.append(self._parent._parent._arg_with_dim(radius))
         vArg2.append('Setback:='), vArg2.append(self._parent._parent._arg_with_dim(setback))
         self._parent.m_Editor.Fillet(vArg1, ["NAME:Parameters", vArg2])
+        self._parent.invalidate_geometry()
         if self._parent.name in list(self._parent.m_Editor.GetObjectsInGroup("UnClassified")):
             self._parent.odesign.Undo()
             self._parent._messenger.add_error_message("Operation failed, generating an unclassified object. Check and retry.")
@@ -218,6 +219,7 @@ class EdgeTypePrimitive(object):
             self._parent._messenger.add_error_message("Wrong Type Entered. Type must be integer from 0 to 3")
             return False
         self._parent.m_Editor.Chamfer(vArg1, ["NAME:Parameters", vArg2])
+        self._parent.invalidate_geometry()
         if self._parent.name in list(self._parent.m_Editor.GetObjectsInGroup("UnClassified")):
             self._parent.odesign.Undo()
             self._parent._messenger.add_error_message("Operation Failed generating Unclassified object. Check and retry")
@@ -253,6 +255,9 @@ class VertexPrimitive(EdgeTypePrimitive, object):
             otherwise.
         
         """
+        return self._parent._cached_geometry(("vertex_position", self.id), self._get_position)
+
+    def _get_position(self):
         try:
             vertex_data = list(self._oeditor.GetVertexPosition(self.id))
             return [float(i) for i in vertex_data]
@@ -282,10 +287,20 @@ class EdgePrimitive(EdgeTypePrimitive, object):
         self.id = edge_id
         self._parent = parent
         self._oeditor = parent.m_Editor
-        self.vertices = []
-        for vertex in self._oeditor.GetVertexIDsFromEdge(edge_id):
-            vertex = int(vertex)
-            self.vertices.append(VertexPrimitive(parent, vertex))
+
+    @property
+    def vertices(self):
+        """List of vertices of the edge.
+
+        Returns
+        -------
+        list of :class:`pyaedt.modeler.Object3d.VertexPrimitive`
+
+        """
+        return self._parent._cached_geometry(("edge_vertices", self.id), self._get_vertices)
+
+    def _get_vertices(self):
+        return [VertexPrimitive(self._parent, int(i)) for i in self._oeditor.GetVertexIDsFromEdge(self.id)]
 
     @property
     def midpoint(self):
@@ -341,20 +356,40 @@ class FacePrimitive(object):
         self._id = id
         self._parent = parent
         self._oeditor = self._parent.m_Editor
-        self.edges = []
-        self.vertices = []
-        for edge in self._oeditor.GetEdgeIDsFromFace(self.id):
-            edge = int(edge)
-            self.edges.append(EdgePrimitive(parent, edge))
-        for vertex in self._oeditor.GetVertexIDsFromFace(self.id):
-            vertex = int(vertex)
-            self.vertices.append(VertexPrimitive(parent, vertex))
 
     @property
     def id(self):
         """ID of the face."""
         return self._id
 
+    @property
+    def edges(self):
+        """List of edges of the face.
+
+        Returns
+        -------
+        list of :class:`pyaedt.modeler.Object3d.EdgePrimitive`
+
+        """
+        return self._parent._cached_geometry(("face_edges", self.id), self._get_edges)
+
+    def _get_edges(self):
+        return [EdgePrimitive(self._parent, int(i)) for i in self._oeditor.GetEdgeIDsFromFace(self.id)]
+
+    @property
+    def vertices(self):
+        """List of vertices of the face.
+
+        Returns
+        -------
+        list of :class:`pyaedt.modeler.Object3d.VertexPrimitive`
+
+        """
+        return self._parent._cached_geometry(("face_vertices", self.id), self._get_vertices)
+
+    def _get_vertices(self):
+        return [VertexPrimitive(self._parent, int(i)) for i in self._oeditor.GetVertexIDsFromFace(self.id)]
+
     @property
     def center(self):
         """Face center for a planar face in model units.
@@ -365,6 +400,9 @@ class FacePrimitive(object):
             Center position in ``[x, y, z]`` coordinates for the planar face, ``False`` otherwise.
         
         """
+        return self._parent._cached_geometry(("face_center", self.id), self._get_center)
+
+    def _get_center(self):
         try:
             c = self._parent.m_Editor.GetFaceCenter(self.id)
         except:
@@ -399,8 +437,7 @@ class FacePrimitive(object):
             Face area in model units.
         
         """
-        area = self._parent.m_Editor.GetFaceArea(self.id)
-        return area
+        return self._parent._cached_geometry(("face_area", self.id), self._parent.m_Editor.GetFaceArea, self.id)
 
     @aedt_exception_handler
     def move_with_offset(self, offset=1.0):
@@ -422,6 +459,7 @@ class FacePrimitive(object):
                                         ["NAME:MoveFacesParameters", "MoveAlongNormalFlag:=", True, "OffsetDistance:=", _dim_arg(offset, self._parent.object_units),
                                          "MoveVectorX:=", "0mm", "MoveVectorY:=", "0mm", "MoveVectorZ:=", "0mm",
                                          "FacesToMove:=", [self.id]]])
+        self._parent.invalidate_geometry()
         return True
 
     @aedt_exception_handler
@@ -447,6 +485,7 @@ class FacePrimitive(object):
                   _dim_arg(vector[1], self._parent.object_units), "MoveVectorZ:=",
                   _dim_arg(vector[2], self._parent.object_units),
                   "FacesToMove:=", [self.id]]])
+        self._parent.invalidate_geometry()
         return True
 
     @property
@@ -544,13 +583,16 @@ class Object3d(object):
         self._is_updated = False
         self._all_props = None
         self._surface_material = None
+        self._geometry_cache = {}
+        self._geometry_cache_statistics = {"hits": 0, "misses": 0}
+        self._geometry_version = 0
 
     @property
     def bounding_box(self):
         """Bounding box of a part.
 
-        This is done by creating a new empty design, copying the object there, and getting the model bounding box. A
-        list of six 3D position vectors is returned.
+        The box is read from :func:`pyaedt.modeler.Primitives.Primitives.get_bounding_boxes`, which
+        caches it until the geometry of the object is invalidated.
 
         Returns
         -------
@@ -559,22 +601,10 @@ class Object3d(object):
             Xmin, Ymin, Zmin, Xmax, Ymax, and Zmax values.
         
         """
-        objs_to_unmodel = [val.name for i,val in self._parent.objects.items() if val.model]
-        if objs_to_unmodel:
-            vArg1 = ["NAME:Model", "Value:=", False]
-            self._parent._change_geometry_property(vArg1, objs_to_unmodel)
-        modeled=True
-        if not self.model:
-            vArg1 = ["NAME:Model", "Value:=", True]
-            self._parent._change_geometry_property(vArg1, self.name)
-            modeled = False
-        bounding = self._parent.get_model_bounding_box()
-        if objs_to_unmodel:
-            self.odesign.Undo()
-        if not modeled:
-            self.odesign.Undo()
-        return bounding
-
+        boxes = self._parent.get_bounding_boxes([self])
+        if not boxes or self.name not in boxes:
+            return False
+        return boxes[self.name]
 
     @property
     def odesign(self):
@@ -590,11 +620,10 @@ class Object3d(object):
         :class:`pyaedt.modeler.Object3d.FacePrimitive`
         
         """
-        faces = []
-        for face in self.m_Editor.GetFaceIDs(self.name):
-                face = int(face)
-                faces.append(FacePrimitive(self, face))
-        return faces
+        return self._cached_geometry(("faces",), self._get_faces)
+
+    def _get_faces(self):
+        return [FacePrimitive(self, int(face)) for face in self.m_Editor.GetFaceIDs(self.name)]
 
     @property
     def top_face(self):
@@ -631,11 +660,10 @@ class Object3d(object):
         list of EdgePrimitive
         
         """
-        edges = []
-        for edge in self._parent.get_object_edges(self.name):
-                edge = int(edge)
-                edges.append(EdgePrimitive(self, edge))
-        return edges
+        return self._cached_geometry(("edges",), self._get_edges)
+
+    def _get_edges(self):
+        return [EdgePrimitive(self, int(edge)) for edge in self._parent.get_object_edges(self.name)]
 
     @property
     def vertices(self):
@@ -646,11 +674,40 @@ class Object3d(object):
         :class:`pyaedt.modeler.Object3d.FacePrimitive`
         
         """
-        vertices = []
-        for vertex in self._parent.get_object_vertices(self.name):
-                vertex = int(vertex)
-                vertices.append(VertexPrimitive(self, vertex))
-        return vertices
+        return self._cached_geometry(("vertices",), self._get_vertices)
+
+    def _get_vertices(self):
+        return [VertexPrimitive(self, int(vertex)) for vertex in self._parent.get_object_vertices(self.name)]
+
+    @property
+    def geometry_cache_statistics(self):
+        """Number of hits and misses of the cache of faces, edges, vertices, positions, centers, and areas.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"hits"`` and ``"misses"`` keys.
+
+        """
+        return dict(self._geometry_cache_statistics)
+
+    def invalidate_geometry(self):
+        """Clear the cached faces, edges, vertices, positions, centers, areas, and bounding box of the object.
+
+        The modeler operations applied to the object call this method. Call it after modifying the
+        object directly with the ``oeditor``.
+        """
+        self._geometry_cache = {}
+        self._geometry_version += 1
+        self._parent._spatial_index_dirty.add(self.name)
+
+    def _cached_geometry(self, key, fetch, *args):
+        if key in self._geometry_cache:
+            self._geometry_cache_statistics["hits"] += 1
+        else:
+            self._geometry_cache_statistics["misses"] += 1
+            self._geometry_cache[key] = fetch(*args)
+        return self._geometry_cache[key]
 
     @property
     def m_Editor(self):
@@ -1613,6 +1670,10 @@ class CircuitComponent(object):
     
     """
 
+    # Values of the tab properties that are not defined on the component. These properties are not
+    # set in ``__init__`` so that ``__getattr__`` reads them from AEDT when they are accessed.
+    _lazy_defaults = {"InstanceName": None}
+
     @property
     def composed_name(self):
         """Composed names."""
@@ -1638,7 +1699,41 @@ class CircuitComponent(object):
         self.usesymbolcolor = True
         self.units = "mm"
         self.tabname = tabname
-        self.InstanceName = None
+        self._lazy_tab = None
+        self._lazy_properties = None
+
+    def __getattr__(self, name):
+        # Called only for attributes that are not set. The parameters of a component loaded with
+        # ``_set_lazy_properties`` are read from AEDT the first time that they are accessed.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        tabname = self.__dict__.get("_lazy_tab")
+        if tabname is None:
+            if name in self._lazy_defaults:
+                return self._lazy_defaults[name]
+            raise AttributeError(name)
+        if self._lazy_properties is None:
+            names = retry_ntimes(10, self.m_Editor.GetProperties, tabname, self.composed_name)
+            self._lazy_properties = set(names) if names and names is not True else set()
+        if name not in self._lazy_properties:
+            if name in self._lazy_defaults:
+                return self._lazy_defaults[name]
+            raise AttributeError(name)
+        self._lazy_properties.discard(name)
+        value = retry_ntimes(10, self.m_Editor.GetPropertyValue, tabname, self.composed_name, name)
+        self.__dict__[name] = value
+        return value
+
+    def _set_lazy_properties(self, tabname="PassedParameterTab"):
+        """Read the properties of a tab from AEDT when they are first accessed.
+
+        Parameters
+        ----------
+        tabname : str, optional
+            Name of the tab. The default is ``"PassedParameterTab"``.
+        """
+        self._lazy_tab = tabname
+        self._lazy_properties = None
 
     @aedt_exception_handler
     def set_location(self, x_location=None, y_location=None):
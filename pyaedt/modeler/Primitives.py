@@ -4,6 +4,8 @@ This module contains these Primitives classes: ``Polyline`` and ``Primitives``.
 from __future__ import absolute_import
 import sys
 from collections import defaultdict
+from bisect import bisect_left, insort
+from fnmatch import fnmatchcase
 import math
 import time
 import numbers
@@ -11,9 +13,14 @@ import os
 from copy import copy
 from .GeometryOperators import GeometryOperators
 from .Object3d import Object3d, EdgePrimitive, FacePrimitive, VertexPrimitive, _dim_arg, _uname
+from .SpatialIndex import BoundingVolumeHierarchy
 from ..generic.general_methods import aedt_exception_handler, retry_ntimes
-from ..application.Variables import Variable
+from ..application.Variables import Variable, unit_registry
 from collections import OrderedDict
+try:
+    import numpy as np
+except ImportError:
+    np = None
 if "IronPython" in sys.version or ".NETFramework" in sys.version:
     _ironpython = True
 else:
@@ -26,6 +33,200 @@ default_materials = {"Icepak": "air", "HFSS": "vacuum", "Maxwell 3D": "vacuum",
 aedt_wait_time = 0.1
 
 
+def _triangle_area(v1, v2, v3):
+    """Array version of :func:`GeometryOperators.get_triangle_area`.
+
+    Rounding can make the Heron product slightly negative for colinear vertices,
+    in which case the area is zero.
+    """
+    a = GeometryOperators.v_norm_array(v1 - v2)
+    b = GeometryOperators.v_norm_array(v2 - v3)
+    c = GeometryOperators.v_norm_array(v3 - v1)
+    s = 0.5 * (a + b + c)
+    return np.maximum(s * (s - a) * (s - b) * (s - c), 0.) ** 0.5
+
+
+def _edge_arrays(vertex_positions):
+    """Pack the vertex positions of a list of edges into ``(N, 3)`` arrays.
+
+    Parameters
+    ----------
+    vertex_positions : list
+        List with the list of vertex positions of each edge.
+
+    Returns
+    -------
+    tuple
+        First vertex, second vertex and midpoint arrays, followed by the masks of the
+        segment edges (two vertices) and of the valid edges (one or two vertices).
+        One-vertex edges use their vertex for all three points.
+    """
+    count = len(vertex_positions)
+    first = np.zeros((count, 3))
+    second = np.zeros((count, 3))
+    segment = np.zeros(count, dtype=bool)
+    valid = np.zeros(count, dtype=bool)
+    for i, positions in enumerate(vertex_positions):
+        if len(positions) == 2:
+            first[i] = positions[0]
+            second[i] = positions[1]
+            segment[i] = True
+        elif len(positions) == 1:
+            first[i] = positions[0]
+            second[i] = positions[0]
+        else:
+            continue
+        valid[i] = True
+    midpoint = np.where(segment[:, None], (first + second) / 2., first)
+    return first, second, midpoint, segment, valid
+
+
+def _between_points(p, a, b, tol=1e-6):
+    """Array version of :func:`GeometryOperators.is_between_points`."""
+    v1 = b - a
+    v2 = p - a
+    t1 = GeometryOperators.v_dot_array(v1, v2)
+    cross = GeometryOperators.v_cross_array(v1, v2)
+    return ~(GeometryOperators.v_norm_array(cross) > tol) & ~(t1 < 0) & ~(t1 > GeometryOperators.v_dot_array(v1, v1))
+
+
+def _projection_inside(a1, a2, b1, b2):
+    """Array version of :func:`GeometryOperators.is_projection_inside` for parallel segments."""
+    v1 = b2 - b1
+    n = v1 / GeometryOperators.v_norm_array(v1)[:, None]
+    v2 = b1 - a1
+    d = v2 - n * GeometryOperators.v_dot_array(v2, n)[:, None]
+    return _between_points(a1 + d, b1, b2) & _between_points(a2 + d, b1, b2)
+
+
+def _replay_selection(points, distances, state, tol, pos_tol, chunk=64):
+    """Replay the sequential edge couple selection of ``find_closest_edges`` on arrays.
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Point on plane of each valid couple, negated for the positive port directions.
+    distances : numpy.ndarray
+        Vertex distance sum of each valid couple.
+    state : tuple
+        ``(point, distance)`` of the couple selected so far or ``None``.
+
+    Returns
+    -------
+    tuple
+        Index of the last selected couple or ``None`` and the updated state.
+    """
+    index = None
+    start = 0
+    if state is None:
+        index = 0
+        state = (points[0], distances[0])
+        start = 1
+    size = chunk
+    while start < len(points):
+        stop = start + size
+        delta = points[start:stop] - state[0]
+        hits = np.flatnonzero((delta < 0) | ((delta < tol) & (distances[start:stop] - state[1] < pos_tol)))
+        if len(hits):
+            index = start + hits[0]
+            state = (points[index], distances[index])
+            start = index + 1
+            size = chunk
+        else:
+            start = stop
+            size *= 2
+    return index, state
+
+
+def _is_close(value, reference, tol=1e-6):
+    return abs(value - reference) <= tol * max(abs(reference), 1e-12)
+
+
+def _parsed_sphere_bounding_box(part, units):
+    """Compute the bounding box of a sphere from its operation in the project file.
+
+    Parameters
+    ----------
+    part : dict
+        ``GeometryPart`` block of the project file.
+    units : str
+        Model units of the project file.
+
+    Returns
+    -------
+    list
+        List of six float values ``[min_x, min_y, min_z, max_x, max_y, max_z]`` in the
+        model units, or ``None`` when the part is not an unmodified sphere created in the
+        global coordinate system with numeric parameters.
+    """
+    try:
+        operation = part["Operations"]["Operation"]
+        coordinate_system = part["Attributes"]["PartCoordinateSystem"]
+        if operation["OperationType"] != "Sphere" or operation["ReferenceCoordSystemID"] != 1:
+            return None
+        parameters = operation["SphereParameters"]
+    except (KeyError, TypeError):
+        return None
+    if coordinate_system != 1 or units not in unit_registry.dimension_units:
+        return None
+    values = []
+    for key in ["XCenter", "YCenter", "ZCenter", "Radius"]:
+        value, value_units = unit_registry.decompose(parameters.get(key))
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return None
+        if value_units:
+            if value_units not in unit_registry.dimension_units:
+                return None
+            value *= unit_registry.dimension_units[value_units] / unit_registry.dimension_units[units]
+        values.append(float(value))
+    radius = abs(values[3])
+    return [i - radius for i in values[:3]] + [i + radius for i in values[:3]]
+
+
+def _loop_areas(edges, positions):
+    """Chain the straight edges of a planar face into loops and compute their areas.
+
+    Parameters
+    ----------
+    edges : list
+        List of ``(vertex_id, vertex_id)`` tuples.
+    positions : dict
+        Vertex positions by vertex ID.
+
+    Returns
+    -------
+    list
+        List of loop areas or ``None`` when the edges do not form closed loops.
+    """
+    neighbors = defaultdict(list)
+    for v1, v2 in edges:
+        neighbors[v1].append(v2)
+        neighbors[v2].append(v1)
+    if any(len(i) != 2 for i in neighbors.values()):
+        return None
+    areas = []
+    visited = set()
+    for start in neighbors:
+        if start in visited:
+            continue
+        loop = [start]
+        visited.add(start)
+        previous, current = start, neighbors[start][0]
+        while current != start:
+            if current in visited:
+                return None
+            loop.append(current)
+            visited.add(current)
+            following = neighbors[current]
+            previous, current = current, following[1] if following[0] == previous else following[0]
+        area = [0.0, 0.0, 0.0]
+        for i, vertex in enumerate(loop):
+            cross = GeometryOperators.v_cross(positions[vertex], positions[loop[(i + 1) % len(loop)]])
+            area = GeometryOperators.v_sum(area, cross)
+        areas.append(0.5 * GeometryOperators.v_norm(area))
+    return areas
+
+
 class PolylineSegment():
     """PolylineSegment class.
     
@@ -154,6 +355,9 @@ class Polyline(Object3d):
             self.__dict__ = src_object.__dict__.copy()
             if name:
                 self._m_name = name    # This is conimg from
+                self._geometry_cache = {}
+                self._geometry_cache_statistics = {"hits": 0, "misses": 0}
+                self._geometry_version = 0
             else:
                 self._id = src_object.id
                 self._m_name = src_object.name
@@ -183,8 +387,7 @@ class Polyline(Object3d):
             new_object_name = self.m_Editor.CreatePolyline(varg1, varg2)
 
             Object3d.__init__(self, parent, name=new_object_name)
-            self._parent.objects[self.id] = self
-            self._parent.object_id_dict[self.name] = self.id
+            self._parent._register_object(self)
 
     @property
     def start_point(self):
@@ -440,6 +643,7 @@ class Polyline(Object3d):
         vArg1 = ['NAME:Selections', 'Selections:=', self.name]
         self._parent.oeditor.Copy(vArg1)
         self._parent.oeditor.Paste()
+        self._parent.register_change()
         return self._add_new_polyline()
 
     def _add_new_polyline(self):
@@ -447,9 +651,7 @@ class Polyline(Object3d):
         assert len(new_objects) == 1
         new_name = new_objects[0]
         new_polyline = Polyline(self._parent, src_object=self, name=new_name)
-        self._parent.objects[new_polyline.id] = new_polyline
-        self._parent.object_id_dict[new_name] = new_polyline.id
-        return new_polyline
+        return self._parent._register_object(new_polyline)
 
     @aedt_exception_handler
     def remove_vertex(self, position, abstol=1e-9):
@@ -513,7 +715,7 @@ class Polyline(Object3d):
                 "Selections:=", self._m_name + ":CreatePolyline:1",
                 "Segment Indices:=", [seg_id],
                 "At Start:="	, at_start])
-
+        self.invalidate_geometry()
         return True
 
     @aedt_exception_handler
@@ -549,6 +751,7 @@ class Polyline(Object3d):
                     "At Start:="	, True])
         except:
             raise ValueError("Invalid edge ID {} is specified on polyline {}.".format(edge_id, self.name))
+        self.invalidate_geometry()
         return True
 
     @aedt_exception_handler
@@ -630,6 +833,7 @@ class Polyline(Object3d):
         arg2.append(arg3)
         arg1.append(arg2)
         self._parent.oeditor.ChangeProperty(arg1)
+        self.invalidate_geometry()
         self._update()
         return True
 
@@ -721,14 +925,42 @@ class Polyline(Object3d):
             varg1.append(varg2)
             varg1 += seg_str[9:]
         self._parent.oeditor.InsertPolylineSegment(varg1)
-
+        self.invalidate_geometry()
         return True
 
+class PrimitivesBatch(object):
+    """Defers the registration of the objects created by the primitives.
+
+    Use :func:`Primitives.batch` to create this context manager.
+
+    Parameters
+    ----------
+    primitives : :class:`pyaedt.modeler.Primitives.Primitives`
+        Primitives creating the objects.
+    """
+    def __init__(self, primitives):
+        self._primitives = primitives
+
+    def __enter__(self):
+        self._primitives._begin_batch()
+        return self._primitives
+
+    def __exit__(self, ex_type, ex_value, ex_traceback):
+        self._primitives._end_batch()
+
+
 class Primitives(object):
     """Common primitives class."""
     def __init__(self, parent, modeler):
         self._modeler = modeler
         self._parent = parent
+        self._change_count = 0
+        self._object_groups = {}
+        self._batch_depth = 0
+        self._batch_objects = []
+        self._batch_model_units = None
+        self._spatial_index = None
+        self._spatial_index_dirty = set()
         self.refresh()
 
     @property
@@ -764,24 +996,24 @@ class Primitives(object):
     def solid_names(self):
         """List of all objects of type ``"Solid"``"""
         self._refresh_solids()
-        return self._solids
+        return list(self._solids)
 
     @property
     def sheet_names(self):
         """List of all objects of type ``"Sheet"``"""
         self._refresh_sheets()
-        return self._sheets
+        return list(self._sheets)
 
     @property
     def line_names(self):
         """List of all objects of type ``"Line"``"""
         self._refresh_lines()
-        return self._lines
+        return list(self._lines)
 
     @property
     def unclassified_names(self):
         self._refresh_unclassified()
-        return self._unclassified
+        return list(self._unclassified)
 
     @property
     def object_names(self):
@@ -789,6 +1021,148 @@ class Primitives(object):
         self._refresh_object_types()
         return self._all_object_names
 
+    @property
+    def change_count(self):
+        """Number of modeler operations registered since the primitives were created.
+
+        The lists of object names are read from AEDT only when this counter has changed.
+        """
+        return self._change_count
+
+    @property
+    def geometry_cache_statistics(self):
+        """Total number of hits and misses of the geometry caches of the objects.
+
+        Returns
+        -------
+        dict
+            Dictionary with the ``"hits"`` and ``"misses"`` keys.
+        """
+        statistics = {"hits": 0, "misses": 0}
+        for obj in self.objects.values():
+            for key, value in obj.geometry_cache_statistics.items():
+                statistics[key] += value
+        return statistics
+
+    def invalidate_geometry(self, objects=None):
+        """Clear the cached faces, edges, vertices, positions, centers, and areas of objects.
+
+        Parameters
+        ----------
+        objects : str, int, list, optional
+            Objects modified by an operation. A string can list several names separated by
+            commas. The default is ``None``, in which case the cache of all objects is cleared.
+        """
+        if objects is None:
+            for obj in self.objects.values():
+                obj.invalidate_geometry()
+            return
+        if isinstance(objects, str):
+            objects = objects.split(",")
+        elif not isinstance(objects, list):
+            objects = [objects]
+        for el in objects:
+            obj = self[el]
+            if obj:
+                obj.invalidate_geometry()
+
+    @property
+    def spatial_index(self):
+        """Bounding volume hierarchy of the object bounding boxes.
+
+        The hierarchy is built on first access. The objects created, deleted, renamed, or
+        invalidated since then are kept in a set, and only their boxes are read again on the
+        next access.
+
+        Returns
+        -------
+        :class:`pyaedt.modeler.SpatialIndex.BoundingVolumeHierarchy`
+            Hierarchy with the object names as keys.
+        """
+        if self._spatial_index is None:
+            self._spatial_index = BoundingVolumeHierarchy()
+            dirty = set(self.object_id_dict)
+        else:
+            dirty = self._spatial_index_dirty
+        self._spatial_index_dirty = set()
+        if not dirty:
+            return self._spatial_index
+        changed = []
+        for name in dirty:
+            obj = self.objects.get(self.object_id_dict[name]) if name in self.object_id_dict else None
+            if obj is not None:
+                changed.append(obj)
+            else:
+                self._spatial_index.remove(name)
+        boxes = {}
+        if changed:
+            boxes = self.get_bounding_boxes(changed) or {}
+        if len(self._spatial_index) == 0:
+            self._spatial_index.build(boxes)
+            return self._spatial_index
+        for obj in changed:
+            if obj.name in boxes:
+                self._spatial_index.insert(obj.name, boxes[obj.name])
+            else:
+                self._spatial_index.remove(obj.name)
+        return self._spatial_index
+
+    def register_change(self):
+        """Register a modeler operation that can create, delete, or rename objects.
+
+        The object lists are read again from AEDT on the next access. Call this method after
+        modifying the model directly with the ``oeditor``.
+        """
+        self._change_count += 1
+
+    def batch(self):
+        """Create objects in a batch.
+
+        Inside the ``with`` block, the created objects are not registered one at a time.
+        They are registered together when the block exits, with a single change of the object
+        lists. The model units are read once per batch. The objects returned by the ``create_*``
+        methods can be used inside the block, but they cannot be retrieved by name or ID until
+        the block exits.
+
+        Returns
+        -------
+        :class:`pyaedt.modeler.Primitives.PrimitivesBatch`
+            Context manager returning these primitives.
+
+        Examples
+        --------
+        >>> from pyaedt import Hfss
+        >>> hfss = Hfss()
+        >>> with hfss.modeler.primitives.batch() as primitives:
+        ...     for i in range(100):
+        ...         primitives.create_box([2 * i, 0, 0], [1, 1, 1], "Via{}".format(i), "copper")
+        """
+        return PrimitivesBatch(self)
+
+    def _begin_batch(self):
+        if not self._batch_depth:
+            self._batch_objects = []
+            self._batch_model_units = None
+        self._batch_depth += 1
+
+    def _end_batch(self):
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        objects = self._batch_objects
+        self._batch_objects = []
+        self._batch_model_units = None
+        if not objects:
+            return
+        self.register_change()
+        for o in objects:
+            new_id = o.id
+            if new_id is None:
+                continue
+            self.objects[new_id] = o
+            self.object_id_dict[o.name] = new_id
+            self._index_object(o.name)
+
     @property
     def oproject(self):
         """ """
@@ -837,6 +1211,10 @@ class Primitives(object):
     @property
     def model_units(self):
         """ """
+        if self._batch_depth:
+            if self._batch_model_units is None:
+                self._batch_model_units = self.modeler.model_units
+            return self._batch_model_units
         return self.modeler.model_units
 
     @property
@@ -875,6 +1253,15 @@ class Primitives(object):
     @aedt_exception_handler
     def _change_geometry_property(self, vPropChange, names_list):
         names = self._parent.modeler.convert_to_selections(names_list, True)
+        if vPropChange[0] == "NAME:Name":
+            self.register_change()
+            for name in names:
+                self._rename_object_index(name, vPropChange[2])
+        elif vPropChange[0] == "NAME:Material":
+            for name in names:
+                self._index_material(name, vPropChange[2])
+        elif vPropChange[0] == "NAME:Group":
+            self.register_change()
         vChangedProps = ["NAME:ChangedProps", vPropChange]
         vPropServers = ["NAME:PropServers"]
         for el in names:
@@ -1294,6 +1681,7 @@ class Primitives(object):
                 "Selections:="	, objects_str
                 ]
             self.oeditor.Delete(arg)
+            self.register_change()
 
             remaining -= slice
             if remaining > 0:
@@ -1324,17 +1712,10 @@ class Primitives(object):
             ``True`` when successful, ``False`` when failed
 
         """
-        objnames = self.object_id_dict
-        num_del = 0
-        for el in objnames:
-            if case_sensitive:
-                if contained_string in el:
-                    self.delete(el)
-                    num_del += 1
-            else:
-                if contained_string.lower() in el.lower():
-                    self.delete(el)
-                    num_del += 1
+        objnames = self.get_objects_w_string(contained_string, case_sensitive)
+        num_del = len(objnames)
+        if objnames:
+            self.delete(objnames)
         self._messenger.add_info_message("Deleted {} objects".format(num_del))
         return True
 
@@ -1350,6 +1731,148 @@ class Primitives(object):
         """
         return self._parent.modeler.get_model_bounding_box()
 
+    @aedt_exception_handler
+    def get_bounding_boxes(self, objects=None):
+        """Retrieve the bounding boxes of objects.
+
+        The boxes are cached with the geometry of each object until the object is
+        invalidated. Missing boxes are computed together. Boxes of objects whose faces are
+        planar polygons, disks, or the sides of cylinders and cones are computed from the
+        vertex positions and the face centers and areas, without changing the model. Boxes of
+        the unmodified spheres of the project file are read from their parameters at load time.
+        The other boxes are read from the model bounding box: all the objects are unmodeled
+        once and these objects are modeled one at a time.
+
+        Parameters
+        ----------
+        objects : list, optional
+            List of object names or IDs. The default is ``None``, in which case
+            the boxes of all objects are returned.
+
+        Returns
+        -------
+        dict
+            Dictionary with the object names as keys and lists of six float values
+            ``[min_x, min_y, min_z, max_x, max_y, max_z]`` as values.
+        """
+        if objects is None:
+            objects = list(self.objects.values())
+        elif not isinstance(objects, list):
+            objects = [objects]
+        objects = [i for i in [self[el] for el in objects] if i]
+        missing = [obj for obj in objects if ("bounding_box",) not in obj._geometry_cache]
+        computed = self._compute_bounding_boxes(missing) if missing else {}
+        boxes = {}
+        for obj in objects:
+            box = obj._cached_geometry(("bounding_box",), computed.get, obj.name)
+            if box:
+                boxes[obj.name] = list(box)
+            else:
+                obj._geometry_cache.pop(("bounding_box",), None)
+        return boxes
+
+    def _compute_bounding_boxes(self, objects):
+        boxes = {}
+        curved = []
+        for obj in objects:
+            box = self._analytic_bounding_box(obj)
+            if box:
+                boxes[obj.name] = box
+            else:
+                curved.append(obj.name)
+        if curved:
+            boxes.update(self._model_bounding_boxes(curved))
+        return boxes
+
+    def _analytic_bounding_box(self, obj):
+        faces = obj.faces
+        if not faces:
+            return None
+        positions = {}
+        for vertex in obj.vertices:
+            positions[vertex.id] = vertex.position
+        if not positions:
+            return None
+        circles = {}
+        curved = []
+        for face in faces:
+            if face.center is False:
+                curved.append(face)
+                continue
+            edges = face.edges
+            if len(edges) == 1 and len(edges[0].vertices) == 1:
+                # Disk: the circle is centered on the face center and goes through its vertex.
+                point = edges[0].vertices[0].position
+                radius = GeometryOperators.points_distance(face.center, point)
+                if not _is_close(math.pi * radius ** 2, face.area):
+                    return None
+                circles[edges[0].id] = (face.center, radius, point)
+                continue
+            loop_edges = []
+            for edge in edges:
+                vertices = edge.vertices
+                if len(vertices) != 2:
+                    return None
+                loop_edges.append((vertices[0].id, vertices[1].id))
+                for vertex in vertices:
+                    if vertex.id not in positions:
+                        positions[vertex.id] = vertex.position
+            areas = _loop_areas(loop_edges, positions)
+            if not areas:
+                return None
+            areas = sorted(areas)
+            if not _is_close(areas[-1] - sum(areas[:-1]), face.area):
+                return None
+        normals = {}
+        for face in curved:
+            # Side of a cylinder or a cone: the face joins two coaxial disks and has the area of
+            # a frustum, so its extents are the extents of the two circles.
+            edge_ids = [edge.id for edge in face.edges]
+            if len(edge_ids) != 2 or any(i not in circles for i in edge_ids):
+                return None
+            (center1, radius1, point1), (center2, radius2, point2) = [circles[i] for i in edge_ids]
+            axis = GeometryOperators.v_points(center1, center2)
+            height = GeometryOperators.v_norm(axis)
+            if not height:
+                return None
+            axis = GeometryOperators.normalize_vector(axis)
+            for center, radius, point in [(center1, radius1, point1), (center2, radius2, point2)]:
+                offset = GeometryOperators.v_dot(GeometryOperators.v_points(center, point), axis)
+                if abs(offset) > 1e-6 * max(radius, height):
+                    return None
+            slant = math.sqrt(height ** 2 + (radius1 - radius2) ** 2)
+            if not _is_close(math.pi * (radius1 + radius2) * slant, face.area):
+                return None
+            for i in edge_ids:
+                normals[i] = axis
+        if len(normals) != len(circles):
+            return None
+        coordinates = list(zip(*positions.values()))
+        box = [min(i) for i in coordinates] + [max(i) for i in coordinates]
+        for edge_id, (center, radius, point) in circles.items():
+            for i, component in enumerate(normals[edge_id]):
+                half = radius * math.sqrt(max(0.0, 1.0 - component ** 2))
+                box[i] = min(box[i], center[i] - half)
+                box[i + 3] = max(box[i + 3], center[i] + half)
+        return box
+
+    def _model_bounding_boxes(self, names):
+        # All the objects are unmodeled once, the curved objects are modeled one at a time,
+        # and the objects are modeled again once, without undo operations.
+        modeled = [obj.name for obj in self.objects.values() if obj.model]
+        if modeled and not self._change_geometry_property(["NAME:Model", "Value:=", False], modeled):
+            return {}
+        boxes = {}
+        try:
+            for name in names:
+                if self._change_geometry_property(["NAME:Model", "Value:=", True], [name]):
+                    boxes[name] = self.get_model_bounding_box()
+                    self._change_geometry_property(["NAME:Model", "Value:=", False], [name])
+        finally:
+            if modeled:
+                self._change_geometry_property(["NAME:Model", "Value:=", True], modeled)
+        return boxes
+
     @aedt_exception_handler
     def get_obj_id(self, objname):
         """Return the object ID from an object name.
@@ -1403,18 +1926,67 @@ class Primitives(object):
             Objects in a list of strings.
 
         """
-        list_objs=[]
-        for el in self.objects:
-            if case_sensitive:
-                if stringname in self.objects[el].name:
-                    list_objs.append(self.objects[el].name)
-            else:
-                if stringname.lower() in self.objects[el].name.lower():
-                    list_objs.append(self.objects[el].name)
+        if case_sensitive:
+            return [name for name in self.object_id_dict if stringname in name]
+        stringname = stringname.lower()
+        return [name for name in self.object_id_dict if stringname in name.lower()]
 
-        return list_objs
+    @aedt_exception_handler
+    def get_objects_by_prefix(self, prefix, case_sensitive=True):
+        """Retrieve all objects whose names start with a given string.
+
+        The names are looked up in a sorted name index.
+
+        Parameters
+        ----------
+        prefix : str
+            Start of the object names.
+        case_sensitive : bool, optional
+            Whether the prefix is case-sensitive. The default is ``True``.
+
+        Returns
+        -------
+        list
+            List of object names sorted alphabetically.
+        """
+        self._update_name_index()
+        names = []
+        if case_sensitive:
+            for name in self._name_index[bisect_left(self._name_index, prefix):]:
+                if not name.startswith(prefix):
+                    break
+                names.append(name)
+            return names
+        prefix = prefix.lower()
+        for lower_name, name in self._name_index_lower[bisect_left(self._name_index_lower, (prefix, "")):]:
+            if not lower_name.startswith(prefix):
+                break
+            names.append(name)
+        return names
+
+    @aedt_exception_handler
+    def get_objects_by_pattern(self, pattern):
+        """Retrieve all objects whose names match a wildcard pattern.
+
+        The literal start of the pattern is looked up in the sorted name index.
+
+        Parameters
+        ----------
+        pattern : str
+            Pattern with the ``*`` and ``?`` wildcards. For example, ``"Via*"``.
+
+        Returns
+        -------
+        list
+            List of object names sorted alphabetically.
+        """
+        prefix = pattern
+        for wildcard in "*?[":
+            prefix = prefix.split(wildcard)[0]
+        return [name for name in self.get_objects_by_prefix(prefix) if fnmatchcase(name, pattern)]
 
     def refresh(self):
+        self.register_change()
         self._solids = []
         self._sheets = []
         self._lines = []
@@ -1422,6 +1994,16 @@ class Primitives(object):
         self._all_object_names = []
         self.objects = defaultdict(Object3d)
         self.object_id_dict = defaultdict()
+        self._topology_ids = {"Face": {}, "Edge": {}, "Vertex": {}}
+        self._topology_entries = {"Face": {}, "Edge": {}, "Vertex": {}}
+        self._spatial_index = None
+        self._spatial_index_dirty = set()
+        self._name_index = []
+        self._name_index_lower = []
+        self._new_names = []
+        self._material_index = {}
+        self._object_materials = {}
+        self._unknown_materials = set()
         self._currentId = 0
         self._refresh_all_ids_from_aedt_file()
         self.add_new_objects()
@@ -1430,6 +2012,7 @@ class Primitives(object):
         """Clean up any objects in self.objects that have been removed by previous operations
         and do not exist in the modeler anymore. Also updates object ids which may have changed
         via a modeler operation such as unite"""
+        self.register_change()
         new_object_dict = {}
         new_object_id_dict = {}
         all_objects =self.object_names
@@ -1439,9 +2022,16 @@ class Primitives(object):
                 updated_id = obj.id    # By calling the object property we get the new id
                 new_object_id_dict[obj.name] = updated_id
                 new_object_dict[updated_id] = obj
+        for kind in self._topology_entries:
+            for name in list(self._topology_entries[kind]):
+                if name not in new_object_id_dict:
+                    self._remove_topology(kind, name)
 
+        self._update_name_index()
         self.objects = new_object_dict
         self.object_id_dict = new_object_id_dict
+        for name in [i for i in self._name_index if i not in new_object_id_dict]:
+            self._unindex_object(name)
 
     def find_new_objects(self):
         """Append any objects to self.objects that have been created by previous operations
@@ -1455,6 +2045,7 @@ class Primitives(object):
     def add_new_objects(self):
         """Append any objects to self.objects that have been created by previous operations
         and are now present in the modeler"""
+        self.register_change()
         added_objects = []
         for obj_name in self.object_names:
             if obj_name not in self.object_id_dict:
@@ -1476,19 +2067,28 @@ class Primitives(object):
     def get_objects_by_material(self, materialname):
         """Retrieve a list of the IDs for objects of a specified material.
 
+        The objects are looked up in the material index. The index is filled from the project
+        file at load time and kept up to date by the material changes. The materials of the objects
+        created since then are read from AEDT on the first query.
+
         Parameters
         ----------
         materialname : str
-            Name of the material.
+            Name of the material. The name is not case-sensitive.
 
         Returns
         -------
+        list
+            List of object IDs.
         """
-        obj_lst = []
-        for el in self.objects:
-            if self.objects[el].material_name == materialname or self.objects[el].material_name == '"'+ materialname +'"':
-                obj_lst.append(el)
-        return obj_lst
+        for name in list(self._unknown_materials):
+            obj = self[name]
+            if obj:
+                self._index_material(name, obj.material_name)
+            else:
+                self._unknown_materials.discard(name)
+        names = self._material_index.get(materialname.strip('"').lower(), ())
+        return sorted([self.object_id_dict[name] for name in names if name in self.object_id_dict])
 
     @aedt_exception_handler
     def find_closest_edges(self, start_obj, end_obj, port_direction=0):
@@ -1515,9 +2115,12 @@ class Primitives(object):
         """
         start_obj = self._resolve_object(start_obj)
         end_obj = self._resolve_object(end_obj)
+        if np is None:
+            return self._closest_edges_loop(start_obj.edges, end_obj.edges, port_direction)
+        return self._closest_edges_array(start_obj.edges, end_obj.edges, port_direction)
 
-        edge_start_list = start_obj.edges
-        edge_stop_list = end_obj.edges
+    def _closest_edges_loop(self, edge_start_list, edge_stop_list, port_direction=0):
+        """Pure Python implementation of :func:`Primitives.find_closest_edges`."""
         mindist = 1e6
         tol = 1e-12
         pos_tol = 1e-6
@@ -1601,6 +2204,79 @@ class Primitives(object):
                         mindist = vert_dist_sum
         return edge_list, is_parallel
 
+    def _closest_edges_array(self, edge_start_list, edge_stop_list, port_direction=0, block_size=100000):
+        """NumPy implementation of :func:`Primitives.find_closest_edges`.
+
+        The edge endpoints are loaded once and the edge couples are evaluated in blocks of
+        ``block_size`` couples. The selection rules of the loop implementation are replayed
+        on the valid couples only, so the same couple is returned.
+        """
+        tol = 1e-12
+        pos_tol = 1e-6
+        start_first, start_second, start_mid, start_segment, start_valid = _edge_arrays(
+            [[v.position for v in edge.vertices] for edge in edge_start_list])
+        stop_first, stop_second, stop_mid, stop_segment, stop_valid = _edge_arrays(
+            [[v.position for v in edge.vertices] for edge in edge_stop_list])
+        start_ids = np.flatnonzero(start_valid)
+        stop_ids = np.flatnonzero(stop_valid)
+        if not len(start_ids) or not len(stop_ids):
+            return [], False
+
+        stop_first = stop_first[stop_ids]
+        stop_second = stop_second[stop_ids]
+        stop_mid = stop_mid[stop_ids]
+        stop_segment = stop_segment[stop_ids]
+        stop_vector = stop_second - stop_first
+        stop_length = GeometryOperators.v_norm_array(stop_vector)
+        axis = port_direction if port_direction <= 2 else port_direction - 3
+
+        selection = None
+        state = None
+        rows = max(1, block_size // len(stop_ids))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            for block in range(0, len(start_ids), rows):
+                ids = start_ids[block:block + rows]
+                first = start_first[ids][:, None, :]
+                second = start_second[ids][:, None, :]
+                mid = start_mid[ids][:, None, :]
+                vector = second - first
+                length = GeometryOperators.v_norm_array(vector)
+                both = start_segment[ids][:, None] & stop_segment[None, :]
+                dot = GeometryOperators.v_dot_array(vector, stop_vector)
+                perpendicular = both & (np.abs(dot) < tol)
+                parallel = both & (1. - np.abs(dot / (length * stop_length)) < pos_tol * pos_tol)
+                norm = GeometryOperators.v_norm_array
+                vert_dist_sum = np.where(
+                    both,
+                    (norm(stop_first - first) + norm(stop_second - first) + norm(stop_first - second) +
+                     norm(stop_second - second)) / 4,
+                    norm(stop_mid - mid) / 2)
+                valid = ~perpendicular
+                rows_id, cols_id = np.nonzero(parallel)
+                if len(rows_id):
+                    shorter = (length[rows_id, 0] < stop_length[cols_id])[:, None]
+                    a1 = np.where(shorter, first[rows_id, 0], stop_first[cols_id])
+                    a2 = np.where(shorter, second[rows_id, 0], stop_second[cols_id])
+                    b1 = np.where(shorter, stop_first[cols_id], first[rows_id, 0])
+                    b2 = np.where(shorter, stop_second[cols_id], second[rows_id, 0])
+                    valid[rows_id, cols_id] = _projection_inside(a1, a2, b1, b2)
+
+                rows_id, cols_id = np.nonzero(valid)
+                if not len(rows_id):
+                    continue
+                if port_direction <= 2:
+                    points = np.minimum(np.minimum(1e6, mid[rows_id, 0, axis]), stop_mid[cols_id, axis])
+                else:
+                    points = -np.maximum(np.maximum(-1e6, mid[rows_id, 0, axis]), stop_mid[cols_id, axis])
+                distances = vert_dist_sum[rows_id, cols_id]
+                index, state = _replay_selection(points, distances, state, tol, pos_tol)
+                if index is not None:
+                    row, col = rows_id[index], cols_id[index]
+                    selection = (ids[row], stop_ids[col], bool(parallel[row, col]))
+        if selection is None:
+            return [], False
+        return [edge_start_list[selection[0]], edge_stop_list[selection[1]]], selection[2]
+
     @aedt_exception_handler
     def get_equivalent_parallel_edges(self, edgelist, portonplane=True, axisdir=0, startobj="", endobject=""):
         """Create two new edges that are parallel and equal to the smallest edge given a parallel couple of edges. 
@@ -1994,6 +2670,81 @@ class Primitives(object):
         list_of_bodies = list(self.oeditor.GetBodyNamesByPosition(vArg1))
         return list_of_bodies
 
+    @aedt_exception_handler
+    def find_objects_by_position(self, position, tol=0.0):
+        """Retrieve the names of the objects whose bounding boxes contain a point.
+
+        The query is answered by :attr:`spatial_index` without calls to AEDT once the boxes
+        are indexed. Use :func:`get_bodynames_from_position` to check the bodies themselves.
+
+        Parameters
+        ----------
+        position : list
+            List of ``[x, y, z]`` coordinates in model units.
+        tol : float, optional
+            Distance in model units by which the boxes are enlarged. The default is ``0.0``.
+
+        Returns
+        -------
+        list
+            List of object names.
+        """
+        return self.spatial_index.query_point(position, tol)
+
+    def _objects_at_position(self, position, units=None):
+        """Names of the objects that can touch a position, in the order of ``object_names``.
+
+        The objects whose bounding boxes do not contain the position are skipped. All the objects
+        are returned when the position is not numeric or not in model units.
+        """
+        object_names = self.object_names
+        try:
+            point = [float(position[i]) for i in range(3)]
+        except (TypeError, ValueError, IndexError):
+            return object_names
+        if units and units != self.model_units:
+            return object_names
+        tol = 1e-6 * max([1.0] + [abs(i) for i in point])
+        index = self.spatial_index
+        candidates = set(index.query_point(point, tol))
+        return [name for name in object_names if name in candidates or name not in index]
+
+    @aedt_exception_handler
+    def find_objects_in_box(self, bounding_box, tol=0.0):
+        """Retrieve the names of the objects whose bounding boxes overlap a box.
+
+        Parameters
+        ----------
+        bounding_box : list
+            List of six values ``[xmin, ymin, zmin, xmax, ymax, zmax]`` in model units.
+        tol : float, optional
+            Distance in model units by which the boxes are enlarged. The default is ``0.0``.
+
+        Returns
+        -------
+        list
+            List of object names.
+        """
+        return self.spatial_index.query_box(bounding_box, tol)
+
+    @aedt_exception_handler
+    def find_closest_objects(self, position, count=1):
+        """Retrieve the names of the objects whose bounding boxes are the closest to a point.
+
+        Parameters
+        ----------
+        position : list
+            List of ``[x, y, z]`` coordinates in model units.
+        count : int, optional
+            Number of objects to return. The default is ``1``.
+
+        Returns
+        -------
+        list
+            List of object names sorted by increasing distance to the point.
+        """
+        return self.spatial_index.nearest(position, count)
+
     @aedt_exception_handler
     def get_edgeid_from_position(self, position, obj_name=None, units=None):
         """
@@ -2017,7 +2768,7 @@ class Primitives(object):
         if isinstance(obj_name, str):
             object_list = [obj_name]
         else:
-            object_list = self.object_names
+            object_list = self._objects_at_position(position, units)
 
         edgeID = -1
         XCenter, YCenter, ZCenter = self._pos_with_arg(position, units)
@@ -2084,7 +2835,7 @@ class Primitives(object):
         if isinstance(obj_name, str):
             object_list = [obj_name]
         else:
-            object_list = self.object_names
+            object_list = self._objects_at_position(position, units)
 
         XCenter, YCenter, ZCenter = self._pos_with_arg(position, units)
         vArg1 = ['NAME:FaceParameters']
@@ -2154,15 +2905,24 @@ class Primitives(object):
             return candidate_edges
 
         selected_edges = []
-        for i, edge_i in enumerate(candidate_edges[:-1]):
-            vertex1_i = edge_i.vertices[0].position
-            midpoint_i = edge_i.midpoint
-            for j, edge_j in enumerate(candidate_edges[i+1:]):
-                midpoint_j = edge_j.midpoint
-                area = GeometryOperators.get_triangle_area(midpoint_i, midpoint_j, vertex1_i)
-                if area < tol ** 2:
-                    selected_edges.extend([edge_i, edge_j])
-                    break
+        if np is not None and candidate_edges:
+            midpoints = np.array([edge.midpoint for edge in candidate_edges], dtype=float)
+            for i, edge_i in enumerate(candidate_edges[:-1]):
+                vertex1_i = np.array(edge_i.vertices[0].position, dtype=float)
+                areas = _triangle_area(midpoints[i], midpoints[i + 1:], vertex1_i)
+                hits = np.flatnonzero(areas < tol ** 2)
+                if len(hits):
+                    selected_edges.extend([edge_i, candidate_edges[i + 1 + hits[0]]])
+        else:
+            for i, edge_i in enumerate(candidate_edges[:-1]):
+                vertex1_i = edge_i.vertices[0].position
+                midpoint_i = edge_i.midpoint
+                for j, edge_j in enumerate(candidate_edges[i+1:]):
+                    midpoint_j = edge_j.midpoint
+                    area = GeometryOperators.get_triangle_area(midpoint_i, midpoint_j, vertex1_i)
+                    if area < tol ** 2:
+                        selected_edges.extend([edge_i, edge_j])
+                        break
         selected_edges = list(set(selected_edges))
 
         for edge in selected_edges:
@@ -2209,104 +2969,21 @@ class Primitives(object):
         list
             List of edge IDs.
         """
-        tol2 = tol**2
         port_sheet = self._modeler.convert_to_selections(sheet, return_list=True)
         if len(port_sheet) > 1:
             return []
         else:
             port_sheet = port_sheet[0]
         port_edges = self.get_object_edges(port_sheet)
+        port_face = self.get_object_faces(port_sheet)[0]
 
         # find the bodies to exclude
-        port_sheet_midpoint = self.get_face_center(self.get_object_faces(port_sheet)[0])
+        port_sheet_midpoint = self.get_face_center(port_face)
         point = self._modeler.Position(*port_sheet_midpoint)
         list_of_bodies = self.get_bodynames_from_position(point)
 
-        # select all edges
-        all_edges = []
-        solids = [s for s in self.solid_names if s not in list_of_bodies]
-        for solid in solids:
-            edges = self.get_object_edges(solid)
-            all_edges.extend(edges)
-        all_edges = list(set(all_edges))  # remove duplicates
-
-        # select edges coplanar to port edges (aligned to XY, YZ, or XZ plane)
-        ux = [1.0, 0.0, 0.0]
-        uy = [0.0, 1.0, 0.0]
-        uz = [0.0, 0.0, 1.0]
-        midpoints = {}
-        candidate_edges = []
-        for ei in port_edges:
-            vertices_i = self.get_edge_vertices(ei)
-            if len(vertices_i) == 1:  # maybe a circle
-                vertex1_i = self.get_vertex_position(vertices_i[0])
-                area_i = self.get_face_area(self.get_object_faces(port_sheet)[0])
-                if area_i is None or area_i < tol2:  # degenerated face
-                    continue
-                center_i = self.get_face_center(self.get_object_faces(port_sheet)[0])
-                if not center_i:  # non planar face
-                    continue
-                radius_i = GeometryOperators.points_distance(vertex1_i, center_i)
-                area_i_eval = 3.141592653589793*radius_i**2
-                if abs(area_i-area_i_eval) < tol2:  # it is a circle
-                    vertex2_i = center_i
-                    midpoints[ei] = center_i
-                else:  # not a circle
-                    continue
-            elif len(vertices_i) == 2:  # normal segment edge
-                vertex1_i = self.get_vertex_position(vertices_i[0])
-                vertex2_i = self.get_vertex_position(vertices_i[1])
-                midpoints[ei] = self.get_edge_midpoint(ei)
-            else:  # undetermined edge --> skip
-                continue
-            for ej in all_edges:
-                vertices_j = self.get_edge_vertices(ej)
-                if len(vertices_j) == 1:  # edge is an arc, not supported
-                    continue
-                elif len(vertices_j) == 2:  # normal segment edge
-                    vertex1_j = self.get_vertex_position(vertices_j[0])
-                    vertex2_j = self.get_vertex_position(vertices_j[1])
-                else:  # undetermined edge --> skip
-                    continue
-
-                if not allow_perpendicular and \
-                        abs(GeometryOperators._v_dot(GeometryOperators.v_points(vertex1_i, vertex2_i), GeometryOperators.v_points(vertex1_j, vertex2_j))) < tol:
-                    continue
-
-                normal1 = GeometryOperators.v_cross(GeometryOperators.v_points(vertex1_i, vertex2_i), GeometryOperators.v_points(vertex1_i, vertex1_j))
-                normal1_norm = GeometryOperators.v_norm(normal1)
-                if YZ_plane and abs(abs(GeometryOperators._v_dot(normal1, ux)) - normal1_norm) < tol:
-                    pass
-                elif XZ_plane and abs(abs(GeometryOperators._v_dot(normal1, uy)) - normal1_norm) < tol:
-                    pass
-                elif XY_plane and abs(abs(GeometryOperators._v_dot(normal1, uz)) - normal1_norm) < tol:
-                    pass
-                else:
-                    continue
-
-                vec1 = GeometryOperators.v_points(vertex1_i, vertex2_j)
-                if abs(GeometryOperators._v_dot(normal1, vec1)) < tol2:  # the 4th point is coplanar
-                    candidate_edges.append(ej)
-
-        minimum_distance = tol**-1
-        selected_edges = []
-        for ei in midpoints:
-            midpoint_i = midpoints[ei]
-            for ej in candidate_edges:
-                midpoint_j = self.get_edge_midpoint(ej)
-                d = GeometryOperators.points_distance(midpoint_i, midpoint_j)
-                if d < minimum_distance:
-                    minimum_distance = d
-                    selected_edges = [ei, ej]
-
-        if selected_edges:
-            new_edge1 = self.create_object_from_edge(selected_edges[0])
-            time.sleep(aedt_wait_time)
-            new_edge2 = self.create_object_from_edge(selected_edges[1])
-            return selected_edges
-        else:
-            return []
-        pass
+        return self._edges_for_circuit_port(port_edges, port_face, list_of_bodies, XY_plane, YZ_plane, XZ_plane,
+                                            allow_perpendicular, tol)
 
     @aedt_exception_handler
     def get_edges_for_circuit_port(self, face_id, XY_plane=True, YZ_plane=True, XZ_plane=True,
@@ -2346,8 +3023,6 @@ class Primitives(object):
             List of edge IDs.
 
         """
-        tol2 = tol**2
-
         port_edges = self.get_face_edges(face_id)
 
         # find the bodies to exclude
@@ -2355,6 +3030,19 @@ class Primitives(object):
         point = self._modeler.Position(port_sheet_midpoint)
         list_of_bodies = self.get_bodynames_from_position(point)
 
+        return self._edges_for_circuit_port(port_edges, face_id, list_of_bodies, XY_plane, YZ_plane, XZ_plane,
+                                            allow_perpendicular, tol)
+
+    def _edges_for_circuit_port(self, port_edges, face_id, list_of_bodies, XY_plane, YZ_plane, XZ_plane,
+                                allow_perpendicular, tol):
+        """Select and create the edges of a circuit port.
+
+        The vertex positions of the candidate edges are read once. With NumPy, the
+        perpendicular, plane, and coplanarity checks of each port edge are evaluated
+        against all candidate edges at once.
+        """
+        tol2 = tol**2
+
         # select all edges
         all_edges = []
         solids = [s for s in self.solid_names if s not in list_of_bodies]
@@ -2363,6 +3051,17 @@ class Primitives(object):
             all_edges.extend(edges)
         all_edges = list(set(all_edges))  # remove duplicates
 
+        # read the segment edges once, arcs are not supported
+        segment_edges = []
+        segment_positions = []
+        for ej in all_edges:
+            vertices_j = self.get_edge_vertices(ej)
+            if len(vertices_j) == 2:
+                segment_edges.append(ej)
+                segment_positions.append([self.get_vertex_position(v) for v in vertices_j])
+        if np is not None:
+            segment_positions = np.array(segment_positions, dtype=float).reshape(-1, 2, 3)
+
         # select edges coplanar to port edges (aligned to XY, YZ, or XZ plane)
         ux = [1.0, 0.0, 0.0]
         uy = [0.0, 1.0, 0.0]
@@ -2389,19 +3088,32 @@ class Primitives(object):
             elif len(vertices_i) == 2:  # normal segment edge
                 vertex1_i = self.get_vertex_position(vertices_i[0])
                 vertex2_i = self.get_vertex_position(vertices_i[1])
-                midpoints[ei] = self.get_edge_midpoint(ei)
+                midpoints[ei] = GeometryOperators.get_mid_point(vertex1_i, vertex2_i)
             else:  # undetermined edge --> skip
                 continue
-            for ej in all_edges:
-                vertices_j = self.get_edge_vertices(ej)
-                if len(vertices_j) == 1:  # edge is an arc, not supported
-                    continue
-                elif len(vertices_j) == 2:  # normal segment edge
-                    vertex1_j = self.get_vertex_position(vertices_j[0])
-                    vertex2_j = self.get_vertex_position(vertices_j[1])
-                else:  # undetermined edge --> skip
-                    continue
 
+            if np is not None:
+                with np.errstate(invalid="ignore"):
+                    vertex1_i = np.array(vertex1_i, dtype=float)
+                    vector_i = np.array(vertex2_i, dtype=float) - vertex1_i
+                    vertex1_j = segment_positions[:, 0]
+                    vertex2_j = segment_positions[:, 1]
+                    mask = np.ones(len(segment_edges), dtype=bool)
+                    if not allow_perpendicular:
+                        mask &= ~(np.abs(GeometryOperators.v_dot_array(vector_i, vertex2_j - vertex1_j)) < tol)
+                    normal1 = GeometryOperators.v_cross_array(vector_i, vertex1_j - vertex1_i)
+                    normal1_norm = GeometryOperators.v_norm_array(normal1)
+                    on_plane = np.zeros(len(segment_edges), dtype=bool)
+                    for enabled, axis in ((YZ_plane, 0), (XZ_plane, 1), (XY_plane, 2)):
+                        if enabled:
+                            on_plane |= np.abs(np.abs(normal1[:, axis]) - normal1_norm) < tol
+                    mask &= on_plane
+                    vec1 = vertex2_j - vertex1_i
+                    mask &= np.abs(GeometryOperators.v_dot_array(normal1, vec1)) < tol2  # the 4th point is coplanar
+                candidate_edges.extend([segment_edges[j] for j in np.flatnonzero(mask)])
+                continue
+
+            for ej, (vertex1_j, vertex2_j) in zip(segment_edges, segment_positions):
                 if not allow_perpendicular and \
                         abs(GeometryOperators._v_dot(GeometryOperators.v_points(vertex1_i, vertex2_i), GeometryOperators.v_points(vertex1_j, vertex2_j))) < tol:
                     continue
@@ -2423,14 +3135,27 @@ class Primitives(object):
 
         minimum_distance = tol**-1
         selected_edges = []
-        for ei in midpoints:
-            midpoint_i = midpoints[ei]
-            for ej in candidate_edges:
-                midpoint_j = self.get_edge_midpoint(ej)
-                d = GeometryOperators.points_distance(midpoint_i, midpoint_j)
-                if d < minimum_distance:
-                    minimum_distance = d
-                    selected_edges = [ei, ej]
+        if np is not None and candidate_edges:
+            index = dict((ej, j) for j, ej in enumerate(segment_edges))
+            candidates = segment_positions[[index[ej] for ej in candidate_edges]]
+            candidate_midpoints = (candidates[:, 0] + candidates[:, 1]) / 2.
+            for ei in midpoints:
+                distances = GeometryOperators.v_norm_array(candidate_midpoints - np.array(midpoints[ei], dtype=float))
+                j = int(np.argmin(distances))
+                if distances[j] < minimum_distance:
+                    minimum_distance = distances[j]
+                    selected_edges = [ei, candidate_edges[j]]
+        else:
+            segment_midpoints = dict((ej, GeometryOperators.get_mid_point(*positions))
+                                     for ej, positions in zip(segment_edges, segment_positions))
+            for ei in midpoints:
+                midpoint_i = midpoints[ei]
+                for ej in candidate_edges:
+                    midpoint_j = segment_midpoints[ej]
+                    d = GeometryOperators.points_distance(midpoint_i, midpoint_j)
+                    if d < minimum_distance:
+                        minimum_distance = d
+                        selected_edges = [ei, ej]
 
         if selected_edges:
             new_edge1 = self.create_object_from_edge(selected_edges[0])
@@ -2439,7 +3164,6 @@ class Primitives(object):
             return selected_edges
         else:
             return []
-        pass
 
     @aedt_exception_handler
     def get_closest_edgeid_to_position(self, position, units=None):
@@ -2540,45 +3264,62 @@ class Primitives(object):
         else:
             return defaultmatname, True
 
-    def _refresh_solids(self):
-        test = retry_ntimes(10, self.oeditor.GetObjectsInGroup, "Solids")
+    def _get_objects_in_group(self, group):
+        """Retrieve the names of the objects in a group.
+
+        The list read from AEDT is reused until ``register_change`` is called.
+
+        Parameters
+        ----------
+        group : str
+            Name of the group. For example, ``"Solids"``.
+
+        Returns
+        -------
+        list
+            List of object names, ``None`` when failed.
+        """
+        cached = self._object_groups.get(group)
+        if cached and cached[0] == self._change_count:
+            return cached[1]
+        test = retry_ntimes(10, self.oeditor.GetObjectsInGroup, group)
         if test is None or test is False:
-            assert False, "Get Solids is failing"
+            return None
         elif test is True:
-            self._solids = []    # In IronPython True is returned when no sheets are present
+            names = []    # In IronPython True is returned when no objects are present
         else:
-            self._solids = list(test)
+            names = list(test)
+        self._object_groups[group] = (self._change_count, names)
+        return names
+
+    def _refresh_solids(self):
+        test = self._get_objects_in_group("Solids")
+        if test is None:
+            assert False, "Get Solids is failing"
+        self._solids = test
         self._all_object_names = self._solids + self._sheets + self._lines
 
     def _refresh_sheets(self):
-        test = retry_ntimes(10, self.oeditor.GetObjectsInGroup, "Sheets")
-        if test is None or test is False:
+        test = self._get_objects_in_group("Sheets")
+        if test is None:
             assert False, "Get Sheets is failing"
-        elif test is True:
-            self._sheets = []    # In IronPython True is returned when no sheets are present
-        else:
-            self._sheets = list(test)
+        self._sheets = test
         self._all_object_names = self._solids + self._sheets + self._lines
 
     def _refresh_lines(self):
-        test = retry_ntimes(10, self.oeditor.GetObjectsInGroup, "Lines")
-        if test is None or test is False:
+        test = self._get_objects_in_group("Lines")
+        if test is None:
             assert False, "Get Lines is failing"
-        elif test is True:
-            self._lines = []    # In IronPython True is returned when no lines are present
-        else:
-            self._lines = list(test)
+        self._lines = test
         self._all_object_names = self._solids + self._sheets + self._lines
 
     def _refresh_unclassified(self):
-        test = retry_ntimes(10, self.oeditor.GetObjectsInGroup, "Unclassified")
-        if test is None or test is False:
+        test = self._get_objects_in_group("Unclassified")
+        if test is None:
             self._unclassified = []
             self._messenger.logger.debug("Unclassified is failing")
-        elif test is True:
-            self._unclassified = []     # In IronPython True is returned when no unclassified are present
         else:
-            self._unclassified = list(test)
+            self._unclassified = test
 
     def _refresh_object_types(self):
         self._refresh_solids()
@@ -2587,10 +3328,17 @@ class Primitives(object):
         self._all_object_names = self._solids + self._sheets + self._lines
 
     def _create_object(self, name):
-        o = Object3d(self, name)
+        return self._register_object(Object3d(self, name))
+
+    def _register_object(self, o):
+        if self._batch_depth:
+            self._batch_objects.append(o)
+            return o
+        self.register_change()
         new_id = o.id
         self.objects[new_id] = o
         self.object_id_dict[o.name] = new_id
+        self._index_object(o.name)
         return o
 
     def _refresh_all_ids_from_aedt_file(self):
@@ -2609,15 +3357,20 @@ class Primitives(object):
                 'GeometryPart']
         except KeyError:
             return 0
+        units = self._parent.design_properties['ModelSetup']['GeometryCore'].get('Units')
         for el in self._parent.design_properties['ModelSetup']['GeometryCore']['GeometryOperations']['ToplevelParts']['GeometryPart']:
             if isinstance(el, OrderedDict):
-                attribs = el['Attributes']
+                part = el
             else:
-                attribs = \
+                part = \
                     self._parent.design_properties['ModelSetup']['GeometryCore']['GeometryOperations']['ToplevelParts'][
-                        'GeometryPart']['Attributes']
+                        'GeometryPart']
+            attribs = part['Attributes']
 
             o = self._create_object(name=attribs['Name'])
+            box = _parsed_sphere_bounding_box(part, units)
+            if box:
+                o._geometry_cache[("bounding_box",)] = box
 
             o.part_coordinate_system = attribs['PartCoordinateSystem']
             if "NonModel" in attribs['Flags']:
@@ -2642,6 +3395,8 @@ class Primitives(object):
                 o._material_name = attribs['MaterialValue'][1:-1]
             else:
                 o._material_name = attribs.get('MaterialName', None)
+            if o._material_name is not None:
+                self._index_material(o.name, o._material_name)
 
             o._is_updated = True
         return len(self.objects)
@@ -2746,37 +3501,173 @@ class Primitives(object):
 
         return szList
 
-    def _find_object_from_edge_id(self, lval):
-        objList = []
-        objListSheets = self.sheet_names
-        if len(objListSheets) > 0:
-            objList.extend(objListSheets)
-        objListSolids = self.solid_names
-        if len(objListSolids) > 0:
-            objList.extend(objListSolids)
-        for obj in objList:
-            edgeIDs = list(self.oeditor.GetEdgeIDsFromObject(obj))
-            if str(lval) in edgeIDs:
-                return obj
+    def _index_object(self, name):
+        self._new_names.append(name)
+        self._spatial_index_dirty.add(name)
+        for kind in self._topology_entries:
+            if name not in self._topology_entries[kind]:
+                self._topology_entries[kind][name] = (None, [])
+        if name not in self._object_materials:
+            self._unknown_materials.add(name)
+
+    def _is_name_indexed(self, name):
+        position = bisect_left(self._name_index, name)
+        return self._name_index[position:position + 1] == [name]
+
+    def _update_name_index(self):
+        if not self._new_names:
+            return
+        names = [i for i in set(self._new_names) if i in self.object_id_dict and not self._is_name_indexed(i)]
+        self._new_names = []
+        if len(names) > 64:
+            self._name_index = sorted(self._name_index + names)
+            self._name_index_lower = sorted([(i.lower(), i) for i in self._name_index])
+        else:
+            for name in names:
+                insort(self._name_index, name)
+                insort(self._name_index_lower, (name.lower(), name))
+
+    def _unindex_object(self, name):
+        self._update_name_index()
+        self._spatial_index_dirty.add(name)
+        position = bisect_left(self._name_index, name)
+        if self._name_index[position:position + 1] == [name]:
+            del self._name_index[position]
+            del self._name_index_lower[bisect_left(self._name_index_lower, (name.lower(), name))]
+        for kind in self._topology_entries:
+            self._remove_topology(kind, name)
+        self._unknown_materials.discard(name)
+        material = self._object_materials.pop(name, None)
+        if material is not None:
+            self._material_index[material].discard(name)
+
+    def _index_material(self, name, material):
+        old_material = self._object_materials.get(name)
+        if old_material is not None:
+            self._material_index[old_material].discard(name)
+        material = (material or "").strip('"').lower()
+        self._unknown_materials.discard(name)
+        self._object_materials[name] = material
+        self._material_index.setdefault(material, set()).add(name)
+
+    def _rename_object_index(self, name, new_name):
+        if name == new_name or name not in self.object_id_dict:
+            return
+        material = self._object_materials.get(name)
+        self._unindex_object(name)
+        self.object_id_dict[new_name] = self.object_id_dict.pop(name)
+        self._index_object(new_name)
+        if material is not None:
+            self._index_material(new_name, material)
+
+    def _remove_topology(self, kind, name):
+        """Remove an object from the index of face, edge, or vertex IDs.
+
+        Parameters
+        ----------
+        kind : str
+            ``"Face"``, ``"Edge"`` or ``"Vertex"``.
+        name : str
+            Name of the object.
+        """
+        entry = self._topology_entries[kind].pop(name, None)
+        if entry:
+            ids = self._topology_ids[kind]
+            for i in entry[1]:
+                if ids.get(i) == name:
+                    del ids[i]
+
+    def _topology_version(self, name):
+        obj_id = self.object_id_dict.get(name)
+        obj = self.objects.get(obj_id) if obj_id is not None else None
+        if obj is None:
+            return None
+        return obj._geometry_version
+
+    def _is_topology_current(self, kind, name):
+        entry = self._topology_entries[kind].get(name)
+        return bool(entry) and entry[0] is not None and entry[0] == self._topology_version(name)
+
+    def _index_topology(self, kind, name):
+        """Read the face, edge, or vertex IDs of an object from AEDT and index them.
+
+        The entry is stamped with the geometry version of the object, so it stays valid until
+        the geometry of the object is invalidated.
+
+        Parameters
+        ----------
+        kind : str
+            ``"Face"``, ``"Edge"`` or ``"Vertex"``.
+        name : str
+            Name of the object.
 
+        Returns
+        -------
+        list
+            List of IDs of the object.
+        """
+        self._remove_topology(kind, name)
+        try:
+            if kind == "Face":
+                ids = [int(i) for i in self.oeditor.GetFaceIDs(name)]
+            elif kind == "Edge":
+                ids = [int(i) for i in self.oeditor.GetEdgeIDsFromObject(name)]
+            else:
+                ids = [int(i) for i in self.oeditor.GetVertexIDsFromObject(name)]
+        except:
+            ids = []
+        topology_ids = self._topology_ids[kind]
+        for i in ids:
+            topology_ids[i] = name
+        self._topology_entries[kind][name] = (self._topology_version(name), ids)
+        return ids
+
+    def _find_object_from_topology_id(self, kind, lval):
+        """Find the object owning a face, edge, or vertex ID.
+
+        The owners are kept in an index. Objects are added to the index when they are registered
+        and removed when they are deleted. Their IDs are read from AEDT on the first lookup and read
+        again only after the geometry of the object is invalidated. An indexed ID whose object
+        has changed since is checked again with a single call to AEDT.
+
+        Parameters
+        ----------
+        kind : str
+            ``"Face"``, ``"Edge"`` or ``"Vertex"``.
+        lval : int or str
+            ID of the face, edge, or vertex.
+
+        Returns
+        -------
+        str
+            Name of the object, ``None`` if not found.
+        """
+        lval = int(lval)
+        name = self._topology_ids[kind].get(lval)
+        if name:
+            if self._is_topology_current(kind, name) or lval in self._index_topology(kind, name):
+                return name
+        object_names = self.sheet_names + self.solid_names
+        if kind != "Face":
+            object_names += self.line_names
+        for name in object_names:
+            if self._is_topology_current(kind, name):
+                continue
+            if lval in self._index_topology(kind, name):
+                return name
         return None
 
+    def _find_object_from_edge_id(self, lval):
+        return self._find_object_from_topology_id("Edge", lval)
+
     def _find_object_from_face_id(self, lval):
         if self.oeditor is not None:
-            objList = []
-            objListSheets = self.sheet_names
-            if len(objListSheets) > 0:
-                objList.extend(objListSheets)
-            objListSolids = self.solid_names
-            if len(objListSolids) > 0:
-                objList.extend(objListSolids)
-            for obj in objList:
-                face_ids = list(self.oeditor.GetFaceIDs(obj))
-                if str(lval) in face_ids:
-                    return obj
-
+            return self._find_object_from_topology_id("Face", lval)
         return None
 
+    def _find_object_from_vertex_id(self, lval):
+        return self._find_object_from_topology_id("Vertex", lval)
+
     def __getitem__(self, partId):
         """Return the object ``Object3D`` for a given object ID or object name.
 
@@ -765,6 +765,7 @@ class Primitives3D(Primitives, object):
         vArg1.append("ComponentFile:=")
         vArg1.append(compFile)
         new_object_name = self.oeditor.Insert3DComponent(vArg1)
+        self.register_change()
         #TODO return an object
         return new_object_name
 
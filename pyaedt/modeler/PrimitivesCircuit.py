@@ -76,10 +76,9 @@ class CircuitComponents(object):
         """
         if type(partname) is int:
             return self.components[partname]
-        for el in self.components:
-            if self.components[el].name == partname or self.components[el].composed_name == partname or el == partname:
-                return self.components[el]
-
+        id = self.get_obj_id(partname)
+        if id is not None:
+            return self.components[id]
         return None
 
     def __init__(self, parent, modeler):
@@ -87,6 +86,8 @@ class CircuitComponents(object):
         self.modeler = modeler
         self._currentId = 0
         self.components = defaultdict(CircuitComponent)
+        self._component_ids = {}
+        self._component_names = {}
         pass
 
     @aedt_exception_handler
@@ -158,14 +159,11 @@ class CircuitComponents(object):
         id = self.create_unique_id()
         arg1 = ["NAME:IPortProps", "Name:=", name, "Id:=", id]
         arg2 = ["NAME:Attributes", "Page:=", 1, "X:=", posx, "Y:=", posy, "Angle:=", angle, "Flip:=", False]
-        id = self.oeditor.CreateIPort(arg1, arg2)
+        composed_name = self.oeditor.CreateIPort(arg1, arg2)
 
-        id = int(id.split(";")[1])
-        self.add_id_to_component(id)
-        # return id, self.components[id].composed_name
-        for el in self.components:
-            if name in self.components[el].composed_name:
-                return el, self.components[el].composed_name
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
+        return id, self.components[id].composed_name
 
     @aedt_exception_handler
     def create_page_port(self, name, posx=0.1, posy=0.1, angle=0):
@@ -191,7 +189,7 @@ class CircuitComponents(object):
 
         """
         id = self.create_unique_id()
-        id = self.oeditor.CreatePagePort(
+        composed_name = self.oeditor.CreatePagePort(
             [
                 "NAME:PagePortProps",
                 "Name:=", name,
@@ -205,9 +203,8 @@ class CircuitComponents(object):
                 "Angle:=", angle,
                 "Flip:=", False
             ])
-        id = int(id.split(";")[1])
-        # self.refresh_all_ids()
-        self.add_id_to_component(id)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         return id, self.components[id].composed_name
 
     @aedt_exception_handler
@@ -245,11 +242,8 @@ class CircuitComponents(object):
                 "Flip:=", False
             ])
         id = int(name.split(";")[1])
-        self.add_id_to_component(id)
-        # return id, self.components[id].composed_name
-        for el in self.components:
-            if name in self.components[el].composed_name:
-                return el, self.components[el].composed_name
+        self.add_id_to_component(id, name)
+        return id, self.components[id].composed_name
 
     @aedt_exception_handler
     def create_model_from_touchstone(self, touchstone_full_path, model_name=None):
@@ -332,11 +326,11 @@ class CircuitComponents(object):
 
         """
         id = self.create_unique_id()
-        id = self.oeditor.CreateComponent(["NAME:ComponentProps", "Name:=", modelname, "Id:=", str(id)],
-                                ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=",
-                                 False])
-        id = int(id.split(";")[1])
-        self.add_id_to_component(id)
+        composed_name = self.oeditor.CreateComponent(
+            ["NAME:ComponentProps", "Name:=", modelname, "Id:=", str(id)],
+            ["NAME:Attributes", "Page:=", 1, "X:=", xpos, "Y:=", ypos, "Angle:=", angle, "Flip:=", False])
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         return id, self.components[id].composed_name
 
 
@@ -379,7 +373,7 @@ class CircuitComponents(object):
             name = self.design_libray + "\\" + component_library + ":" + component_name
         else:
             name = component_name
-        id = self.oeditor.CreateComponent(
+        composed_name = self.oeditor.CreateComponent(
             [
                 "NAME:ComponentProps",
                 "Name:=", name,
@@ -393,9 +387,8 @@ class CircuitComponents(object):
                 "Angle:=", angle,
                 "Flip:=", False
             ])
-        id = int(id.split(";")[1])
-        # self.refresh_all_ids()
-        self.add_id_to_component(id)
+        id = int(composed_name.split(";")[1])
+        self.add_id_to_component(id, composed_name)
         if inst_name:
             self.components[id].set_property("InstanceName", inst_name)
         if use_instance_id_netlist:
@@ -642,28 +635,29 @@ class CircuitComponents(object):
 
     @aedt_exception_handler
     def refresh_all_ids(self):
-        """Refresh all IDs and return the number of components."""
+        """Refresh all IDs and return the number of components.
+
+        Only the components that are not registered yet are added. Their properties are read
+        from AEDT when they are first accessed.
+        """
         obj = self.oeditor.GetAllComponents()
         for el in obj:
-            if not self.get_obj_id(el):
-                name = el.split(";")
-                o = CircuitComponent(self.oeditor, tabname=self.tab_name)
-                o.name = name[0]
-                o.id = int(name[1])
-                o.schematic_id = name[2]
-                o_update = self.update_object_properties(o)
-                objID = o.id
-                self.components[objID] = o_update
+            if el not in self._component_ids:
+                self._register_component(el)
         return len(self.components)
 
     @aedt_exception_handler
-    def add_id_to_component(self, id):
+    def add_id_to_component(self, id, composed_name=None):
         """Add an ID to a component.
 
         Parameters
         ----------
         id : int
             ID to assign the component.
+        composed_name : str, optional
+            Composed name of the component, in the format ``"name;id;schematic_id"``, as returned
+            by the ``Create`` methods of the editor. The default is ``None``, in which case the
+            component is searched for in all the elements of the editor.
 
         Returns
         -------
@@ -671,24 +665,39 @@ class CircuitComponents(object):
             Number of components.
 
         """
+        if composed_name:
+            self._register_component(composed_name)
+            return len(self.components)
         obj = retry_ntimes(10, self.oeditor.GetAllElements)
         for el in obj:
             name = el.split(";")
             if len(name) > 1 and str(id) == name[1]:
-                o = CircuitComponent(self.oeditor, tabname=self.tab_name)
-                o.name = name[0]
-                if len(name) > 2:
-                    o.id = int(name[1])
-                    o.schematic_id = int(name[2])
-                    objID = o.id
-                else:
-                    o.schematic_id = int(name[1])
-                    objID = o.schematic_id
-                o_update = self.update_object_properties(o)
-
-                self.components[objID] = o_update
+                self._register_component(el)
         return len(self.components)
 
+    def _register_component(self, composed_name):
+        name = composed_name.split(";")
+        if len(name) < 2:
+            return None
+        o = CircuitComponent(self.oeditor, tabname=self.tab_name)
+        o.name = name[0]
+        if len(name) > 2:
+            o.id = int(name[1])
+            o.schematic_id = int(name[2])
+            objID = o.id
+        else:
+            o.schematic_id = int(name[1])
+            objID = o.schematic_id
+        if objID in self.components:
+            self._component_ids.pop(self.components[objID].composed_name, None)
+            if self._component_names.get(self.components[objID].name) == objID:
+                del self._component_names[self.components[objID].name]
+        self.components[objID] = self.update_object_properties(o)
+        self._component_ids[composed_name] = objID
+        self._component_ids[o.composed_name] = objID
+        self._component_names.setdefault(o.name, objID)
+        return objID
+
     @aedt_exception_handler
     def get_obj_id(self, objname):
         """Retrieve the ID of an object.
@@ -696,22 +705,24 @@ class CircuitComponents(object):
         Parameters
         ----------
         objname : str
-            Name of the object.
+            Name or composed name of the object.
 
         Returns
         -------
-        bool
-            ``True`` when successful, ``False`` when failed.
+        int
+            ID of the object, or ``None`` when the object is not found.
         """
-        for el in self.components:
-            if self.components[el].name == objname:
-                return el
-        return None
+        if objname in self._component_names:
+            return self._component_names[objname]
+        return self._component_ids.get(objname)
 
     @aedt_exception_handler
     def update_object_properties(self, o):
         """Update the properties of an object.
 
+        The names of the properties are read with a single call the first time that a property
+        is accessed, and each value is read when it is first accessed.
+
         Parameters
         ----------
         o :
@@ -723,11 +734,7 @@ class CircuitComponents(object):
             Object with properties.
 
         """
-        name = o.composed_name
-        proparray = retry_ntimes(10, self.oeditor.GetProperties, "PassedParameterTab", name)
-        for j in proparray:
-            propval = retry_ntimes(10, self.oeditor.GetPropertyValue, "PassedParameterTab", name, j)
-            o._add_property(j, propval)
+        o._set_lazy_properties("PassedParameterTab")
         return o
 
     @aedt_exception_handler
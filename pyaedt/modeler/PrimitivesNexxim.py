@@ -15,27 +15,6 @@ class NexximComponents(CircuitComponents):
     def tab_name(self):
         return "PassedParameterTab"
 
-    @aedt_exception_handler
-    def __getitem__(self, partname):
-        """Get the object ID if partname is an integer or object name if a string.
-        Parameters
-        ----------
-        partname: int or str
-            Part ID or object name. 
-        
-        Returns
-        -------
-        type
-            Part object details.
-        """
-        if type(partname) is int:
-            return self.components[partname]
-        for el in self.components:
-            if self.components[el].name == partname or self.components[el].composed_name == partname or el == partname:
-                return self.components[el]
-
-        return None
-
     def __init__(self, parent, modeler):
         CircuitComponents.__init__(self, parent, modeler)
         self._parent = parent
@@ -673,27 +652,6 @@ class NexximComponents(CircuitComponents):
         self.o_component_manager.Add(arg)
         return True
 
-    @aedt_exception_handler
-    def update_object_properties(self, o):
-        """Update the object's properties.
-
-        Parameters
-        ----------
-        o :
-            Object to update.
-
-        Returns
-        -------
-        type
-            Object with properties.
-        """
-        name = o.composed_name
-        proparray = self.oeditor.GetProperties("PassedParameterTab", name)
-        for j in proparray:
-            propval = retry_ntimes(10, self.oeditor.GetPropertyValue,"PassedParameterTab", name, j)
-            o._add_property(j, propval)
-        return o
-
     @aedt_exception_handler
     def get_comp_custom_settings(self, toolNum ,dc = 0, interp=0, extrap=1, conv=0, passivity=0, reciprocal="False", opt="", data_type=1):
         """
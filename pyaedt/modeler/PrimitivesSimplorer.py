@@ -27,29 +27,6 @@ class SimplorerComponents(CircuitComponents):
         """Tab name."""
         return "Quantities"
 
-    @aedt_exception_handler
-    def __getitem__(self, partname):
-        """Get object id from a string or integer.
-        
-        Parameters
-        ----------
-        partname : int or str
-            ID or name of the object.
-        
-        Returns
-        -------
-        type
-            Part object details.
-        
-        """
-        if type(partname) is int:
-            return self.components[partname]
-        for el in self.components:
-            if self.components[el].name == partname or self.components[el].composed_name == partname or el == partname:
-                return self.components[el]
-
-        return None
-
     def __init__(self, parent, modeler):
         CircuitComponents.__init__(self, parent, modeler)
         self._parent = parent
@@ -0,0 +1,322 @@
+"""
+This module contains the ``BoundingVolumeHierarchy`` class.
+
+The hierarchy indexes axis-aligned bounding boxes in the format returned by
+``get_model_bounding_box``, ``[xmin, ymin, zmin, xmax, ymax, zmax]``, and answers
+point, box overlap, and nearest box queries without calls to AEDT.
+"""
+from __future__ import absolute_import
+import heapq
+
+
+def _union(a, b):
+    return [min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]),
+            max(a[3], b[3]), max(a[4], b[4]), max(a[5], b[5])]
+
+
+def _area(box):
+    dx = box[3] - box[0]
+    dy = box[4] - box[1]
+    dz = box[5] - box[2]
+    return dx * dy + dy * dz + dz * dx
+
+
+def _contains(box, point, tol):
+    return (box[0] - tol <= point[0] <= box[3] + tol and box[1] - tol <= point[1] <= box[4] + tol and
+            box[2] - tol <= point[2] <= box[5] + tol)
+
+
+def _overlaps(a, b, tol):
+    return (a[0] - tol <= b[3] and b[0] - tol <= a[3] and a[1] - tol <= b[4] and b[1] - tol <= a[4] and
+            a[2] - tol <= b[5] and b[2] - tol <= a[5])
+
+
+def _distance(box, point):
+    d = 0.
+    for i in range(3):
+        if point[i] < box[i]:
+            d += (box[i] - point[i]) ** 2
+        elif point[i] > box[i + 3]:
+            d += (point[i] - box[i + 3]) ** 2
+    return d ** 0.5
+
+
+class _Node(object):
+    __slots__ = ("box", "key", "left", "right", "parent")
+
+    def __init__(self, box, key=None, left=None, right=None):
+        self.box = box
+        self.key = key
+        self.left = left
+        self.right = right
+        self.parent = None
+
+    @property
+    def is_leaf(self):
+        return self.left is None
+
+
+class BoundingVolumeHierarchy(object):
+    """Bounding volume hierarchy over axis-aligned boxes.
+
+    The hierarchy is a binary tree of boxes. It is built top down by median splits along the
+    longest axis and is kept up to date with :func:`insert` and :func:`remove`, which only
+    refit the boxes on the path to the root.
+
+    Parameters
+    ----------
+    boxes : dict, optional
+        Dictionary with the keys to index and their boxes in the format
+        ``[xmin, ymin, zmin, xmax, ymax, zmax]``. The default is ``None``.
+
+    Examples
+    --------
+    >>> from pyaedt.modeler.SpatialIndex import BoundingVolumeHierarchy
+    >>> bvh = BoundingVolumeHierarchy({"Box1": [0, 0, 0, 1, 1, 1], "Box2": [2, 0, 0, 3, 1, 1]})
+    >>> bvh.query_point([0.5, 0.5, 0.5])
+    ['Box1']
+    >>> bvh.nearest([1.8, 0.5, 0.5])
+    ['Box2']
+
+    """
+
+    def __init__(self, boxes=None):
+        self._root = None
+        self._leaves = {}
+        if boxes:
+            self.build(boxes)
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __contains__(self, key):
+        return key in self._leaves
+
+    def keys(self):
+        """List of the indexed keys."""
+        return list(self._leaves.keys())
+
+    def box(self, key):
+        """Retrieve the box of a key.
+
+        Parameters
+        ----------
+        key :
+            Indexed key.
+
+        Returns
+        -------
+        list
+            List of six values ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+        """
+        return list(self._leaves[key].box)
+
+    @property
+    def bounding_box(self):
+        """Box containing all the indexed boxes, or ``None`` when the hierarchy is empty."""
+        if self._root is None:
+            return None
+        return list(self._root.box)
+
+    def build(self, boxes):
+        """Rebuild the hierarchy from a dictionary of boxes.
+
+        Parameters
+        ----------
+        boxes : dict
+            Dictionary with the keys to index and their boxes.
+        """
+        self._leaves = {}
+        leaves = []
+        for key, box in boxes.items():
+            leaf = _Node([float(i) for i in box], key)
+            self._leaves[key] = leaf
+            leaves.append(leaf)
+        self._root = self._build(leaves) if leaves else None
+
+    def _build(self, leaves):
+        if len(leaves) == 1:
+            return leaves[0]
+        box = leaves[0].box
+        for leaf in leaves[1:]:
+            box = _union(box, leaf.box)
+        extents = [box[i + 3] - box[i] for i in range(3)]
+        axis = extents.index(max(extents))
+        leaves.sort(key=lambda leaf: leaf.box[axis] + leaf.box[axis + 3])
+        half = len(leaves) // 2
+        node = _Node(box, left=self._build(leaves[:half]), right=self._build(leaves[half:]))
+        node.left.parent = node
+        node.right.parent = node
+        return node
+
+    def insert(self, key, box):
+        """Add a box to the hierarchy or replace the box of an indexed key.
+
+        The new leaf is paired with the sibling that least increases the surface area
+        of the boxes on the way down.
+
+        Parameters
+        ----------
+        key :
+            Key to index.
+        box : list
+            List of six values ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+        """
+        if key in self._leaves:
+            self.remove(key)
+        leaf = _Node([float(i) for i in box], key)
+        self._leaves[key] = leaf
+        if self._root is None:
+            self._root = leaf
+            return
+        sibling = self._root
+        while not sibling.is_leaf:
+            union_area = _area(_union(sibling.box, leaf.box))
+            cost = 2. * union_area
+            inheritance = 2. * (union_area - _area(sibling.box))
+            costs = []
+            for child in (sibling.left, sibling.right):
+                child_cost = _area(_union(child.box, leaf.box)) + inheritance
+                if not child.is_leaf:
+                    child_cost -= _area(child.box)
+                costs.append(child_cost)
+            if cost < min(costs):
+                break
+            sibling = sibling.left if costs[0] <= costs[1] else sibling.right
+        parent = sibling.parent
+        node = _Node(_union(sibling.box, leaf.box), left=sibling, right=leaf)
+        node.parent = parent
+        sibling.parent = node
+        leaf.parent = node
+        if parent is None:
+            self._root = node
+        else:
+            if parent.left is sibling:
+                parent.left = node
+            else:
+                parent.right = node
+            self._refit(parent)
+
+    def remove(self, key):
+        """Remove a key from the hierarchy.
+
+        Parameters
+        ----------
+        key :
+            Indexed key.
+
+        Returns
+        -------
+        bool
+            ``True`` when the key was indexed, ``False`` otherwise.
+        """
+        leaf = self._leaves.pop(key, None)
+        if leaf is None:
+            return False
+        parent = leaf.parent
+        if parent is None:
+            self._root = None
+            return True
+        sibling = parent.right if parent.left is leaf else parent.left
+        grandparent = parent.parent
+        sibling.parent = grandparent
+        if grandparent is None:
+            self._root = sibling
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+            self._refit(grandparent)
+        return True
+
+    def _refit(self, node):
+        while node is not None:
+            node.box = _union(node.left.box, node.right.box)
+            node = node.parent
+
+    def _search(self, accept):
+        found = []
+        if self._root is None:
+            return found
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not accept(node.box):
+                continue
+            if node.is_leaf:
+                found.append(node.key)
+            else:
+                stack.append(node.right)
+                stack.append(node.left)
+        return found
+
+    def query_point(self, point, tol=0.):
+        """Retrieve the keys whose boxes contain a point.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y, z]`` coordinates.
+        tol : float, optional
+            Distance by which the boxes are enlarged. The default is ``0.``.
+
+        Returns
+        -------
+        list
+            List of keys.
+        """
+        return self._search(lambda box: _contains(box, point, tol))
+
+    def query_box(self, box, tol=0.):
+        """Retrieve the keys whose boxes overlap a box.
+
+        Parameters
+        ----------
+        box : list
+            List of six values ``[xmin, ymin, zmin, xmax, ymax, zmax]``.
+        tol : float, optional
+            Distance by which the boxes are enlarged. The default is ``0.``.
+
+        Returns
+        -------
+        list
+            List of keys.
+        """
+        return self._search(lambda node_box: _overlaps(node_box, box, tol))
+
+    def nearest(self, point, count=1, accept=None):
+        """Retrieve the keys whose boxes are the closest to a point.
+
+        The distance of a point inside a box is zero.
+
+        Parameters
+        ----------
+        point : list
+            List of ``[x, y, z]`` coordinates.
+        count : int, optional
+            Number of keys to return. The default is ``1``.
+        accept : function, optional
+            Function called with each key, which returns ``False`` for the keys to skip.
+            The default is ``None``, in which case all keys are accepted.
+
+        Returns
+        -------
+        list
+            List of up to ``count`` keys sorted by increasing distance.
+        """
+        found = []
+        if self._root is None:
+            return found
+        order = 0
+        heap = [(_distance(self._root.box, point), order, self._root)]
+        while heap and len(found) < count:
+            distance, _, node = heapq.heappop(heap)
+            if node.is_leaf:
+                if accept is None or accept(node.key):
+                    found.append(node.key)
+                continue
+            for child in (node.left, node.right):
+                order += 1
+                heapq.heappush(heap, (_distance(child.box, point), order, child))
+        return found
@@ -13,12 +13,15 @@ import random
 import string
 import time
 import math
-import itertools
 from collections import OrderedDict
+try:
+    import numpy as np
+except ImportError:
+    np = None
 from ..modeler.Modeler import CoordinateSystem
-from ..generic.general_methods import aedt_exception_handler, generate_unique_name, retry_ntimes
+from ..generic.general_methods import aedt_exception_handler, generate_unique_name, retry_ntimes, LazySolutionDict
 from ..generic.filesystem import Scratch
-from ..application.Variables import AEDT_units
+from ..application.Variables import unit_registry
 
 report_type = {"DrivenModal": "Modal Solution Data", "DrivenTerminal": "Terminal Solution Data",
                "Eigenmode": "EigenMode Parameters",
@@ -117,16 +120,13 @@ class SolutionData(object):
                 self.units_sweeps[e] = self.nominal_variation.GetSweepUnits(e)
             except:
                 self.nominal_sweeps[e] = None
-        self.solutions_data_real = self._solution_data_real()
-        self.solutions_data_imag = self._solution_data_imag()
-        self.solutions_data_mag = {}
-        self.units_data = {}
-        for expr in self.expressions:
-            self.solutions_data_mag[expr] = {}
-            self.units_data[expr] = self.nominal_variation.GetDataUnits(expr)
-            for i in self.solutions_data_real[expr]:
-                self.solutions_data_mag[expr][i] = abs(
-                    complex(self.solutions_data_real[expr][i], self.solutions_data_imag[expr][i]))
+        # the data is fetched from AEDT only when an expression is read
+        self._data_variation = self.nominal_variation
+        expressions = self.expressions
+        self.units_data = LazySolutionDict(expressions, self._data_variation.GetDataUnits)
+        self.solutions_data_real = LazySolutionDict(expressions, self._solution_data_real)
+        self.solutions_data_imag = LazySolutionDict(expressions, self._solution_data_imag)
+        self.solutions_data_mag = LazySolutionDict(expressions, self._solution_data_mag)
 
     @aedt_exception_handler
     def update_sweeps(self):
@@ -156,47 +156,95 @@ class SolutionData(object):
         -------
 
         """
-        for el in AEDT_units:
-            keys_units = [i.lower() for i in list(AEDT_units[el].keys())]
-            if unit.lower() in keys_units:
-                return el
-        return None
+        return unit_registry.quantity(unit)
 
-    @aedt_exception_handler
-    def _solution_data_real(self):
+    @property
+    def data_shape(self):
+        """Shape of the arrays in ``solutions_data_real``, ``solutions_data_imag`` and ``solutions_data_mag``.
+
+        There is one axis for each sweep, in the same order as ``sweeps``.
+        """
+        return tuple([len(self.sweeps[el]) for el in self._sweeps_names])
+
+    def _to_columns(self, solution):
+        """Store the values of an expression in a contiguous column.
+
+        AEDT returns the values with the first sweep varying the fastest. With NumPy, the column is
+        returned as an array with one axis for each sweep. Otherwise, the flat list is returned.
+
+        Parameters
+        ----------
+        solution :
+            Values returned by AEDT.
+
+        Returns
+        -------
+        numpy.ndarray or list
+
+        """
+        if np is not None:
+            return np.array(solution, dtype=float).reshape(self.data_shape, order="F")
+        return list(solution)
+
+    def _solution_data_real(self, expression):
         """ """
-        sols_data = {}
-        for expression in self.expressions:
-            solution = list(self.nominal_variation.GetRealDataValues(expression,False))
-            values = []
-            for el in reversed(self._sweeps_names):
-                values.append(self.sweeps[el])
-            solution_Data = {}
-            i = 0
-            for t in itertools.product(*values):
-                solution_Data[t] = solution[i]
-                i += 1
-            sols_data[expression] = solution_Data
-        return sols_data
-
-    def _solution_data_imag(self):
+        return self._to_columns(self._data_variation.GetRealDataValues(expression, False))
+
+    def _solution_data_imag(self, expression):
         """ """
-        sols_data = {}
-        for expression in self.expressions:
-            try:
-                solution = list(self.nominal_variation.GetImagDataValues(expression,False))
-            except:
-                solution = [0 for i in range(len(self.solutions_data_real[expression]))]
-            values = []
-            for el in reversed(self._sweeps_names):
-                values.append(self.sweeps[el])
-            solution_Data = {}
-            i = 0
-            for t in itertools.product(*values):
-                solution_Data[t] = solution[i]
-                i += 1
-            sols_data[expression] = solution_Data
-        return sols_data
+        try:
+            return self._to_columns(self._data_variation.GetImagDataValues(expression, False))
+        except:
+            if np is not None:
+                return np.zeros_like(self.solutions_data_real[expression])
+            return [0 for i in range(len(self.solutions_data_real[expression]))]
+
+    def _solution_data_mag(self, expression):
+        """ """
+        real_part = self.solutions_data_real[expression]
+        imag_part = self.solutions_data_imag[expression]
+        if np is not None:
+            return np.hypot(real_part, imag_part)
+        return [abs(complex(i, j)) for i, j in zip(real_part, imag_part)]
+
+    def _primary_sweep_values(self, solutions, expression):
+        """Slice the values of an expression along the primary sweep at the nominal sweeps.
+
+        Parameters
+        ----------
+        solutions : dict
+            One of ``solutions_data_real``, ``solutions_data_imag`` and ``solutions_data_mag``.
+        expression : str
+            Name of the expression.
+
+        Returns
+        -------
+        list
+            Values of the expression, or zeros if the expression or a nominal sweep value is not found.
+
+        """
+        try:
+            values = solutions[expression]
+            index = []
+            for el in self._sweeps_names:
+                if el == self.primary_sweep:
+                    index.append(slice(None))
+                else:
+                    index.append(self.sweeps[el].index(self.nominal_sweeps[el]))
+            if np is not None:
+                return values[tuple(index)].tolist()
+            offset = 0
+            step = 1
+            stride = 1
+            for el, i in zip(self._sweeps_names, index):
+                if el == self.primary_sweep:
+                    step = stride
+                else:
+                    offset += i * stride
+                stride *= len(self.sweeps[el])
+            return values[offset:offset + step * len(self.sweeps[self.primary_sweep]):step]
+        except:
+            return [0 for i in self.sweeps[self.primary_sweep]]
 
     @aedt_exception_handler
     def to_degrees(self, input_list):
@@ -251,23 +299,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        temp = []
-        for it in self.nominal_sweeps:
-            temp.append(self.nominal_sweeps[it])
-        temp = list(reversed(temp))
-        try:
-            solution_Data = self.solutions_data_mag[expression]
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(solution_Data[tuple(temp)])
-        except:
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(0)
+        sol = self._primary_sweep_values(self.solutions_data_mag, expression)
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(sol, self._quantity(self.units_data[expression]), self.units_data[expression])
         return sol
@@ -278,8 +310,8 @@ class SolutionData(object):
 
         Parameters
         ----------
-        datalist : list
-           List of data to convert.
+        datalist : list or numpy.ndarray
+           List or array of data to convert.
         dataunits : 
            
         units :
@@ -287,13 +319,13 @@ class SolutionData(object):
 
         Returns
         -------
-        list
-           List of the converted data.
+        list or numpy.ndarray
+           List or array of the converted data.
 
         """
         sol = datalist
-        if dataunits in AEDT_units and units in AEDT_units[dataunits]:
-            sol = [i * AEDT_units[dataunits][units] for i in datalist]
+        if dataunits in unit_registry.units and units in unit_registry.units[dataunits]:
+            sol = unit_registry.rescale(datalist, units, dataunits)
         return sol
 
     @aedt_exception_handler
@@ -339,23 +371,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        temp = []
-        for it in self.nominal_sweeps:
-            temp.append(self.nominal_sweeps[it])
-        temp = list(reversed(temp))
-        try:
-            solution_Data = self.solutions_data_real[expression]
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(solution_Data[tuple(temp)])
-        except:
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(0)
+        sol = self._primary_sweep_values(self.solutions_data_real, expression)
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(sol, self._quantity(self.units_data[expression]), self.units_data[expression])
         return sol
@@ -380,23 +396,7 @@ class SolutionData(object):
         """
         if not expression:
             expression = self.expressions[0]
-        temp = []
-        for it in self.nominal_sweeps:
-            temp.append(self.nominal_sweeps[it])
-        temp = list(reversed(temp))
-        try:
-            solution_Data = self.solutions_data_imag[expression]
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(solution_Data[tuple(temp)])
-        except:
-            sol = []
-            position = list(reversed(self._sweeps_names)).index(self.primary_sweep)
-            for el in self.sweeps[self.primary_sweep]:
-                temp[position]=el
-                sol.append(0)
+        sol = self._primary_sweep_values(self.solutions_data_imag, expression)
         if convert_to_SI and self._quantity(self.units_data[expression]):
             sol = self._convert_list_to_SI(sol, self._quantity(self.units_data[expression]), self.units_data[expression])
         return sol